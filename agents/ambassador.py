@@ -8,11 +8,19 @@ The Ambassador Agent is the primary interface for students. It:
 """
 
 import os
+import re
+import time
 import asyncio
+import hashlib
+import inspect
 import logging
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Callable, Awaitable
-from dataclasses import dataclass
+import operator
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Callable, Awaitable, Tuple
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
 
 from agents.config import (
     AgentConfig,
@@ -42,25 +50,106 @@ except ImportError:
     Anthropic = None
     AsyncAnthropic = None
 
+# httpx ships with the Anthropic SDK; used to size the shared connection pool
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of specialist agents queried concurrently for one message
+MAX_CONCURRENT_DELEGATIONS = 4
+
+# Keyword-based delegation table, in priority order (in production, use NLU)
+DELEGATION_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    # Scholarship-related queries
+    "scholarship_scout": (
+        "find scholarship", "scholarship search", "match scholarship",
+        "find me scholarship", "scholarships for", "scholarship match",
+        "look for scholarship", "search scholarship",
+    ),
+    # Appeal/negotiation queries
+    "appeal_strategist": (
+        "appeal", "negotiate", "counter offer", "increase aid",
+        "more money", "better offer", "financial aid appeal",
+    ),
+    # Deadline queries
+    "deadline_sentinel": (
+        "deadline", "due date", "when is", "calendar",
+        "upcoming deadline", "dates for",
+    ),
+    # Document processing queries
+    "document_analyst": (
+        "upload document", "parse award", "read transcript",
+        "parse my award", "analyze document", "award letter",
+        "document analyst",
+    ),
+}
+
+
+def _compile_delegation_pattern(table: Dict[str, Tuple[str, ...]]) -> "re.Pattern":
+    """Compile all delegation keywords into a single case-insensitive scanner.
+
+    Each agent becomes a named group, so one pass over the message reports
+    every matching agent via ``match.lastgroup``.
+    """
+    groups = []
+    for agent_name, keywords in table.items():
+        alternatives = "|".join(
+            re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)
+        )
+        groups.append(f"(?P<{agent_name}>{alternatives})")
+    return re.compile("|".join(groups), re.IGNORECASE)
+
+
+_DELEGATION_PATTERN = _compile_delegation_pattern(DELEGATION_KEYWORDS)
+
+# Connection pool limits for the shared Anthropic client
+ANTHROPIC_MAX_CONNECTIONS = 100
+ANTHROPIC_MAX_KEEPALIVE = 50
 
-@dataclass
+# Proactive trigger conditions: "<feature> <op> <number>" or a bare feature flag
+_CONDITION_PATTERN = re.compile(
+    r"^\s*(\w+)\s*(?:(<=|>=|==|!=|<|>)\s*(-?\d+(?:\.\d+)?))?\s*$"
+)
+_CONDITION_OPS: Dict[str, Callable[[Any, Any], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Rough characters-per-token ratio for English text, used to budget the
+# context window without a round trip to the tokenizer
+CHARS_PER_TOKEN = 4
+
+# Model response cache sizing
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_TTL_SECONDS = 600
+
+# Episode writes are buffered per agent and flushed to Graphiti in one
+# bulk write once this many are queued or the interval elapses
+EPISODE_BATCH_SIZE = 8
+EPISODE_FLUSH_INTERVAL_SECONDS = 0.5
+
+
+@dataclass(slots=True)
 class Message:
     """A conversation message."""
     role: str  # "user", "assistant", "system"
     content: str
-    timestamp: datetime = None
+    timestamp: int = field(default_factory=time.time_ns)  # Epoch nanoseconds, UTC
     metadata: Dict[str, Any] = None
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
         if self.metadata is None:
             self.metadata = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     """Response from the ambassador agent."""
     content: str
@@ -75,6 +164,224 @@ class AgentResponse:
             self.tools_used = []
 
 
+@lru_cache(maxsize=1)
+def _shared_anthropic_client(api_key: str):
+    """Get the process-wide AsyncAnthropic client.
+
+    All agents and sub-agents share one client, and therefore one
+    connection pool, so delegated calls reuse open TLS connections.
+    """
+    http_client = None
+    if httpx is not None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=ANTHROPIC_MAX_CONNECTIONS,
+                max_keepalive_connections=ANTHROPIC_MAX_KEEPALIVE,
+            ),
+            timeout=60.0,
+        )
+    return AsyncAnthropic(
+        api_key=api_key,
+        max_retries=2,
+        timeout=60.0,
+        http_client=http_client,
+    )
+
+
+@dataclass(frozen=True)
+class CompiledTrigger:
+    """A proactive trigger with its condition parsed once for evaluation."""
+    trigger: ProactiveTrigger
+    feature: str
+    op: Optional[Callable[[Any, Any], bool]] = None
+    threshold: float = 0.0
+
+    def matches(self, features: Dict[str, Any]) -> bool:
+        """Check the condition against a student's feature values.
+
+        A missing feature never matches; a bare feature flag matches when
+        the feature value is truthy.
+        """
+        value = features.get(self.feature)
+        if value is None:
+            return False
+        if self.op is None:
+            return bool(value)
+        return self.op(value, self.threshold)
+
+
+def compile_triggers(triggers: List[ProactiveTrigger]) -> Tuple[CompiledTrigger, ...]:
+    """Parse trigger conditions once, ordered by priority.
+
+    Args:
+        triggers: Triggers from an AgentConfig
+
+    Returns:
+        Compiled triggers sorted by priority (lower number = higher priority)
+    """
+    compiled = []
+    for trigger in triggers:
+        match = _CONDITION_PATTERN.match(trigger.condition)
+        if not match:
+            logger.warning(f"Unsupported trigger condition: {trigger.condition}")
+            continue
+
+        feature, op, threshold = match.groups()
+        compiled.append(CompiledTrigger(
+            trigger=trigger,
+            feature=feature,
+            op=_CONDITION_OPS[op] if op else None,
+            threshold=float(threshold) if threshold else 0.0,
+        ))
+
+    compiled.sort(key=lambda c: c.trigger.priority)
+    return tuple(compiled)
+
+
+async def _emit_chunk(on_chunk: Optional[Callable[[str], Any]], text: str):
+    """Send reply text to a streaming callback, awaiting it if async."""
+    if on_chunk is None or not text:
+        return
+    result = on_chunk(text)
+    if inspect.isawaitable(result):
+        await result
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of model tokens in a piece of text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to epoch nanoseconds; naive values are UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def ns_to_datetime(timestamp: int) -> datetime:
+    """Convert epoch nanoseconds to an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=timestamp // 1000)
+
+
+def episode_name(student_id: Optional[str], timestamp: int) -> str:
+    """Build a Graphiti episode name from integer epoch microseconds."""
+    return f"{student_id}_{timestamp // 1000}"
+
+
+def _normalize_text(text: str) -> str:
+    """Normalize message text for cache keys (case, whitespace, end punctuation)."""
+    return " ".join(text.casefold().split()).rstrip("?!. ")
+
+
+class HistoryView(Sequence):
+    """Read-only live view of an agent's conversation history.
+
+    Returned instead of a copy so polling the history costs O(1); callers
+    that need a mutable snapshot take list(view).
+    """
+    __slots__ = ('_messages',)
+
+    def __init__(self, messages: deque):
+        self._messages = messages
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._messages)[index]
+        return self._messages[index]
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self):
+        return iter(self._messages)
+
+    def __repr__(self) -> str:
+        return f"HistoryView({list(self._messages)!r})"
+
+
+class ResponseCache:
+    """LRU cache of model responses keyed by conversation state.
+
+    Keys hash the student, model, system prompt and normalized message
+    window, so a student repeating a question in an identical context
+    (e.g. "When is the FAFSA deadline?" as an opening message) is answered
+    without an API call. Entries are never shared between students, expire
+    after ``ttl_seconds`` and can be dropped per student.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = RESPONSE_CACHE_SIZE,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # key -> (stored_at, student_id, response)
+        self._entries: OrderedDict[str, Tuple[float, Optional[str], 'AgentResponse']] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        student_id: Optional[str],
+        model: str,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+    ) -> str:
+        """Build a cache key for a student's model call."""
+        digest = hashlib.sha1((student_id or "").encode())
+        digest.update(b"\0" + model.encode())
+        digest.update(b"\0" + system_prompt.encode())
+        for msg in messages:
+            digest.update(f"\0{msg['role']}:{_normalize_text(msg['content'])}".encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional['AgentResponse']:
+        """Return the cached response for a key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, _, response = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: str, student_id: Optional[str], response: 'AgentResponse'):
+        """Store a response, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic(), student_id, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate_student(self, student_id: str) -> int:
+        """Drop every response cached for a student.
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [k for k, (_, sid, _) in self._entries.items() if sid == student_id]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by all agents in the process
+_response_cache = ResponseCache()
+
+
 class AmbassadorAgent:
     """Main ambassador agent for student interactions.
 
@@ -89,6 +396,7 @@ class AmbassadorAgent:
         graphiti_client=None,
         falkordb_client=None,
         student_id: Optional[str] = None,
+        allow_delegation: bool = True,
     ):
         """Initialize the ambassador agent.
 
@@ -97,6 +405,9 @@ class AmbassadorAgent:
             graphiti_client: Graphiti client for temporal memory
             falkordb_client: FalkorDB client for commons queries
             student_id: ID of the student this agent serves
+            allow_delegation: Whether this agent may delegate to
+                specialists (False for sub-agents, so delegation is
+                only ever one level deep)
         """
         self.config = config or ambassador_config
         self.graphiti = graphiti_client
@@ -104,18 +415,53 @@ class AmbassadorAgent:
         self.student_id = student_id
 
         # Conversation state
-        self._conversation_history: List[Message] = []
+        self._conversation_history: deque[Message] = deque(
+            maxlen=self.config.history_window
+        )
+        # API payload dicts, maintained alongside the history, with their
+        # estimated token counts and running total
+        self._api_messages: deque[Dict[str, str]] = deque(
+            maxlen=self.config.history_window
+        )
+        self._api_token_counts: deque[int] = deque(
+            maxlen=self.config.history_window
+        )
+        self._api_tokens = 0
+        self._system_tokens = estimate_tokens(self.config.system_prompt)
         self._session_start = datetime.utcnow()
 
         # Model clients
         self._primary_client = None
         self._fallback_client = None
 
-        # Tool registry
-        self._tools: Dict[str, Callable] = {}
+        # Tool registry: names resolve to a slot index once, handlers are
+        # then dispatched by index
+        self._tool_index: Dict[str, int] = {
+            name: i for i, name in enumerate(self.config.tools)
+        }
+        self._tool_handlers: List[Optional[Callable[..., Awaitable[Any]]]] = (
+            [None] * len(self._tool_index)
+        )
+
+        # Proactive triggers, parsed once
+        self._compiled_triggers = compile_triggers(self.config.proactive_triggers)
 
-        # Sub-agent instances
+        # Sub-agent instances, and the specialists this agent may delegate
+        # to (a specialist never delegates back to itself, and sub-agents
+        # do not delegate at all)
         self._sub_agents: Dict[str, 'AmbassadorAgent'] = {}
+        self._sub_agent_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._delegation_targets: Tuple[str, ...] = tuple(
+            name for name in DELEGATION_KEYWORDS
+            if allow_delegation and AGENT_CONFIGS.get(name) is not self.config
+        )
+        self._delegation_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELEGATIONS)
+
+        # Episodes waiting to be flushed, and background flushes in flight
+        self._pending_episodes: List[Tuple[Message, str]] = []
+        self._flush_now = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._pending_writes: set[asyncio.Task] = set()
 
         # Initialize clients if available
         self._initialize_clients()
@@ -125,24 +471,24 @@ class AmbassadorAgent:
         api_key = os.getenv("ANTHROPIC_API_KEY")
 
         if ANTHROPIC_AVAILABLE and api_key:
-            self._primary_client = AsyncAnthropic(api_key=api_key)
+            self._primary_client = _shared_anthropic_client(api_key)
             if self.config.fallback_model:
                 self._fallback_client = self._primary_client
-            logger.info(f"Initialized Anthropic client for {self.config.name}")
+            logger.info(f"Using shared Anthropic client for {self.config.name}")
         else:
             logger.warning(
                 "Anthropic client not available. "
                 "Set ANTHROPIC_API_KEY environment variable."
             )
 
-    @property
+    @cached_property
     def model_name(self) -> str:
-        """Get the primary model name."""
+        """Get the primary model name (fixed for the agent's lifetime)."""
         return get_model_name(self.config.model)
 
-    @property
+    @cached_property
     def fallback_model_name(self) -> Optional[str]:
-        """Get the fallback model name."""
+        """Get the fallback model name (fixed for the agent's lifetime)."""
         if self.config.fallback_model:
             return get_model_name(self.config.fallback_model)
         return None
@@ -175,29 +521,62 @@ class AmbassadorAgent:
             return
 
         try:
-            history = await self.graphiti.get_student_history(
-                self.student_id,
-                limit=50
+            for message in await self._fetch_history_messages():
+                self._record_message(message)
+        except Exception as e:
+            logger.warning(f"Could not load conversation history: {e}")
+
+    async def _fetch_history_messages(self) -> List[Message]:
+        """Fetch the student's recent history from Graphiti as Messages."""
+        # One query for all episodes rather than a per-entry fetch
+        history = await self.graphiti.batch_get_episodes(
+            self.student_id,
+            limit=self.config.history_window
+        )
+
+        logger.info(f"Loaded {len(history)} history entries for student {self.student_id}")
+        return [
+            Message(
+                role=entry.get('role') or "user",
+                content=entry.get('fact', ''),
+                timestamp=datetime_to_ns(entry['valid_at'])
+                if entry.get('valid_at') else time.time_ns(),
+                metadata={'source': 'history'}
             )
+            for entry in history
+        ]
 
-            # Convert to Message objects
-            for entry in history:
-                self._conversation_history.append(Message(
-                    role="assistant" if entry.get('is_assistant') else "user",
-                    content=entry.get('fact', ''),
-                    timestamp=entry.get('valid_at'),
-                    metadata={'source': 'history'}
-                ))
+    async def refresh_history(self):
+        """Replace the in-memory history with the latest from Graphiti.
 
-            logger.info(f"Loaded {len(history)} history entries for student {self.student_id}")
+        Skipped while episode writes are pending, since the in-memory
+        window is then newer than what Graphiti would return.
+        """
+        if not self.graphiti or not self.student_id or self._has_unsaved_episodes():
+            return
+
+        try:
+            messages = await self._fetch_history_messages()
         except Exception as e:
-            logger.warning(f"Could not load conversation history: {e}")
+            logger.warning(f"Could not refresh conversation history: {e}")
+            return
+
+        if self._has_unsaved_episodes():
+            return
+
+        self._conversation_history.clear()
+        self._api_messages.clear()
+        self._api_token_counts.clear()
+        self._api_tokens = 0
+        for message in messages:
+            self._record_message(message)
 
     async def process_message(
         self,
         message: str,
         channel: str = "web",
         metadata: Dict[str, Any] = None,
+        on_chunk: Optional[Callable[[str], Any]] = None,
     ) -> AgentResponse:
         """Process an incoming message and generate a response.
 
@@ -205,9 +584,11 @@ class AmbassadorAgent:
             message: The user's message
             channel: Communication channel (web, sms, voice)
             metadata: Additional message metadata
+            on_chunk: Optional callback (sync or async) receiving reply text
+                as it is generated, for streaming to the student
 
         Returns:
-            AgentResponse with the assistant's reply
+            AgentResponse with the assistant's complete reply
         """
         metadata = metadata or {}
 
@@ -217,23 +598,36 @@ class AmbassadorAgent:
             content=message,
             metadata={'channel': channel, **metadata}
         )
-        self._conversation_history.append(user_msg)
+        self._record_message(user_msg)
 
-        # Store in Graphiti if available
+        # Store in Graphiti if available (off the response path)
         if self.graphiti and self.student_id:
-            await self._store_episode(user_msg, channel)
+            self._schedule_episode_write(user_msg, channel)
+
+        # Track whether the primary attempt already streamed text, since a
+        # fallback reply can't be appended to half of another answer
+        streamed = False
+        primary_on_chunk = None
+        if on_chunk is not None:
+            def primary_on_chunk(text: str):
+                nonlocal streamed
+                streamed = True
+                return on_chunk(text)
 
         # Generate response
         try:
-            response = await self._generate_response(message, channel)
+            response = await self._generate_response(
+                message, channel, on_chunk=primary_on_chunk
+            )
         except Exception as e:
             logger.error(f"Primary model failed: {e}")
 
-            # Try fallback model
-            if self.fallback_model_name:
+            # Try fallback model, unless the student already saw part of
+            # the primary reply
+            if self.fallback_model_name and not streamed:
                 logger.info("Attempting fallback model...")
                 response = await self._generate_response(
-                    message, channel, use_fallback=True
+                    message, channel, use_fallback=True, on_chunk=on_chunk
                 )
             else:
                 raise
@@ -244,11 +638,11 @@ class AmbassadorAgent:
             content=response.content,
             metadata={'channel': channel, 'tools_used': response.tools_used}
         )
-        self._conversation_history.append(assistant_msg)
+        self._record_message(assistant_msg)
 
         # Store response in Graphiti
         if self.graphiti and self.student_id:
-            await self._store_episode(assistant_msg, channel)
+            self._schedule_episode_write(assistant_msg, channel)
 
         return response
 
@@ -257,6 +651,7 @@ class AmbassadorAgent:
         message: str,
         channel: str,
         use_fallback: bool = False,
+        on_chunk: Optional[Callable[[str], Any]] = None,
     ) -> AgentResponse:
         """Generate a response using the configured model.
 
@@ -264,6 +659,7 @@ class AmbassadorAgent:
             message: User message to respond to
             channel: Communication channel
             use_fallback: Whether to use fallback model
+            on_chunk: Optional callback receiving reply text as it streams
 
         Returns:
             AgentResponse with generated content
@@ -271,58 +667,131 @@ class AmbassadorAgent:
         model = self.fallback_model_name if use_fallback else self.model_name
 
         # Check for delegation needs
-        delegation = await self._check_delegation_needed(message)
-        if delegation:
-            return await self._delegate_to_agent(delegation, message)
+        delegations = await self._check_delegations_needed(message)
+        if delegations:
+            return await self._delegate_to_agents(delegations, message, on_chunk)
 
         # Build conversation context
         messages = self._build_messages_for_api()
 
         # Call model API if available
         if self._primary_client:
-            try:
-                response = await self._primary_client.messages.create(
-                    model=model,
-                    max_tokens=self.config.max_tokens,
-                    system=self.config.system_prompt,
-                    messages=messages,
+            cache_key = ResponseCache.make_key(
+                self.student_id, model, self.config.system_prompt, messages
+            )
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                await _emit_chunk(on_chunk, cached.content)
+                return replace(
+                    cached,
+                    metadata={**cached.metadata, 'channel': channel, 'cached': True},
+                    tools_used=list(cached.tools_used),
                 )
 
-                content = response.content[0].text if response.content else ""
-
-                return AgentResponse(
+            try:
+                if on_chunk is not None:
+                    content, usage = await self._stream_completion(
+                        model, messages, on_chunk
+                    )
+                else:
+                    response = await self._primary_client.messages.create(
+                        model=model,
+                        max_tokens=self.config.max_tokens,
+                        system=self.config.system_prompt,
+                        messages=messages,
+                    )
+                    content = response.content[0].text if response.content else ""
+                    usage = response.usage
+
+                agent_response = AgentResponse(
                     content=content,
                     metadata={
                         'model': model,
                         'channel': channel,
-                        'tokens_used': response.usage.output_tokens if response.usage else 0,
+                        'tokens_used': usage.output_tokens if usage else 0,
                     }
                 )
+                _response_cache.put(cache_key, self.student_id, agent_response)
+                return replace(agent_response, metadata=dict(agent_response.metadata))
             except Exception as e:
                 logger.error(f"API call failed: {e}")
                 raise
 
         # Fallback response if no client available
+        content = self._generate_fallback_response(message)
+        await _emit_chunk(on_chunk, content)
         return AgentResponse(
-            content=self._generate_fallback_response(message),
+            content=content,
             metadata={'model': 'fallback', 'channel': channel}
         )
 
-    def _build_messages_for_api(self) -> List[Dict[str, str]]:
-        """Build message list for API call."""
-        messages = []
+    async def _stream_completion(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        on_chunk: Callable[[str], Any],
+    ) -> Tuple[str, Any]:
+        """Stream a completion, forwarding text deltas as they arrive.
 
-        # Include recent conversation history
-        recent_history = self._conversation_history[-20:]  # Last 20 messages
+        Args:
+            model: Model name
+            messages: Conversation messages for the API
+            on_chunk: Callback receiving each text delta
 
-        for msg in recent_history:
-            if msg.role in ("user", "assistant"):
-                messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+        Returns:
+            Tuple of (full reply text, usage)
+        """
+        parts = []
+        async with self._primary_client.messages.stream(
+            model=model,
+            max_tokens=self.config.max_tokens,
+            system=self.config.system_prompt,
+            messages=messages,
+        ) as stream:
+            async for text in stream.text_stream:
+                parts.append(text)
+                await _emit_chunk(on_chunk, text)
+            final = await stream.get_final_message()
+
+        return "".join(parts), final.usage
+
+    def _record_message(self, message: Message):
+        """Append a message to the history and the API message window.
 
-        return messages
+        Args:
+            message: Message to record
+        """
+        self._conversation_history.append(message)
+        if message.role in ("user", "assistant"):
+            # The full deques drop their oldest entry on append
+            if len(self._api_token_counts) == self._api_token_counts.maxlen:
+                self._api_tokens -= self._api_token_counts[0]
+
+            tokens = estimate_tokens(message.content)
+            self._api_messages.append(
+                {"role": message.role, "content": message.content}
+            )
+            self._api_token_counts.append(tokens)
+            self._api_tokens += tokens
+
+    def _build_messages_for_api(self) -> List[Dict[str, str]]:
+        """Build message list for API call.
+
+        Payload dicts are built once in _record_message. The oldest
+        messages are dropped until the window, system prompt and reply
+        budget fit the model's context limit; the newest message is
+        always kept.
+        """
+        budget = (
+            self.config.context_limit_tokens
+            - self._system_tokens
+            - self.config.max_tokens
+        )
+        while self._api_tokens > budget and len(self._api_messages) > 1:
+            self._api_messages.popleft()
+            self._api_tokens -= self._api_token_counts.popleft()
+
+        return list(self._api_messages)
 
     async def _check_delegation_needed(self, message: str) -> Optional[str]:
         """Check if message should be delegated to a specialist agent.
@@ -333,104 +802,235 @@ class AmbassadorAgent:
         Returns:
             Agent name to delegate to, or None
         """
-        message_lower = message.lower()
-
-        # Simple keyword-based delegation (in production, use NLU)
-        # Check for scholarship-related queries
-        scholarship_keywords = [
-            "find scholarship", "scholarship search", "match scholarship",
-            "find me scholarship", "scholarships for", "scholarship match",
-            "look for scholarship", "search scholarship"
-        ]
-        if any(kw in message_lower for kw in scholarship_keywords):
-            return "scholarship_scout"
+        delegations = await self._check_delegations_needed(message)
+        return delegations[0] if delegations else None
 
-        # Check for appeal/negotiation queries
-        appeal_keywords = [
-            "appeal", "negotiate", "counter offer", "increase aid",
-            "more money", "better offer", "financial aid appeal"
-        ]
-        if any(kw in message_lower for kw in appeal_keywords):
-            return "appeal_strategist"
+    async def _check_delegations_needed(self, message: str) -> List[str]:
+        """Find every specialist agent a message should be delegated to.
 
-        # Check for deadline queries
-        deadline_keywords = [
-            "deadline", "due date", "when is", "calendar",
-            "upcoming deadline", "dates for"
-        ]
-        if any(kw in message_lower for kw in deadline_keywords):
-            return "deadline_sentinel"
-
-        # Check for document processing queries
-        document_keywords = [
-            "upload document", "parse award", "read transcript",
-            "parse my award", "analyze document", "award letter",
-            "document analyst"
-        ]
-        if any(kw in message_lower for kw in document_keywords):
-            return "document_analyst"
+        Args:
+            message: User message to analyze
 
-        return None
+        Returns:
+            Agent names in priority order (empty if no delegation needed)
+        """
+        matched = {m.lastgroup for m in _DELEGATION_PATTERN.finditer(message)}
+        if not matched:
+            return []
+
+        return [name for name in self._delegation_targets if name in matched]
+
+    async def _delegate_to_agents(
+        self,
+        agent_names: List[str],
+        message: str,
+        on_chunk: Optional[Callable[[str], Any]] = None,
+    ) -> AgentResponse:
+        """Delegate a message to several specialist agents concurrently.
+
+        Sub-agent calls are network-bound, so they are awaited together
+        (bounded by MAX_CONCURRENT_DELEGATIONS) and their replies merged.
+        A single specialist streams directly; merged replies are emitted
+        once complete so concurrent output is not interleaved.
+
+        Args:
+            agent_names: Names of agents to delegate to
+            message: Message to process
+            on_chunk: Optional callback receiving reply text
+
+        Returns:
+            Merged response from the specialist agents
+        """
+        if len(agent_names) == 1:
+            return await self._delegate_to_agent(
+                agent_names[0], message, on_chunk=on_chunk
+            )
+
+        async def bounded(agent_name: str) -> AgentResponse:
+            async with self._delegation_semaphore:
+                return await self._delegate_to_agent(agent_name, message)
+
+        results = await asyncio.gather(
+            *(bounded(name) for name in agent_names),
+            return_exceptions=True,
+        )
+
+        responses = []
+        errors = []
+        for agent_name, result in zip(agent_names, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Delegation to {agent_name} failed: {result}")
+                errors.append(result)
+            else:
+                responses.append(result)
+
+        if not responses:
+            raise errors[0]
+
+        tools_used = []
+        for response in responses:
+            for tool in response.tools_used:
+                if tool not in tools_used:
+                    tools_used.append(tool)
+
+        delegated = [r.delegated_to for r in responses]
+        content = "\n\n".join(r.content for r in responses if r.content)
+        await _emit_chunk(on_chunk, content)
+        return AgentResponse(
+            content=content,
+            metadata={'delegations': delegated},
+            delegated_to=delegated[0],
+            tools_used=tools_used,
+        )
 
     async def _delegate_to_agent(
         self,
         agent_name: str,
         message: str,
+        on_chunk: Optional[Callable[[str], Any]] = None,
     ) -> AgentResponse:
         """Delegate message processing to a specialist agent.
 
         Args:
             agent_name: Name of agent to delegate to
             message: Message to process
+            on_chunk: Optional callback receiving reply text as it streams
 
         Returns:
             Response from the specialist agent
         """
         logger.info(f"Delegating to {agent_name}")
 
-        # Get or create sub-agent
-        if agent_name not in self._sub_agents:
-            if agent_name not in AGENT_CONFIGS:
-                return AgentResponse(
-                    content=f"I don't have access to a {agent_name} specialist right now.",
-                    metadata={'error': 'unknown_agent'}
-                )
-
-            sub_config = AGENT_CONFIGS[agent_name]
-            self._sub_agents[agent_name] = AmbassadorAgent(
-                config=sub_config,
-                graphiti_client=self.graphiti,
-                falkordb_client=self.falkordb,
-                student_id=self.student_id,
+        if agent_name not in AGENT_CONFIGS:
+            content = f"I don't have access to a {agent_name} specialist right now."
+            await _emit_chunk(on_chunk, content)
+            return AgentResponse(
+                content=content,
+                metadata={'error': 'unknown_agent'}
             )
 
-        sub_agent = self._sub_agents[agent_name]
+        sub_agent = await self._get_sub_agent(agent_name)
 
         # Process with sub-agent
-        response = await sub_agent.process_message(message)
+        response = await sub_agent.process_message(message, on_chunk=on_chunk)
         response.delegated_to = agent_name
 
         return response
 
-    async def _store_episode(self, message: Message, channel: str):
-        """Store a message as an episode in Graphiti.
+    async def _get_sub_agent(self, agent_name: str) -> 'AmbassadorAgent':
+        """Get or create and initialize a specialist sub-agent.
+
+        Creation is guarded by a per-agent lock so concurrent delegations
+        to the same specialist share one instance, initialized once.
+
+        Args:
+            agent_name: Name of a configured specialist agent
+
+        Returns:
+            The initialized sub-agent
+        """
+        sub_agent = self._sub_agents.get(agent_name)
+        if sub_agent is not None:
+            return sub_agent
+
+        async with self._sub_agent_locks[agent_name]:
+            sub_agent = self._sub_agents.get(agent_name)
+            if sub_agent is None:
+                sub_agent = AmbassadorAgent(
+                    config=AGENT_CONFIGS[agent_name],
+                    graphiti_client=self.graphiti,
+                    falkordb_client=self.falkordb,
+                    student_id=self.student_id,
+                    allow_delegation=False,
+                )
+                await sub_agent.initialize()
+                self._sub_agents[agent_name] = sub_agent
+
+        return sub_agent
+
+    def _schedule_episode_write(self, message: Message, channel: str):
+        """Queue a message for the next bulk write to Graphiti.
+
+        Episode writes are side effects the reply does not depend on, so
+        they are buffered and flushed on a background task once
+        EPISODE_BATCH_SIZE messages are queued or
+        EPISODE_FLUSH_INTERVAL_SECONDS have passed.
 
         Args:
             message: Message to store
             channel: Communication channel
         """
-        if not self.graphiti:
-            return
-
+        self._pending_episodes.append((message, channel))
+        if len(self._pending_episodes) >= EPISODE_BATCH_SIZE:
+            self._flush_now.set()
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+            self._pending_writes.add(self._flush_task)
+            self._flush_task.add_done_callback(self._on_write_done)
+
+    def _on_write_done(self, task: asyncio.Task):
+        """Forget a finished background flush, logging any failure."""
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background episode write failed: {task.exception()}")
+
+    def _has_unsaved_episodes(self) -> bool:
+        """Whether any episodes are queued or being written."""
+        return bool(self._pending_episodes or self._pending_writes)
+
+    async def _flush_after_interval(self):
+        """Flush queued episodes each interval (or full batch) until drained."""
         try:
-            await self.graphiti.add_episode(
-                name=f"{self.student_id}_{message.timestamp.isoformat()}",
-                episode_body=message.content,
-                source_description=f"{channel}_conversation",
-                group_id=self.student_id,
+            while self._pending_episodes:
+                try:
+                    await asyncio.wait_for(
+                        self._flush_now.wait(), EPISODE_FLUSH_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_now.clear()
+                if not await self._flush_episodes():
+                    break
+        finally:
+            self._flush_task = None
+
+    async def _flush_episodes(self) -> bool:
+        """Write all queued episodes to Graphiti in one bulk call.
+
+        The buffer is only cleared once the write succeeds; on failure
+        the episodes stay queued and are retried with the next flush.
+
+        Returns:
+            True if the queue was written (or there was nothing to write)
+        """
+        if not self.graphiti or not self._pending_episodes:
+            return True
+
+        batch = list(self._pending_episodes)
+        written = await self.graphiti.add_episodes_batch(
+            [
+                {
+                    'name': episode_name(self.student_id, message.timestamp),
+                    'episode_body': message.content,
+                    # The role is kept so history reloads as the same turns
+                    'source_description': f"{channel}_conversation:{message.role}",
+                    'reference_time': ns_to_datetime(message.timestamp),
+                }
+                for message, channel in batch
+            ],
+            group_id=self.student_id,
+        )
+
+        if not written:
+            logger.warning(
+                f"Failed to store {len(batch)} episodes; will retry on next flush"
             )
-        except Exception as e:
-            logger.warning(f"Failed to store episode: {e}")
+            return False
+
+        # Messages queued during the write stay for the next flush
+        del self._pending_episodes[:len(batch)]
+        return True
 
     def _generate_fallback_response(self, message: str) -> str:
         """Generate a fallback response when API is unavailable.
@@ -447,54 +1047,122 @@ class AmbassadorAgent:
             "please check that all services are running properly."
         )
 
-    def register_tool(self, name: str, handler: Callable[..., Awaitable[Any]]):
+    def invalidate_cached_responses(self) -> int:
+        """Drop cached model responses for this agent's student.
+
+        Call after the student's profile changes so answers are regenerated.
+
+        Returns:
+            Number of cached responses removed
+        """
+        if not self.student_id:
+            return 0
+        return _response_cache.invalidate_student(self.student_id)
+
+    def register_tool(self, name: str, handler: Callable[..., Awaitable[Any]]) -> int:
         """Register a tool for the agent to use.
 
         Args:
             name: Tool name (must be in config.tools)
             handler: Async function to handle tool calls
+
+        Returns:
+            Tool index to pass to call_tool
         """
-        if name not in self.config.tools:
+        index = self._tool_index.get(name)
+        if index is None:
             logger.warning(f"Tool {name} not in agent config, registering anyway")
-        self._tools[name] = handler
+            index = self._tool_index[name] = len(self._tool_handlers)
+            self._tool_handlers.append(None)
+
+        self._tool_handlers[index] = handler
         logger.info(f"Registered tool: {name}")
+        return index
 
-    async def check_triggers(self) -> List[Dict[str, Any]]:
-        """Check proactive triggers and return actions to take.
+    def get_tool_index(self, name: str) -> Optional[int]:
+        """Resolve a tool name to its dispatch index.
+
+        Args:
+            name: Tool name
 
         Returns:
-            List of triggered actions with context
+            Tool index, or None if the tool is unknown
         """
-        triggered_actions = []
+        return self._tool_index.get(name)
 
-        for trigger in self.config.proactive_triggers:
-            if await self._evaluate_trigger(trigger):
-                triggered_actions.append({
-                    'action': trigger.action,
-                    'condition': trigger.condition,
-                    'priority': trigger.priority,
-                })
+    async def call_tool(self, index: int, *args, **kwargs) -> Any:
+        """Call a registered tool by index.
 
-        # Sort by priority (lower number = higher priority)
-        triggered_actions.sort(key=lambda x: x['priority'])
+        Args:
+            index: Tool index from register_tool or get_tool_index
+            *args: Positional arguments for the tool
+            **kwargs: Keyword arguments for the tool
 
-        return triggered_actions
+        Returns:
+            The tool's result
 
-    async def _evaluate_trigger(self, trigger: ProactiveTrigger) -> bool:
-        """Evaluate if a trigger condition is met.
+        Raises:
+            LookupError: If no handler is registered at the index
+        """
+        handler = self._tool_handlers[index]
+        if handler is None:
+            raise LookupError(f"No handler registered for tool index {index}")
+        return await handler(*args, **kwargs)
+
+    async def check_triggers(
+        self,
+        features: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Check proactive triggers and return actions to take.
 
         Args:
-            trigger: The trigger to evaluate
+            features: Feature values to evaluate conditions against
+                (e.g. {'deadline_within_days': 3}); loaded for the
+                student if not provided
 
         Returns:
-            True if trigger condition is met
+            List of triggered actions with context, highest priority first
         """
-        # In production, this would evaluate conditions against real data
-        # For now, return False (triggers require Story 2.3)
-        return False
+        if features is None:
+            features = await self._load_trigger_features()
+
+        return self._match_triggers(features)
+
+    def _match_triggers(self, features: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Evaluate compiled triggers against already-loaded features."""
+        return [
+            {
+                'action': compiled.trigger.action,
+                'condition': compiled.trigger.condition,
+                'priority': compiled.trigger.priority,
+            }
+            for compiled in self._compiled_triggers
+            if compiled.matches(features)
+        ]
+
+    async def _load_trigger_features(self) -> Dict[str, Any]:
+        """Load the feature values trigger conditions are evaluated against.
+
+        Returns:
+            Feature name to value mapping for this agent's student
+        """
+        if not self.student_id:
+            return {}
+        features = await load_trigger_features([self.student_id])
+        return features.get(self.student_id, {})
 
     async def close(self):
         """Clean up agent resources."""
+        # Flush buffered episodes and let in-flight Graphiti writes finish
+        self._flush_now.set()
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        try:
+            await self._flush_episodes()
+        except Exception as e:
+            logger.warning(f"Final episode flush failed: {e}")
+        self._pending_episodes.clear()
+
         # Close sub-agents
         for sub_agent in self._sub_agents.values():
             await sub_agent.close()
@@ -502,20 +1170,105 @@ class AmbassadorAgent:
 
         logger.info(f"Closed agent: {self.config.name}")
 
-    def get_conversation_history(self) -> List[Message]:
+    def get_conversation_history(self) -> HistoryView:
         """Get the current conversation history.
 
         Returns:
-            List of Message objects
+            Read-only view of Message objects, oldest first; it reflects
+            later messages, so use list() for a fixed snapshot
         """
-        return self._conversation_history.copy()
+        return HistoryView(self._conversation_history)
+
+
+# =============================================================================
+# Batched proactive trigger evaluation
+# =============================================================================
+
+async def load_trigger_features(student_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Load trigger features for many students in one query.
+
+    Args:
+        student_ids: Students to load features for
+
+    Returns:
+        Mapping of student_id to feature values; students without data
+        are omitted
+    """
+    # In production, this would be a single query over deadline and
+    # engagement data for all ids at once rather than one read per student
+    # For now, no features are available (triggers require Story 2.3)
+    return {}
+
+
+async def evaluate_triggers_for_all(
+    agents: List[AmbassadorAgent],
+    features_by_student: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Check proactive triggers for many students in a single pass.
+
+    Features are loaded with one batched call instead of one call per
+    agent, then each agent's compiled triggers are evaluated in memory.
+
+    Args:
+        agents: Agents to evaluate; agents without a student_id are skipped
+        features_by_student: Preloaded features keyed by student_id;
+            loaded in one batch if not provided
+
+    Returns:
+        Mapping of student_id to triggered actions, highest priority first
+    """
+    agents = [agent for agent in agents if agent.student_id]
+    if features_by_student is None:
+        features_by_student = await load_trigger_features(
+            [agent.student_id for agent in agents]
+        )
+
+    return {
+        agent.student_id: agent._match_triggers(
+            features_by_student.get(agent.student_id, {})
+        )
+        for agent in agents
+    }
 
 
 # =============================================================================
 # Module-level factory function
 # =============================================================================
 
-_ambassador_instance: Optional[AmbassadorAgent] = None
+# Agents are kept per student so history loading and client setup are
+# paid once per active student rather than once per request
+AGENT_CACHE_SIZE = 1024
+AGENT_REFRESH_SECONDS = 300
+
+# student_id -> (last_refreshed, agent), least recently used first
+_agent_cache: OrderedDict[str, Tuple[float, AmbassadorAgent]] = OrderedDict()
+_agent_cache_lock = asyncio.Lock()
+# student_id -> future for an agent being initialized, so concurrent first
+# requests for one student share a single initialization
+_agent_inflight: Dict[str, asyncio.Future] = {}
+_refresh_tasks: set[asyncio.Task] = set()
+
+
+def _get_cached_agent(student_id: str) -> Optional[AmbassadorAgent]:
+    """Return a student's cached agent, scheduling a refresh if it is stale.
+
+    Callers must hold _agent_cache_lock.
+    """
+    entry = _agent_cache.get(student_id)
+    if entry is None:
+        return None
+
+    refreshed_at, agent = entry
+    _agent_cache.move_to_end(student_id)
+
+    now = time.monotonic()
+    if now - refreshed_at > AGENT_REFRESH_SECONDS:
+        _agent_cache[student_id] = (now, agent)
+        task = asyncio.create_task(agent.refresh_history())
+        _refresh_tasks.add(task)
+        task.add_done_callback(_refresh_tasks.discard)
+
+    return agent
 
 
 async def get_ambassador(
@@ -525,6 +1278,14 @@ async def get_ambassador(
 ) -> AmbassadorAgent:
     """Get or create an ambassador agent for a student.
 
+    Agents are cached per student (LRU, up to AGENT_CACHE_SIZE). A cached
+    agent is returned immediately; if its history is older than
+    AGENT_REFRESH_SECONDS it is refreshed from Graphiti in the background.
+
+    The cache lock is held only for lookups and inserts, so a slow
+    initialization never delays other students. Concurrent requests for a
+    student being initialized wait for that one initialization.
+
     Args:
         student_id: Student ID to get ambassador for
         graphiti_client: Optional Graphiti client
@@ -533,16 +1294,56 @@ async def get_ambassador(
     Returns:
         Initialized AmbassadorAgent instance
     """
-    global _ambassador_instance
-
-    # Create new instance for this student
-    agent = AmbassadorAgent(
-        config=ambassador_config,
-        graphiti_client=graphiti_client,
-        falkordb_client=falkordb_client,
-        student_id=student_id,
-    )
-
-    await agent.initialize()
+    while True:
+        async with _agent_cache_lock:
+            agent = _get_cached_agent(student_id)
+            if agent is not None:
+                return agent
+
+            inflight = _agent_inflight.get(student_id)
+            if inflight is None:
+                future = asyncio.get_running_loop().create_future()
+                _agent_inflight[student_id] = future
+                break
+
+        # Share an initialization already in flight; if it fails, try again
+        await asyncio.wait((inflight,))
+        if not inflight.cancelled():
+            return inflight.result()
+
+    try:
+        agent = AmbassadorAgent(
+            config=ambassador_config,
+            graphiti_client=graphiti_client,
+            falkordb_client=falkordb_client,
+            student_id=student_id,
+        )
+        await agent.initialize()
+    except BaseException:
+        del _agent_inflight[student_id]
+        future.cancel()
+        raise
+
+    evicted = []
+    async with _agent_cache_lock:
+        _agent_cache[student_id] = (time.monotonic(), agent)
+        while len(_agent_cache) > AGENT_CACHE_SIZE:
+            _, (_, old_agent) = _agent_cache.popitem(last=False)
+            evicted.append(old_agent)
+        del _agent_inflight[student_id]
+    future.set_result(agent)
+
+    for old_agent in evicted:
+        await old_agent.close()
 
     return agent
+
+
+async def clear_ambassador_cache():
+    """Close and forget every cached ambassador agent."""
+    async with _agent_cache_lock:
+        agents = [agent for _, agent in _agent_cache.values()]
+        _agent_cache.clear()
+
+    for agent in agents:
+        await agent.close()
@@ -55,6 +55,8 @@ class AgentConfig:
     system_prompt: str = ""
     temperature: float = 0.7
     max_tokens: int = 4096
+    history_window: int = 20  # Messages kept in memory and sent to the model
+    context_limit_tokens: int = 200_000  # Model context window
 
 
 # =============================================================================
@@ -4,15 +4,48 @@ Implements the protocol for agents to communicate with each other.
 Used by Ambassador to query specialist agents.
 """
 
+import copy
+import json
+import time
+import asyncio
+import hashlib
 import logging
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from typing import List, Dict, Any, Optional, Union, AsyncIterator, Iterator, Tuple, Callable, Awaitable
 from enum import Enum
 import uuid
 
+# httpx ships with the Anthropic SDK; used to pool connections to remote
+# specialists
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# orjson is optional; messages fall back to stdlib json on the wire
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on specialist requests in flight for one fan-out, and
+# across all callers for any single agent
+MAX_CONCURRENT_REQUESTS = 8
+MAX_CONCURRENT_PER_AGENT = 16
+
+# Shared HTTP pool for specialists served over the network
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE = 20
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
 
 class A2AAction(Enum):
     """Available A2A actions."""
@@ -41,6 +74,37 @@ class A2AAction(Enum):
     HEALTH_CHECK = "health_check"
 
 
+# Seconds a completed response stays cached, for idempotent read actions
+# only; actions missing here (drafts, scrapes, subscriptions, stats,
+# health checks) always reach the specialist. Strategist reads are not
+# cached here: the strategist caches them itself and notices commons
+# writes, which a cache in front of it would hide
+RESPONSE_CACHE_TTL_SECONDS: Dict[A2AAction, float] = {
+    A2AAction.SEARCH_SCHOLARSHIPS: 60,
+    A2AAction.GET_MATCHES: 60,
+    A2AAction.GET_DEADLINES: 60,
+    A2AAction.GET_UPCOMING_DEADLINES: 60,
+    A2AAction.GET_URGENT_DEADLINES: 60,
+}
+RESPONSE_CACHE_SIZE = 1024
+
+# Actions that leave a specialist's state untouched. Any other action
+# (scrapes, verifications, subscriptions, drafts) drops the target agent's
+# cached responses, since they may now be stale
+READ_ONLY_ACTIONS = frozenset(RESPONSE_CACHE_TTL_SECONDS) | {
+    A2AAction.ANALYZE_SCHOOL,
+    A2AAction.GET_STRATEGIES,
+    A2AAction.GET_SUCCESS_PATTERNS,
+    A2AAction.GET_SCOUT_STATS,
+    A2AAction.GET_SENTINEL_STATS,
+    A2AAction.HEALTH_CHECK,
+}
+
+# Requests/responses kept for inspection; stats use running counters so
+# they cover every request, not just the retained window
+HISTORY_SIZE = 10_000
+
+
 class A2AStatus(Enum):
     """Status of an A2A request."""
     PENDING = "pending"
@@ -49,14 +113,97 @@ class A2AStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Wire value -> enum member. Deserializers should index these maps
+# (raising KeyError on unknown values) rather than calling A2AAction(value)
+ACTION_BY_VALUE: Dict[str, A2AAction] = {action.value: action for action in A2AAction}
+STATUS_BY_VALUE: Dict[str, A2AStatus] = {status.value: status for status in A2AStatus}
+
+
+@lru_cache(maxsize=1)
+def _iso_at_second(second: int) -> str:
+    """Format a whole epoch second once; repeated calls in that second hit the cache."""
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+
+def _health_status(agent_name: str) -> Dict[str, Any]:
+    """Build a health check payload for a registered agent."""
+    return {
+        'status': 'healthy',
+        'agent': agent_name,
+        'timestamp': _iso_at_second(int(time.time())),
+    }
+
+
+def _scholarship_summary(scholarship: Any) -> Dict[str, Any]:
+    """Serialize a ScholarshipDiscovery for an A2A response."""
+    return {
+        'id': scholarship.id,
+        'name': scholarship.name,
+        'amount_max': scholarship.amount_max,
+        'deadline': scholarship.deadline_iso,
+        'legitimacy': scholarship.legitimacy.value,
+    }
+
+
+class A2AParams:
+    """Base for typed parameters of frequent actions.
+
+    Handlers read fields as attributes; item access and get() are kept so
+    code written against dict params still works.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    @classmethod
+    def from_params(cls, params: Union[Dict[str, Any], 'A2AParams']):
+        """Return params as this type, converting a dict if needed."""
+        if isinstance(params, cls):
+            return params
+        return cls(**{
+            name: params[name]
+            for name in cls.__dataclass_fields__
+            if name in params
+        })
+
+
+@dataclass(slots=True, frozen=True)
+class SearchParams(A2AParams):
+    """Parameters for SEARCH_SCHOLARSHIPS."""
+    query: str = ''
+    profile_id: Optional[str] = None
+    limit: int = 10
+
+
+@dataclass(slots=True, frozen=True)
+class VerifyScholarshipParams(A2AParams):
+    """Parameters for VERIFY_SCHOLARSHIP."""
+    scholarship_id: str = ''
+
+
+@dataclass(slots=True, frozen=True)
+class DraftAppealParams(A2AParams):
+    """Parameters for DRAFT_APPEAL."""
+    school_id: str = ''
+    student_context: Dict[str, Any] = field(default_factory=dict)
+    strategy_id: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
 class A2ARequest:
     """A request from one agent to another."""
     id: str
     source_agent: str
     target_agent: str
     action: A2AAction
-    params: Dict[str, Any] = field(default_factory=dict)
+    params: Union[Dict[str, Any], A2AParams] = field(default_factory=dict)
     context: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
     timeout_seconds: int = 30
@@ -67,7 +214,7 @@ class A2ARequest:
         source: str,
         target: str,
         action: A2AAction,
-        params: Dict[str, Any] = None,
+        params: Union[Dict[str, Any], A2AParams] = None,
         context: Dict[str, Any] = None,
     ) -> 'A2ARequest':
         """Create a new A2A request.
@@ -76,23 +223,55 @@ class A2ARequest:
             source: Source agent name
             target: Target agent name
             action: Action to perform
-            params: Action parameters
+            params: Action parameters, as a dict or typed params
             context: Additional context
 
         Returns:
             A2ARequest object
         """
         return cls(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             source_agent=source,
             target_agent=target,
             action=action,
-            params=params or {},
+            params={} if params is None else params,
             context=context or {},
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to JSON-compatible primitives for transport."""
+        params = self.params
+        return {
+            'id': self.id,
+            'source_agent': self.source_agent,
+            'target_agent': self.target_agent,
+            'action': self.action.value,
+            'params': asdict(params) if isinstance(params, A2AParams) else params,
+            'context': self.context,
+            'created_at': self.created_at.isoformat(),
+            'timeout_seconds': self.timeout_seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'A2ARequest':
+        """Rebuild a request from to_dict() output.
 
-@dataclass
+        Raises:
+            KeyError: If a required field or the action value is unknown
+        """
+        return cls(
+            id=data['id'],
+            source_agent=data['source_agent'],
+            target_agent=data['target_agent'],
+            action=ACTION_BY_VALUE[data['action']],
+            params=data.get('params') or {},
+            context=data.get('context') or {},
+            created_at=datetime.fromisoformat(data['created_at']),
+            timeout_seconds=data.get('timeout_seconds', 30),
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class A2AResponse:
     """A response from a specialist agent."""
     request_id: str
@@ -147,6 +326,58 @@ class A2AResponse:
             error=error,
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to JSON-compatible primitives for transport."""
+        return {
+            'request_id': self.request_id,
+            'status': self.status.value,
+            'data': self.data,
+            'error': self.error,
+            'processing_time_ms': self.processing_time_ms,
+            'responded_at': self.responded_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'A2AResponse':
+        """Rebuild a response from to_dict() output.
+
+        Raises:
+            KeyError: If a required field or the status value is unknown
+        """
+        return cls(
+            request_id=data['request_id'],
+            status=STATUS_BY_VALUE[data['status']],
+            data=data.get('data') or {},
+            error=data.get('error'),
+            processing_time_ms=data.get('processing_time_ms', 0.0),
+            responded_at=datetime.fromisoformat(data['responded_at']),
+        )
+
+
+def encode_message(message: Union[A2ARequest, A2AResponse]) -> bytes:
+    """Serialize a request or response to JSON bytes for transport."""
+    payload = message.to_dict()
+    if orjson is not None:
+        return orjson.dumps(payload, default=str)
+    return json.dumps(payload, default=str, separators=(',', ':')).encode()
+
+
+def _loads(data: Union[bytes, str]) -> Dict[str, Any]:
+    """Parse JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode_request(data: Union[bytes, str]) -> A2ARequest:
+    """Deserialize a request produced by encode_message."""
+    return A2ARequest.from_dict(_loads(data))
+
+
+def decode_response(data: Union[bytes, str]) -> A2AResponse:
+    """Deserialize a response produced by encode_message."""
+    return A2AResponse.from_dict(_loads(data))
+
 
 class A2AProtocol:
     """Protocol handler for agent-to-agent communication.
@@ -154,11 +385,36 @@ class A2AProtocol:
     Manages routing requests between agents and tracking request history.
     """
 
-    def __init__(self):
-        """Initialize A2A protocol handler."""
+    def __init__(self, http_client=None):
+        """Initialize A2A protocol handler.
+
+        Args:
+            http_client: Optional httpx.AsyncClient shared with remote
+                agents; created on first use if not provided
+        """
         self._agents: Dict[str, Any] = {}
-        self._request_history: List[A2ARequest] = []
-        self._response_history: List[A2AResponse] = []
+        self._agent_slots: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(MAX_CONCURRENT_PER_AGENT)
+        )
+        self._http_client = http_client
+        self._owns_http_client = False
+        self._request_history: deque = deque(maxlen=HISTORY_SIZE)
+        self._response_history: deque = deque(maxlen=HISTORY_SIZE)
+
+        # Running totals for get_stats
+        self._total_requests = 0
+        self._completed = 0
+        self._failed = 0
+        self._time_sum_ms = 0.0
+        self._time_count = 0
+
+        # (agent, key) -> (stored_at, response data), least recently used
+        # first. Entries are private deep copies, so callers can't mutate them
+        self._cache: OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._cache_hits = 0
+        # Bumped per agent by every state-changing action; a read started
+        # under an older generation is not cached
+        self._cache_generation: Dict[str, int] = defaultdict(int)
 
     def register_agent(self, name: str, agent: Any):
         """Register an agent with the protocol.
@@ -168,7 +424,16 @@ class A2AProtocol:
             agent: Agent instance
         """
         self._agents[name] = agent
-        logger.info(f"Registered agent: {name}")
+        self.clear_cache()
+
+        # Remote agents opt in to the shared connection pool
+        bind_http_client = getattr(agent, 'bind_http_client', None)
+        if bind_http_client is not None:
+            http_client = self.http_client
+            if http_client is not None:
+                bind_http_client(http_client)
+
+        logger.info("Registered agent: %s", name)
 
     def unregister_agent(self, name: str):
         """Unregister an agent.
@@ -177,7 +442,74 @@ class A2AProtocol:
             name: Agent name
         """
         self._agents.pop(name, None)
-        logger.info(f"Unregistered agent: {name}")
+        self.clear_cache()
+        logger.info("Unregistered agent: %s", name)
+
+    @property
+    def http_client(self):
+        """HTTP client shared by every remote agent, or None without httpx."""
+        if self._http_client is None and httpx is not None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+            self._owns_http_client = True
+        return self._http_client
+
+    async def close(self):
+        """Close the shared HTTP client if this protocol created it."""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+        self._http_client = None
+        self._owns_http_client = False
+
+    def clear_cache(self):
+        """Drop all cached specialist responses."""
+        self._cache.clear()
+
+    def invalidate_agent(self, name: str):
+        """Drop one agent's cached responses, e.g. after it changed state.
+
+        Args:
+            name: Agent name
+        """
+        self._cache_generation[name] += 1
+        for key in [key for key in self._cache if key[0] == name]:
+            del self._cache[key]
+
+    @staticmethod
+    def _cache_key(request: A2ARequest) -> Tuple[str, str]:
+        """Build a cache key from the target, action and canonical params."""
+        payload = json.dumps(
+            [request.target_agent, request.action.value, request.params],
+            sort_keys=True,
+            default=str,
+        )
+        return request.target_agent, hashlib.sha1(payload.encode()).hexdigest()
+
+    def _get_cached(self, key: Tuple[str, str], ttl: float) -> Optional[Dict[str, Any]]:
+        """Return a copy of cached response data, or None if missing/expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, data = entry
+        if time.monotonic() - stored_at > ttl:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return copy.deepcopy(data)
+
+    def _put_cached(self, key: Tuple[str, str], data: Dict[str, Any]):
+        """Store a copy of response data, evicting the least recently used entry."""
+        self._cache[key] = (time.monotonic(), copy.deepcopy(data))
+        self._cache.move_to_end(key)
+        while len(self._cache) > RESPONSE_CACHE_SIZE:
+            self._cache.popitem(last=False)
 
     async def send_request(
         self,
@@ -191,8 +523,13 @@ class A2AProtocol:
         Returns:
             A2AResponse from target agent
         """
-        start_time = datetime.utcnow()
+        # Liveness probes are answered directly, outside history and stats
+        if request.action is A2AAction.HEALTH_CHECK and request.target_agent in self._agents:
+            return A2AResponse.success(request.id, _health_status(request.target_agent))
+
+        start_ns = time.perf_counter_ns()
         self._request_history.append(request)
+        self._total_requests += 1
 
         # Check if target agent is registered
         if request.target_agent not in self._agents:
@@ -200,18 +537,48 @@ class A2AProtocol:
                 request.id,
                 f"Agent '{request.target_agent}' not registered"
             )
-            self._response_history.append(response)
+            self._record_response(response)
             return response
 
         agent = self._agents[request.target_agent]
 
-        try:
-            # Route to appropriate handler
-            data = await self._route_request(agent, request)
+        # Serve repeated idempotent queries without reaching the specialist
+        ttl = RESPONSE_CACHE_TTL_SECONDS.get(request.action)
+        cache_key = self._cache_key(request) if ttl is not None else None
+        if cache_key is not None:
+            cached = self._get_cached(cache_key, ttl)
+            if cached is not None:
+                self._cache_hits += 1
+                response = A2AResponse.success(request.id, cached)
+                self._record_response(response)
+                return response
+
+        # State-changing actions invalidate the agent's cached reads both
+        # before and after they run, so no overlapping read is cached
+        writes = request.action not in READ_ONLY_ACTIONS
+        if writes:
+            self.invalidate_agent(request.target_agent)
+        generation = self._cache_generation[request.target_agent]
 
-            # Calculate processing time
-            end_time = datetime.utcnow()
-            processing_time = (end_time - start_time).total_seconds() * 1000
+        try:
+            # Route to appropriate handler; the timeout covers waiting for
+            # a slot on a busy agent as well as the handler itself
+            try:
+                data = await asyncio.wait_for(
+                    self._route_limited(agent, request),
+                    timeout=request.timeout_seconds,
+                )
+            finally:
+                if writes:
+                    self.invalidate_agent(request.target_agent)
+            if (
+                cache_key is not None
+                and self._cache_generation[request.target_agent] == generation
+            ):
+                self._put_cached(cache_key, data)
+
+            # Calculate processing time (monotonic, integer nanoseconds)
+            processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
 
             response = A2AResponse.success(
                 request.id,
@@ -219,13 +586,175 @@ class A2AProtocol:
                 processing_time,
             )
 
+        except asyncio.TimeoutError:
+            logger.error("A2A request to %s timed out", request.target_agent)
+            response = A2AResponse.failure(
+                request.id,
+                f"Timed out after {request.timeout_seconds}s",
+            )
+
         except Exception as e:
-            logger.error(f"A2A request failed: {e}")
+            logger.exception("A2A request to %s failed", request.target_agent)
             response = A2AResponse.failure(request.id, str(e))
 
-        self._response_history.append(response)
+        self._record_response(response)
         return response
 
+    async def _route_limited(
+        self,
+        agent: Any,
+        request: A2ARequest,
+    ) -> Dict[str, Any]:
+        """Route a request once the target agent has a free slot."""
+        async with self._agent_slots[request.target_agent]:
+            return await self._route_request(agent, request)
+
+    def _record_response(self, response: A2AResponse):
+        """Append a response to history and update the running stats."""
+        status = response.status
+        if status is A2AStatus.COMPLETED:
+            self._completed += 1
+        elif status is A2AStatus.FAILED:
+            self._failed += 1
+
+        elapsed = response.processing_time_ms
+        if elapsed > 0:
+            self._time_sum_ms += elapsed
+            self._time_count += 1
+        self._response_history.append(response)
+
+    async def stream_request(
+        self,
+        request: A2ARequest,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Send a search request, yielding each result as it is serialized.
+
+        Lets a caller render or forward the first scholarships before the
+        whole result list has been converted. The request is recorded in
+        history and stats like send_request.
+
+        Args:
+            request: A SEARCH_SCHOLARSHIPS request
+
+        Yields:
+            One scholarship dict per result
+
+        Raises:
+            ValueError: If the action has no streaming form
+            LookupError: If the target agent is not registered
+        """
+        if request.action is not A2AAction.SEARCH_SCHOLARSHIPS:
+            raise ValueError(f"Action cannot be streamed: {request.action}")
+
+        start_ns = time.perf_counter_ns()
+        self._request_history.append(request)
+        self._total_requests += 1
+
+        agent = self._agents.get(request.target_agent)
+        if agent is None:
+            error = f"Agent '{request.target_agent}' not registered"
+            self._record_response(A2AResponse.failure(request.id, error))
+            raise LookupError(error)
+
+        params = SearchParams.from_params(request.params)
+
+        async def query() -> List[Any]:
+            async with self._agent_slots[request.target_agent]:
+                return await agent.query_scholarships(
+                    query=params.query,
+                    profile_id=params.profile_id,
+                    limit=params.limit,
+                )
+
+        # Every request gets exactly one response recorded: a failure, a
+        # success, or (if the consumer stops iterating early) a success
+        # covering the results it took
+        count = 0
+        response = None
+        try:
+            # As in send_request, the timeout covers waiting for a slot
+            results = await asyncio.wait_for(query(), timeout=request.timeout_seconds)
+            for scholarship in results:
+                summary = _scholarship_summary(scholarship)
+                count += 1
+                yield summary
+        except GeneratorExit:
+            raise
+        except asyncio.TimeoutError:
+            logger.error("A2A request to %s timed out", request.target_agent)
+            response = A2AResponse.failure(
+                request.id,
+                f"Timed out after {request.timeout_seconds}s",
+            )
+            raise
+        except BaseException as e:
+            # Other errors and cancellation also count as failures
+            response = A2AResponse.failure(request.id, str(e) or type(e).__name__)
+            raise
+        finally:
+            if response is None:
+                response = A2AResponse.success(
+                    request.id,
+                    {'count': count},
+                    (time.perf_counter_ns() - start_ns) / 1_000_000,
+                )
+            self._record_response(response)
+
+    async def send_requests(
+        self,
+        requests: List[A2ARequest],
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> List[A2AResponse]:
+        """Send several requests concurrently.
+
+        Wall-clock time is that of the slowest specialist rather than the
+        sum of all of them.
+
+        Args:
+            requests: Requests to send
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            Responses in the same order as the requests
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return list(await asyncio.gather(
+            *(self._send_bounded(request, semaphore) for request in requests)
+        ))
+
+    async def stream_requests(
+        self,
+        requests: List[A2ARequest],
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> AsyncIterator[A2AResponse]:
+        """Send several requests concurrently, yielding each response as it arrives.
+
+        Args:
+            requests: Requests to send
+            max_concurrency: Maximum requests in flight at once
+
+        Yields:
+            A2AResponse objects in completion order (match on request_id)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        for next_response in asyncio.as_completed(
+            [self._send_bounded(request, semaphore) for request in requests]
+        ):
+            yield await next_response
+
+    async def _send_bounded(
+        self,
+        request: A2ARequest,
+        semaphore: asyncio.Semaphore,
+    ) -> A2AResponse:
+        """Send one request of a fan-out, never raising."""
+        async with semaphore:
+            try:
+                return await self.send_request(request)
+            except Exception as e:
+                logger.exception("A2A request to %s failed", request.target_agent)
+                return A2AResponse.failure(request.id, str(e))
+
     async def _route_request(
         self,
         agent: Any,
@@ -240,174 +769,197 @@ class A2AProtocol:
         Returns:
             Response data dict
         """
-        action = request.action
-        params = request.params
+        handler = self._HANDLERS.get(request.action)
+        if handler is None:
+            raise ValueError(f"Unknown action: {request.action}")
+        return await handler(agent, request)
 
-        # Scholarship Scout actions
-        if action == A2AAction.SEARCH_SCHOLARSHIPS:
-            results = await agent.query_scholarships(
-                query=params.get('query', ''),
-                profile_id=params.get('profile_id'),
-                limit=params.get('limit', 10),
-            )
-            return {
-                'scholarships': [
-                    {
-                        'id': s.id,
-                        'name': s.name,
-                        'amount_max': s.amount_max,
-                        'deadline': s.deadline.isoformat() if s.deadline else None,
-                        'legitimacy': s.legitimacy.value,
-                    }
-                    for s in results
-                ]
-            }
-
-        elif action == A2AAction.GET_MATCHES:
-            matches = await agent.get_matches_for_profile(
-                profile_id=params.get('profile_id', ''),
-            )
-            return {
-                'matches': [
-                    {
-                        'scholarship_id': m.scholarship_id,
-                        'match_score': m.match_score,
-                        'reasons': m.match_reasons,
-                    }
-                    for m in matches
-                ]
-            }
-
-        elif action == A2AAction.VERIFY_SCHOLARSHIP:
-            result = await agent.verify_scholarship(
-                scholarship_id=params.get('scholarship_id', ''),
-            )
-            return result
+    # Scholarship Scout actions
 
-        elif action == A2AAction.GET_SCOUT_STATS:
-            return agent.get_stats()
+    @staticmethod
+    async def _handle_search_scholarships(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        params = SearchParams.from_params(request.params)
+        results = await agent.query_scholarships(
+            query=params.query,
+            profile_id=params.profile_id,
+            limit=params.limit,
+        )
+        return {'scholarships': [_scholarship_summary(s) for s in results]}
 
-        # Appeal Strategist actions
-        elif action == A2AAction.ANALYZE_SCHOOL:
-            result = await agent.analyze_school(
-                school_id=params.get('school_id', ''),
-            )
-            return result
+    @staticmethod
+    async def _handle_get_matches(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        matches = await agent.get_matches_for_profile(
+            profile_id=request.params.get('profile_id', ''),
+        )
+        return {
+            'matches': [
+                {
+                    'scholarship_id': m.scholarship_id,
+                    'match_score': m.match_score,
+                    'reasons': m.match_reasons,
+                }
+                for m in matches
+            ]
+        }
 
-        elif action == A2AAction.GET_STRATEGIES:
-            strategies = await agent.get_strategies(
-                school_id=params.get('school_id', ''),
-                context=params.get('context', {}),
-            )
-            return {'strategies': strategies}
+    @staticmethod
+    async def _handle_verify_scholarship(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        return await agent.verify_scholarship(
+            scholarship_id=VerifyScholarshipParams.from_params(request.params).scholarship_id,
+        )
 
-        elif action == A2AAction.DRAFT_APPEAL:
-            draft = await agent.draft_appeal(
-                school_id=params.get('school_id', ''),
-                student_context=params.get('student_context', {}),
-                strategy_id=params.get('strategy_id'),
-            )
-            return {'draft': draft}
+    @staticmethod
+    async def _handle_get_stats(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        return agent.get_stats()
 
-        elif action == A2AAction.GET_SUCCESS_PATTERNS:
-            patterns = await agent.get_success_patterns(
-                school_id=params.get('school_id'),
-            )
-            return {'patterns': patterns}
-
-        # Deadline Sentinel actions
-        elif action == A2AAction.GET_DEADLINES:
-            deadlines = await agent.get_deadlines(
-                student_id=params.get('student_id'),
-                school_id=params.get('school_id'),
-                include_past=params.get('include_past', False),
-                limit=params.get('limit', 20),
-            )
-            return {
-                'deadlines': [
-                    {
-                        'id': d.id,
-                        'name': d.name,
-                        'due_date': d.due_date.isoformat(),
-                        'days_until': d.days_until,
-                        'deadline_type': d.deadline_type.value,
-                        'status': d.status.value,
-                        'school_name': d.school_name,
-                    }
-                    for d in deadlines
-                ]
-            }
-
-        elif action == A2AAction.GET_UPCOMING_DEADLINES:
-            deadlines = await agent.get_upcoming_deadlines(
-                days_ahead=params.get('days_ahead', 30),
-            )
-            return {
-                'deadlines': [
-                    {
-                        'id': d.id,
-                        'name': d.name,
-                        'due_date': d.due_date.isoformat(),
-                        'days_until': d.days_until,
-                        'deadline_type': d.deadline_type.value,
-                    }
-                    for d in deadlines
-                ]
-            }
-
-        elif action == A2AAction.GET_URGENT_DEADLINES:
-            deadlines = await agent.get_urgent_deadlines()
-            return {
-                'deadlines': [
-                    {
-                        'id': d.id,
-                        'name': d.name,
-                        'due_date': d.due_date.isoformat(),
-                        'days_until': d.days_until,
-                        'deadline_type': d.deadline_type.value,
-                    }
-                    for d in deadlines
-                ]
-            }
-
-        elif action == A2AAction.SCRAPE_DEADLINE:
-            result = await agent.scrape_deadline(
-                url=params.get('url', ''),
-                school_id=params.get('school_id'),
-            )
-            return {
-                'source_url': result.source_url,
-                'deadlines_found': result.deadlines_found,
-                'new_deadlines': result.new_deadlines,
-                'success': result.success,
-            }
-
-        elif action == A2AAction.VERIFY_DEADLINE:
-            result = await agent.verify_deadline(
-                deadline_id=params.get('deadline_id', ''),
-            )
-            return result
+    # Appeal Strategist actions
 
-        elif action == A2AAction.SUBSCRIBE_DEADLINE:
-            success = await agent.subscribe_student(
-                student_id=params.get('student_id', ''),
-                deadline_id=params.get('deadline_id', ''),
-            )
-            return {'success': success}
+    @staticmethod
+    async def _handle_analyze_school(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        return await agent.analyze_school(
+            school_id=request.params.get('school_id', ''),
+        )
 
-        elif action == A2AAction.GET_SENTINEL_STATS:
-            return agent.get_stats()
+    @staticmethod
+    async def _handle_get_strategies(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        params = request.params
+        strategies = await agent.get_strategies(
+            school_id=params.get('school_id', ''),
+            context=params.get('context', {}),
+        )
+        return {'strategies': strategies}
+
+    @staticmethod
+    async def _handle_draft_appeal(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        params = DraftAppealParams.from_params(request.params)
+        draft = await agent.draft_appeal(
+            school_id=params.school_id,
+            student_context=params.student_context,
+            strategy_id=params.strategy_id,
+        )
+        return {'draft': draft}
 
-        # Generic actions
-        elif action == A2AAction.HEALTH_CHECK:
-            return {
-                'status': 'healthy',
-                'agent': request.target_agent,
-                'timestamp': datetime.utcnow().isoformat(),
-            }
+    @staticmethod
+    async def _handle_get_success_patterns(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        patterns = await agent.get_success_patterns(
+            school_id=request.params.get('school_id'),
+        )
+        return {'patterns': patterns}
 
-        else:
-            raise ValueError(f"Unknown action: {action}")
+    # Deadline Sentinel actions
+
+    @staticmethod
+    async def _handle_get_deadlines(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        params = request.params
+        deadlines = await agent.get_deadlines(
+            student_id=params.get('student_id'),
+            school_id=params.get('school_id'),
+            include_past=params.get('include_past', False),
+            limit=params.get('limit', 20),
+        )
+        return {
+            'deadlines': [
+                {
+                    'id': d.id,
+                    'name': d.name,
+                    'due_date': d.due_date.isoformat(),
+                    'days_until': d.days_until,
+                    'deadline_type': d.deadline_type.value,
+                    'status': d.status.value,
+                    'school_name': d.school_name,
+                }
+                for d in deadlines
+            ]
+        }
+
+    @staticmethod
+    async def _handle_get_upcoming_deadlines(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        deadlines = await agent.get_upcoming_deadlines(
+            days_ahead=request.params.get('days_ahead', 30),
+        )
+        return {
+            'deadlines': [
+                {
+                    'id': d.id,
+                    'name': d.name,
+                    'due_date': d.due_date.isoformat(),
+                    'days_until': d.days_until,
+                    'deadline_type': d.deadline_type.value,
+                }
+                for d in deadlines
+            ]
+        }
+
+    @staticmethod
+    async def _handle_get_urgent_deadlines(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        deadlines = await agent.get_urgent_deadlines()
+        return {
+            'deadlines': [
+                {
+                    'id': d.id,
+                    'name': d.name,
+                    'due_date': d.due_date.isoformat(),
+                    'days_until': d.days_until,
+                    'deadline_type': d.deadline_type.value,
+                }
+                for d in deadlines
+            ]
+        }
+
+    @staticmethod
+    async def _handle_scrape_deadline(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        params = request.params
+        result = await agent.scrape_deadline(
+            url=params.get('url', ''),
+            school_id=params.get('school_id'),
+        )
+        return {
+            'source_url': result.source_url,
+            'deadlines_found': result.deadlines_found,
+            'new_deadlines': result.new_deadlines,
+            'success': result.success,
+        }
+
+    @staticmethod
+    async def _handle_verify_deadline(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        return await agent.verify_deadline(
+            deadline_id=request.params.get('deadline_id', ''),
+        )
+
+    @staticmethod
+    async def _handle_subscribe_deadline(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        params = request.params
+        success = await agent.subscribe_student(
+            student_id=params.get('student_id', ''),
+            deadline_id=params.get('deadline_id', ''),
+        )
+        return {'success': success}
+
+    # Generic actions
+
+    @staticmethod
+    async def _handle_health_check(agent: Any, request: A2ARequest) -> Dict[str, Any]:
+        return _health_status(request.target_agent)
+
+    # Action -> handler, looked up once per request
+    _HANDLERS: Dict[A2AAction, Callable[[Any, A2ARequest], Awaitable[Dict[str, Any]]]] = {
+        A2AAction.SEARCH_SCHOLARSHIPS: _handle_search_scholarships,
+        A2AAction.GET_MATCHES: _handle_get_matches,
+        A2AAction.VERIFY_SCHOLARSHIP: _handle_verify_scholarship,
+        A2AAction.GET_SCOUT_STATS: _handle_get_stats,
+        A2AAction.ANALYZE_SCHOOL: _handle_analyze_school,
+        A2AAction.GET_STRATEGIES: _handle_get_strategies,
+        A2AAction.DRAFT_APPEAL: _handle_draft_appeal,
+        A2AAction.GET_SUCCESS_PATTERNS: _handle_get_success_patterns,
+        A2AAction.GET_DEADLINES: _handle_get_deadlines,
+        A2AAction.GET_UPCOMING_DEADLINES: _handle_get_upcoming_deadlines,
+        A2AAction.GET_URGENT_DEADLINES: _handle_get_urgent_deadlines,
+        A2AAction.SCRAPE_DEADLINE: _handle_scrape_deadline,
+        A2AAction.VERIFY_DEADLINE: _handle_verify_deadline,
+        A2AAction.SUBSCRIBE_DEADLINE: _handle_subscribe_deadline,
+        A2AAction.GET_SENTINEL_STATS: _handle_get_stats,
+        A2AAction.HEALTH_CHECK: _handle_health_check,
+    }
 
     def get_registered_agents(self) -> List[str]:
         """Get list of registered agent names.
@@ -420,16 +972,35 @@ class A2AProtocol:
     def get_request_history(
         self,
         limit: int = 100,
-    ) -> List[A2ARequest]:
+    ) -> Tuple[A2ARequest, ...]:
         """Get recent request history.
 
         Args:
             limit: Maximum entries to return
 
         Returns:
-            List of recent requests
+            Immutable snapshot of recent requests, oldest first
+        """
+        # Walk back from the newest entry so only `limit` items are visited
+        return tuple(islice(reversed(self._request_history), max(0, limit)))[::-1]
+
+    def get_request_history_iter(
+        self,
+        limit: int = 100,
+    ) -> Iterator[A2ARequest]:
+        """Iterate recent requests without copying them.
+
+        The iterator reads the live history, so consume it before the
+        next request is sent (i.e. without awaiting in between).
+
+        Args:
+            limit: Maximum entries to yield
+
+        Returns:
+            Iterator over recent requests, oldest first
         """
-        return self._request_history[-limit:]
+        start = max(0, len(self._request_history) - max(0, limit))
+        return islice(self._request_history, start, None)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get protocol statistics.
@@ -437,36 +1008,40 @@ class A2AProtocol:
         Returns:
             Stats dict
         """
-        total_requests = len(self._request_history)
-        total_responses = len(self._response_history)
-
-        successful = sum(
-            1 for r in self._response_history
-            if r.status == A2AStatus.COMPLETED
-        )
-        failed = sum(
-            1 for r in self._response_history
-            if r.status == A2AStatus.FAILED
-        )
-
-        avg_time = 0.0
-        if self._response_history:
-            times = [r.processing_time_ms for r in self._response_history if r.processing_time_ms > 0]
-            if times:
-                avg_time = sum(times) / len(times)
+        total_requests = self._total_requests
+        avg_time = self._time_sum_ms / self._time_count if self._time_count else 0.0
 
         return {
             'registered_agents': len(self._agents),
             'agent_names': list(self._agents.keys()),
             'total_requests': total_requests,
-            'successful_requests': successful,
-            'failed_requests': failed,
-            'success_rate': successful / total_requests if total_requests > 0 else 0,
+            'successful_requests': self._completed,
+            'failed_requests': self._failed,
+            'success_rate': self._completed / total_requests if total_requests > 0 else 0,
             'average_processing_time_ms': round(avg_time, 2),
+            'cache_hits': self._cache_hits,
+            'cached_responses': len(self._cache),
         }
 
 
-# Convenience functions for creating requests
+# Convenience functions for creating requests; each is a specialization of
+# A2ARequest.create with the target and action bound once at import
+_create_scholarship_search = partial(
+    A2ARequest.create,
+    target="scholarship_scout",
+    action=A2AAction.SEARCH_SCHOLARSHIPS,
+)
+_create_verify_scholarship = partial(
+    A2ARequest.create,
+    target="scholarship_scout",
+    action=A2AAction.VERIFY_SCHOLARSHIP,
+)
+_create_draft_appeal = partial(
+    A2ARequest.create,
+    target="appeal_strategist",
+    action=A2AAction.DRAFT_APPEAL,
+)
+
 def create_scholarship_search_request(
     source: str,
     query: str,
@@ -484,15 +1059,9 @@ def create_scholarship_search_request(
     Returns:
         A2ARequest
     """
-    return A2ARequest.create(
+    return _create_scholarship_search(
         source=source,
-        target="scholarship_scout",
-        action=A2AAction.SEARCH_SCHOLARSHIPS,
-        params={
-            'query': query,
-            'profile_id': profile_id,
-            'limit': limit,
-        },
+        params=SearchParams(query=query, profile_id=profile_id, limit=limit),
     )
 
 
@@ -509,11 +1078,9 @@ def create_verify_scholarship_request(
     Returns:
         A2ARequest
     """
-    return A2ARequest.create(
+    return _create_verify_scholarship(
         source=source,
-        target="scholarship_scout",
-        action=A2AAction.VERIFY_SCHOLARSHIP,
-        params={'scholarship_id': scholarship_id},
+        params=VerifyScholarshipParams(scholarship_id=scholarship_id),
     )
 
 
@@ -534,13 +1101,11 @@ def create_draft_appeal_request(
     Returns:
         A2ARequest
     """
-    return A2ARequest.create(
+    return _create_draft_appeal(
         source=source,
-        target="appeal_strategist",
-        action=A2AAction.DRAFT_APPEAL,
-        params={
-            'school_id': school_id,
-            'student_context': student_context,
-            'strategy_id': strategy_id,
-        },
+        params=DraftAppealParams(
+            school_id=school_id,
+            student_context=student_context,
+            strategy_id=strategy_id,
+        ),
     )
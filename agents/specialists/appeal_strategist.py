@@ -4,10 +4,18 @@ Agent that analyzes success patterns and drafts financial aid appeals.
 Works with anonymized data from the commons graph.
 """
 
+import asyncio
+import itertools
 import logging
+import re
+import string
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from types import MappingProxyType
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple, Union
 from enum import Enum
 
 from agents.config import (
@@ -19,6 +27,40 @@ from agents.config import (
 
 logger = logging.getLogger(__name__)
 
+# School behaviors cached per agent; entries older than the TTL are
+# refetched so commons updates are eventually picked up
+SCHOOL_BEHAVIOR_CACHE_SIZE = 1024
+SCHOOL_BEHAVIOR_TTL_SECONDS = 3600
+
+# Commons graph queries; every call passes the same string object
+FETCH_SCHOOL_BEHAVIOR_QUERY = """
+MATCH (s:School {id: $id})
+OPTIONAL MATCH (s)-[r:EXHIBITS_BEHAVIOR]->(b:BehaviorType)
+RETURN s, collect({behavior: b, confidence: r.confidence, sample_size: r.sample_size})
+"""
+
+FETCH_SCHOOL_BEHAVIORS_QUERY = """
+UNWIND $ids AS sid
+MATCH (s:School {id: sid})
+OPTIONAL MATCH (s)-[r:EXHIBITS_BEHAVIOR]->(b:BehaviorType)
+RETURN sid, s, collect({behavior: b, confidence: r.confidence, sample_size: r.sample_size})
+"""
+
+SUCCESS_PATTERNS_QUERY = """
+MATCH (s:Strategy)-[r:EFFECTIVE_FOR]->()
+WHERE s.type IN ['appeal', 'negotiation']
+RETURN s, r.success_rate as success_rate, r.sample_size as sample_size
+ORDER BY r.success_rate DESC
+LIMIT 10
+"""
+
+# Behavior pattern keywords, matched in one case-insensitive scan
+BEHAVIOR_KEYWORDS_RE = re.compile(r"negotiat|competing", re.IGNORECASE)
+
+# Success patterns are cached per commons generation; the TTL bounds
+# staleness from writes made outside this process
+SUCCESS_PATTERNS_TTL_SECONDS = 300
+
 
 class StrategyType(Enum):
     """Types of appeal strategies."""
@@ -55,6 +97,11 @@ class SchoolBehavior:
     best_timing: str  # e.g., "within 2 weeks of offer"
     last_updated: datetime = field(default_factory=datetime.utcnow)
 
+    @cached_property
+    def common_argument_values(self) -> Tuple[str, ...]:
+        """Argument type values, converted once per behavior."""
+        return tuple(a.value for a in self.common_arguments)
+
 
 @dataclass
 class AppealStrategy:
@@ -102,8 +149,8 @@ class AppealDraft:
 
 
 # Template components for appeal letters
-APPEAL_TEMPLATES = {
-    StrategyType.COMPETING_OFFER: {
+APPEAL_TEMPLATES = MappingProxyType({
+    StrategyType.COMPETING_OFFER: MappingProxyType({
         "subject": "Financial Aid Appeal - Competing Offer Consideration",
         "opening": (
             "Thank you for the generous financial aid package you have offered me. "
@@ -121,8 +168,8 @@ APPEAL_TEMPLATES = {
             "financial aid package. {school_name} is my first choice, and I hope we can "
             "find a way to make attendance financially feasible for my family."
         ),
-    },
-    StrategyType.CHANGED_CIRCUMSTANCES: {
+    }),
+    StrategyType.CHANGED_CIRCUMSTANCES: MappingProxyType({
         "subject": "Financial Aid Appeal - Change in Family Circumstances",
         "opening": (
             "Thank you for the financial aid package you have offered me. I am writing "
@@ -139,8 +186,8 @@ APPEAL_TEMPLATES = {
             "I respectfully request that you review my financial aid package in light "
             "of our current financial situation."
         ),
-    },
-    StrategyType.MERIT_BASED: {
+    }),
+    StrategyType.MERIT_BASED: MappingProxyType({
         "subject": "Financial Aid Reconsideration Request",
         "opening": (
             "Thank you for admitting me to {school_name}. I am truly honored and excited "
@@ -156,10 +203,104 @@ APPEAL_TEMPLATES = {
             "excellence and my potential contributions to {school_name}. I would be "
             "grateful for any additional merit consideration."
         ),
-    },
+    }),
+})
+
+# Recommendation text by school classification
+RECOMMENDATION_TEMPLATES = {
+    'no_negotiation': (
+        "This school has historically not negotiated financial aid packages. "
+        "Focus on documenting changed circumstances for professional judgment review."
+    ),
+    'good_prospects': (
+        "Good prospects for appeal! This school has a {success_rate:.0%} "
+        "success rate for appeals. Average increase is ${increase_amount:,.0f}."
+    ),
+    'competing_offers': (
+        "This school responds well to competing offers. If you have a better "
+        "offer from a comparable school, include it in your appeal."
+    ),
+    'low_success': (
+        "Appeals are possible but have a {success_rate:.0%} success rate. "
+        "Focus on demonstrating genuine need and strong fit with the school."
+    ),
 }
 
 
+def _recommendation_key(behavior: SchoolBehavior) -> Tuple[str, float, float]:
+    """Classify a school behavior into a recommendation template key."""
+    if not behavior.negotiates:
+        code = 'no_negotiation'
+    elif behavior.success_rate >= 0.4:
+        code = 'good_prospects'
+    elif behavior.responds_to_competing_offers:
+        code = 'competing_offers'
+    else:
+        code = 'low_success'
+    return code, behavior.success_rate, behavior.typical_increase_amount
+
+
+def _format_recommendation(code: str, success_rate: float, increase_amount: float) -> str:
+    """Render a recommendation template."""
+    return RECOMMENDATION_TEMPLATES[code].format(
+        success_rate=success_rate,
+        increase_amount=increase_amount,
+    )
+
+
+# Lookup of strategy type by value, used to resolve strategy IDs
+STRATEGY_BY_VALUE = {t.value: t for t in StrategyType}
+
+# Letter sections that are filled in from the student context
+TEMPLATE_SECTIONS = ('opening', 'body', 'closing')
+
+
+# A section with no fields compiles to its final text
+CompiledTemplate = Union[str, Tuple[Tuple[str, Optional[str]], ...]]
+
+
+def _compile_template(text: str) -> CompiledTemplate:
+    """Split a format string into (literal, field_name) pairs once."""
+    parts = tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in string.Formatter().parse(text)
+    )
+    if all(field_name is None for _, field_name in parts):
+        return "".join(literal for literal, _ in parts)
+    return parts
+
+
+def _render(compiled: CompiledTemplate, values: Dict[str, Any]) -> str:
+    """Render a compiled template without re-parsing the format string."""
+    if isinstance(compiled, str):
+        return compiled
+    return "".join(
+        literal if field_name is None else literal + str(values[field_name])
+        for literal, field_name in compiled
+    )
+
+
+class _CompiledLetter(NamedTuple):
+    """An appeal template with its sections parsed."""
+    subject: str
+    opening: CompiledTemplate
+    body: CompiledTemplate
+    closing: CompiledTemplate
+
+
+# Parsed templates, so drafting does not re-parse them on every call
+_COMPILED_TEMPLATES = MappingProxyType({
+    strategy_type: _CompiledLetter(
+        template['subject'],
+        *(_compile_template(template[section]) for section in TEMPLATE_SECTIONS),
+    )
+    for strategy_type, template in APPEAL_TEMPLATES.items()
+})
+
+# Strategies without their own template use the merit-based one
+_DEFAULT_LETTER = _COMPILED_TEMPLATES[StrategyType.MERIT_BASED]
+
+
 class AppealStrategistAgent:
     """Agent that analyzes success patterns and drafts appeals.
 
@@ -170,6 +311,9 @@ class AppealStrategistAgent:
     - All inputs are anonymized
     """
 
+    # Shared across instances so draft IDs stay unique process-wide
+    _draft_counter = itertools.count(1)
+
     def __init__(
         self,
         config: AgentConfig = None,
@@ -187,10 +331,18 @@ class AppealStrategistAgent:
         self.falkordb = falkordb_client
         self.graphiti = graphiti_client
 
-        # Cache for school behaviors
-        self._school_behaviors: Dict[str, SchoolBehavior] = {}
+        # LRU cache of school behaviors: school_id -> (stored_at, behavior)
+        self._school_behaviors: "OrderedDict[str, Tuple[float, SchoolBehavior]]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Behavior fetches in flight, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
         self._success_patterns: List[SuccessPattern] = []
 
+        # (school_id, generation) -> (stored_at, patterns)
+        self._patterns_cache: Dict[Tuple[Optional[str], Any], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._patterns_generation: Any = None
+
     @property
     def model_name(self) -> str:
         """Get the model name for this agent."""
@@ -208,14 +360,67 @@ class AppealStrategistAgent:
         Returns:
             Analysis results dict
         """
-        # Check cache first
-        if school_id in self._school_behaviors:
-            behavior = self._school_behaviors[school_id]
-        else:
-            behavior = await self._fetch_school_behavior(school_id)
-            if behavior:
-                self._school_behaviors[school_id] = behavior
+        behavior = await self._get_school_behavior(school_id)
+        return self._build_analysis(school_id, behavior)
 
+    async def analyze_schools(
+        self,
+        school_ids: List[str],
+    ) -> List[Dict[str, Any]]:
+        """Analyze several schools, fetching uncached ones in one query.
+
+        Args:
+            school_ids: School IDs to analyze
+
+        Returns:
+            Analysis results dicts, in the order of school_ids
+        """
+        behaviors: Dict[str, Optional[SchoolBehavior]] = {}
+        missing = []
+        for school_id in dict.fromkeys(school_ids):
+            behavior = self._get_cached_behavior(school_id)
+            if behavior is None:
+                missing.append(school_id)
+            behaviors[school_id] = behavior
+
+        if missing:
+            self._cache_misses += len(missing)
+            fetched = await self._fetch_school_behaviors_batch(missing)
+            for school_id, behavior in fetched.items():
+                self._cache_behavior(school_id, behavior)
+                behaviors[school_id] = behavior
+
+        found = [school_id for school_id, behavior in behaviors.items() if behavior]
+        recommendations = dict(zip(
+            found,
+            self.recommend_bulk([behaviors[school_id] for school_id in found]),
+        ))
+
+        return [
+            self._build_analysis(
+                school_id,
+                behaviors[school_id],
+                recommendations.get(school_id),
+            )
+            for school_id in school_ids
+        ]
+
+    def _build_analysis(
+        self,
+        school_id: str,
+        behavior: Optional[SchoolBehavior],
+        recommendation: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the analysis dict for a school.
+
+        Args:
+            school_id: School ID
+            behavior: School behavior, or None if not found
+            recommendation: Precomputed recommendation, if any
+
+        Returns:
+            Analysis results dict
+        """
         if not behavior:
             return {
                 'school_id': school_id,
@@ -233,11 +438,73 @@ class AppealStrategistAgent:
             'typical_increase_amount': behavior.typical_increase_amount,
             'success_rate': behavior.success_rate,
             'sample_size': behavior.sample_size,
-            'common_arguments': [a.value for a in behavior.common_arguments],
+            'common_arguments': behavior.common_argument_values,
             'best_timing': behavior.best_timing,
-            'recommendation': self._generate_recommendation(behavior),
+            'recommendation': recommendation or self._generate_recommendation(behavior),
         }
 
+    def _get_cached_behavior(self, school_id: str) -> Optional[SchoolBehavior]:
+        """Return a cached school behavior, or None if missing/expired."""
+        entry = self._school_behaviors.get(school_id)
+        if entry is None:
+            return None
+
+        stored_at, behavior = entry
+        if time.monotonic() - stored_at > SCHOOL_BEHAVIOR_TTL_SECONDS:
+            del self._school_behaviors[school_id]
+            return None
+
+        self._school_behaviors.move_to_end(school_id)
+        self._cache_hits += 1
+        return behavior
+
+    def _cache_behavior(self, school_id: str, behavior: SchoolBehavior):
+        """Store a school behavior, evicting the least recently used entry."""
+        self._school_behaviors[school_id] = (time.monotonic(), behavior)
+        self._school_behaviors.move_to_end(school_id)
+        while len(self._school_behaviors) > SCHOOL_BEHAVIOR_CACHE_SIZE:
+            self._school_behaviors.popitem(last=False)
+
+    async def _get_school_behavior(
+        self,
+        school_id: str,
+    ) -> Optional[SchoolBehavior]:
+        """Get school behavior from the cache, fetching it on a miss.
+
+        Args:
+            school_id: School ID
+
+        Returns:
+            SchoolBehavior or None
+        """
+        behavior = self._get_cached_behavior(school_id)
+        if behavior is not None:
+            return behavior
+
+        # Share a fetch already in flight for this school; if it fails,
+        # fall through and fetch again
+        while (inflight := self._inflight.get(school_id)) is not None:
+            await asyncio.wait((inflight,))
+            if not inflight.cancelled():
+                self._cache_hits += 1
+                return inflight.result()
+
+        self._cache_misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[school_id] = future
+        try:
+            behavior = await self._fetch_school_behavior(school_id)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[school_id]
+
+        if behavior:
+            self._cache_behavior(school_id, behavior)
+        future.set_result(behavior)
+        return behavior
+
     async def _fetch_school_behavior(
         self,
         school_id: str,
@@ -255,57 +522,104 @@ class AppealStrategistAgent:
 
         try:
             # Query school and its behaviors
-            result = self.falkordb.query(
-                """
-                MATCH (s:School {id: $id})
-                OPTIONAL MATCH (s)-[r:EXHIBITS_BEHAVIOR]->(b:BehaviorType)
-                RETURN s, collect({behavior: b, confidence: r.confidence, sample_size: r.sample_size})
-                """,
-                {'id': school_id}
-            )
+            result = self.falkordb.query(FETCH_SCHOOL_BEHAVIOR_QUERY, {'id': school_id})
 
             if not result.result_set:
                 return None
 
             row = result.result_set[0]
-            school_node = row[0]
-            behaviors_data = row[1] if len(row) > 1 else []
-
-            school_props = school_node.properties
-
-            # Analyze behaviors
-            negotiates = False
-            responds_competing = False
-            common_arguments = []
-
-            for bd in behaviors_data:
-                if bd.get('behavior'):
-                    behavior_props = bd['behavior'].properties
-                    pattern = behavior_props.get('pattern', '')
-
-                    if 'negotiat' in pattern.lower():
-                        negotiates = True
-                    if 'competing' in pattern.lower():
-                        responds_competing = True
-                        common_arguments.append(ArgumentType.COMPETING_OFFERS)
-
-            return SchoolBehavior(
-                school_id=school_id,
-                school_name=school_props.get('name', 'Unknown'),
-                negotiates=negotiates,
-                responds_to_competing_offers=responds_competing,
-                typical_increase_percent=10.0 if negotiates else 0.0,
-                typical_increase_amount=2000.0 if negotiates else 0.0,
-                success_rate=0.35 if negotiates else 0.1,
-                sample_size=50,
-                common_arguments=common_arguments or [ArgumentType.FINANCIAL_HARDSHIP],
-                best_timing="Within 2 weeks of receiving offer",
+            return self._parse_school_behavior(
+                school_id,
+                row[0],
+                row[1] if len(row) > 1 else [],
             )
 
         except Exception as e:
             logger.error(f"Failed to fetch school behavior: {e}")
             return self._get_default_behavior(school_id)
 
+    async def _fetch_school_behaviors_batch(
+        self,
+        school_ids: List[str],
+    ) -> Dict[str, SchoolBehavior]:
+        """Fetch behaviors for several schools in a single commons query.
+
+        Args:
+            school_ids: School IDs
+
+        Returns:
+            Dict of school_id -> SchoolBehavior; schools not in the
+            graph are omitted
+        """
+        if not self.falkordb:
+            return {sid: self._get_default_behavior(sid) for sid in school_ids}
+
+        try:
+            result = self.falkordb.query(FETCH_SCHOOL_BEHAVIORS_QUERY, {'ids': school_ids})
+
+            return {
+                row[0]: self._parse_school_behavior(
+                    row[0],
+                    row[1],
+                    row[2] if len(row) > 2 else [],
+                )
+                for row in result.result_set
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to fetch school behaviors: {e}")
+            return {sid: self._get_default_behavior(sid) for sid in school_ids}
+
+    def _parse_school_behavior(
+        self,
+        school_id: str,
+        school_node: Any,
+        behaviors_data: List[Dict[str, Any]],
+    ) -> SchoolBehavior:
+        """Build a SchoolBehavior from a school node and its behaviors.
+
+        Args:
+            school_id: School ID
+            school_node: School node from the commons graph
+            behaviors_data: Collected behavior/confidence/sample_size maps
+
+        Returns:
+            SchoolBehavior
+        """
+        school_props = school_node.properties
+
+        # Analyze behaviors
+        negotiates = False
+        responds_competing = False
+        common_arguments = []
+
+        for bd in behaviors_data:
+            if bd.get('behavior'):
+                behavior_props = bd['behavior'].properties
+                keywords = {
+                    keyword.lower()
+                    for keyword in BEHAVIOR_KEYWORDS_RE.findall(behavior_props.get('pattern', ''))
+                }
+
+                if 'negotiat' in keywords:
+                    negotiates = True
+                if 'competing' in keywords:
+                    responds_competing = True
+                    common_arguments.append(ArgumentType.COMPETING_OFFERS)
+
+        return SchoolBehavior(
+            school_id=school_id,
+            school_name=school_props.get('name', 'Unknown'),
+            negotiates=negotiates,
+            responds_to_competing_offers=responds_competing,
+            typical_increase_percent=10.0 if negotiates else 0.0,
+            typical_increase_amount=2000.0 if negotiates else 0.0,
+            success_rate=0.35 if negotiates else 0.1,
+            sample_size=50,
+            common_arguments=common_arguments or [ArgumentType.FINANCIAL_HARDSHIP],
+            best_timing="Within 2 weeks of receiving offer",
+        )
+
     def _get_default_behavior(self, school_id: str) -> SchoolBehavior:
         """Get default behavior for unknown schools.
 
@@ -340,28 +654,29 @@ class AppealStrategistAgent:
         Returns:
             Recommendation string
         """
-        if not behavior.negotiates:
-            return (
-                "This school has historically not negotiated financial aid packages. "
-                "Focus on documenting changed circumstances for professional judgment review."
-            )
+        return _format_recommendation(*_recommendation_key(behavior))
 
-        if behavior.success_rate >= 0.4:
-            return (
-                f"Good prospects for appeal! This school has a {behavior.success_rate:.0%} "
-                f"success rate for appeals. Average increase is ${behavior.typical_increase_amount:,.0f}."
-            )
+    def recommend_bulk(self, behaviors: List[SchoolBehavior]) -> List[str]:
+        """Generate recommendations for many schools in one pass.
 
-        if behavior.responds_to_competing_offers:
-            return (
-                "This school responds well to competing offers. If you have a better "
-                "offer from a comparable school, include it in your appeal."
-            )
+        Schools that classify the same way with the same figures share a
+        single formatted string.
 
-        return (
-            f"Appeals are possible but have a {behavior.success_rate:.0%} success rate. "
-            "Focus on demonstrating genuine need and strong fit with the school."
-        )
+        Args:
+            behaviors: School behavior data
+
+        Returns:
+            Recommendation strings, in the order of behaviors
+        """
+        formatted: Dict[Tuple[str, float, float], str] = {}
+        recommendations = []
+        for behavior in behaviors:
+            key = _recommendation_key(behavior)
+            text = formatted.get(key)
+            if text is None:
+                text = formatted[key] = _format_recommendation(*key)
+            recommendations.append(text)
+        return recommendations
 
     async def get_strategies(
         self,
@@ -380,9 +695,7 @@ class AppealStrategistAgent:
         context = context or {}
 
         # Get school behavior
-        behavior = self._school_behaviors.get(school_id)
-        if not behavior:
-            behavior = await self._fetch_school_behavior(school_id)
+        behavior = await self._get_school_behavior(school_id)
 
         strategies = []
 
@@ -476,35 +789,33 @@ class AppealStrategistAgent:
         Returns:
             Draft letter dict
         """
-        # Determine strategy type
-        if strategy_id and 'competing' in strategy_id:
-            strategy_type = StrategyType.COMPETING_OFFER
-        elif strategy_id and 'changed' in strategy_id:
-            strategy_type = StrategyType.CHANGED_CIRCUMSTANCES
-        elif strategy_id and 'merit' in strategy_id:
-            strategy_type = StrategyType.MERIT_BASED
-        elif student_context.get('has_competing_offer'):
-            strategy_type = StrategyType.COMPETING_OFFER
-        elif student_context.get('changed_circumstances'):
-            strategy_type = StrategyType.CHANGED_CIRCUMSTANCES
-        else:
-            strategy_type = StrategyType.NEED_BASED
+        # Determine strategy type. IDs from get_strategies are "<type>_<n>",
+        # but A2A callers may also pass a bare type value
+        strategy_type = None
+        if strategy_id:
+            strategy_type = (
+                STRATEGY_BY_VALUE.get(strategy_id)
+                or STRATEGY_BY_VALUE.get(strategy_id.rsplit('_', 1)[0])
+            )
+        if strategy_type is None:
+            if student_context.get('has_competing_offer'):
+                strategy_type = StrategyType.COMPETING_OFFER
+            elif student_context.get('changed_circumstances'):
+                strategy_type = StrategyType.CHANGED_CIRCUMSTANCES
+            else:
+                strategy_type = StrategyType.NEED_BASED
 
         # Get template
-        template = APPEAL_TEMPLATES.get(strategy_type, APPEAL_TEMPLATES[StrategyType.MERIT_BASED])
+        letter = _COMPILED_TEMPLATES.get(strategy_type, _DEFAULT_LETTER)
 
         # Get school name
         school_name = student_context.get('school_name', 'your institution')
 
         # Build draft
-        subject = template['subject']
-
-        opening = template['opening'].format(
-            school_name=school_name,
-        )
+        subject = letter.subject
 
-        # Customize body based on context
-        body_vars = {
+        # Customize sections based on context
+        template_vars = {
             'school_name': school_name,
             'competing_school': student_context.get('competing_school', '[Competing School]'),
             'competing_amount': student_context.get('competing_amount', '[Amount]'),
@@ -512,13 +823,13 @@ class AppealStrategistAgent:
             'new_achievements': student_context.get('new_achievements', '[describe achievements]'),
         }
 
-        body = template['body'].format(**body_vars)
-
-        closing = template['closing'].format(school_name=school_name)
+        opening = _render(letter.opening, template_vars)
+        body = _render(letter.body, template_vars)
+        closing = _render(letter.closing, template_vars)
 
         # Compose full draft
         draft = AppealDraft(
-            draft_id=f"draft_{school_id}_{datetime.now().timestamp()}",
+            draft_id=f"draft_{school_id}_{next(self._draft_counter)}",
             school_id=school_id,
             strategy_used=strategy_type,
             subject_line=subject,
@@ -529,7 +840,7 @@ class AppealStrategistAgent:
             signature_block="Sincerely,\n[Your Name]\n[Student ID]",
             key_points_addressed=[strategy_type.value],
             tone="professional and respectful",
-            word_count=len(f"{opening} {body} {closing}".split()),
+            word_count=len(opening.split()) + len(body.split()) + len(closing.split()),
         )
 
         return {
@@ -551,24 +862,14 @@ class AppealStrategistAgent:
         Returns:
             Full letter text
         """
-        paragraphs = [
+        # Paragraphs are separated by a blank line
+        return "\n\n".join((
             draft.greeting,
-            "",
             draft.opening,
-            "",
-        ]
-
-        for para in draft.body_paragraphs:
-            paragraphs.append(para)
-            paragraphs.append("")
-
-        paragraphs.extend([
+            *draft.body_paragraphs,
             draft.closing,
-            "",
             draft.signature_block,
-        ])
-
-        return "\n".join(paragraphs)
+        ))
 
     def _get_submission_tips(self, strategy_type: StrategyType) -> List[str]:
         """Get tips for submitting the appeal.
@@ -612,31 +913,23 @@ class AppealStrategistAgent:
 
         # Query commons for outcome data
         if self.falkordb:
-            try:
-                query = """
-                MATCH (s:Strategy)-[r:EFFECTIVE_FOR]->()
-                WHERE s.type IN ['appeal', 'negotiation']
-                RETURN s, r.success_rate as success_rate, r.sample_size as sample_size
-                ORDER BY r.success_rate DESC
-                LIMIT 10
-                """
-
-                result = self.falkordb.query(query)
-
-                for row in result.result_set:
-                    strategy_node = row[0]
-                    props = strategy_node.properties
-
-                    patterns.append({
-                        'pattern_id': props.get('id', ''),
-                        'type': props.get('type', ''),
-                        'description': props.get('description', ''),
-                        'success_rate': row[1] if len(row) > 1 else 0,
-                        'sample_size': row[2] if len(row) > 2 else 0,
-                    })
-
-            except Exception as e:
-                logger.warning(f"Could not fetch patterns from commons: {e}")
+            # Writers bump the client's generation; drop results cached
+            # against an older one
+            generation = getattr(self.falkordb, 'generation', 0)
+            if generation != self._patterns_generation:
+                self._patterns_cache.clear()
+                self._patterns_generation = generation
+
+            key = (school_id, generation)
+            entry = self._patterns_cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= SUCCESS_PATTERNS_TTL_SECONDS:
+                patterns = [dict(p) for p in entry[1]]
+            else:
+                try:
+                    patterns = self._query_success_patterns()
+                    self._patterns_cache[key] = (time.monotonic(), [dict(p) for p in patterns])
+                except Exception as e:
+                    logger.warning(f"Could not fetch patterns from commons: {e}")
 
         # Add default patterns if none found
         if not patterns:
@@ -669,6 +962,29 @@ class AppealStrategistAgent:
 
         return patterns
 
+    def _query_success_patterns(self) -> List[Dict[str, Any]]:
+        """Query the commons graph for the most effective appeal strategies.
+
+        Returns:
+            List of success patterns, best first
+        """
+        result = self.falkordb.query(SUCCESS_PATTERNS_QUERY)
+
+        patterns = []
+        for row in result.result_set:
+            strategy_node = row[0]
+            props = strategy_node.properties
+
+            patterns.append({
+                'pattern_id': props.get('id', ''),
+                'type': props.get('type', ''),
+                'description': props.get('description', ''),
+                'success_rate': row[1] if len(row) > 1 else 0,
+                'sample_size': row[2] if len(row) > 2 else 0,
+            })
+
+        return patterns
+
     def get_stats(self) -> Dict[str, Any]:
         """Get strategist statistics.
 
@@ -677,6 +993,8 @@ class AppealStrategistAgent:
         """
         return {
             'schools_analyzed': len(self._school_behaviors),
+            'cache_hits': self._cache_hits,
+            'cache_misses': self._cache_misses,
             'patterns_loaded': len(self._success_patterns),
             'strategies_available': len(StrategyType),
             'templates_available': len(APPEAL_TEMPLATES),
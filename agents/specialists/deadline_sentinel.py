@@ -4,12 +4,21 @@ Background agent that proactively monitors and scrapes deadlines.
 Tracks FAFSA, school-specific, and scholarship deadlines with verification.
 """
 
+import hashlib
+import json
 import logging
 import asyncio
+import os
+import re
+import time
+from bisect import bisect_left, insort
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Any, Optional, Set
+from typing import Iterator, List, Dict, Any, Optional, Set, Tuple
 from enum import Enum
+from itertools import islice
 
 from agents.config import (
     deadline_sentinel_config,
@@ -18,8 +27,82 @@ from agents.config import (
     get_model_name,
 )
 
+# msgpack is optional; snapshots fall back to stdlib json
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 logger = logging.getLogger(__name__)
 
+# Today's date, recomputed only once the local day rolls over:
+# (next local midnight as epoch seconds, today, today's ordinal)
+_today_cache: Tuple[float, date, int] = (0.0, date.min, date.min.toordinal())
+
+
+def _today_state() -> Tuple[float, date, int]:
+    """Return the cached day, refreshing it after local midnight."""
+    global _today_cache
+    if time.time() >= _today_cache[0]:
+        today = date.today()
+        next_midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _today_cache = (next_midnight.timestamp(), today, today.toordinal())
+    return _today_cache
+
+
+def _today() -> date:
+    """Today's local date, without a localtime call on every access."""
+    return _today_state()[1]
+
+
+def _today_ordinal() -> int:
+    """Today's local date as a proleptic Gregorian ordinal."""
+    return _today_state()[2]
+
+
+def _status_for(days_until: int) -> Tuple["DeadlineStatus", Optional[int]]:
+    """Status of a deadline due in `days_until` days.
+
+    Returns:
+        (status, days from today until the status next changes), with
+        None for the latter once the deadline has passed
+    """
+    if days_until < 0:
+        return DeadlineStatus.PASSED, None
+    if days_until <= 1:
+        return DeadlineStatus.URGENT, days_until + 1
+    if days_until <= 7:
+        return DeadlineStatus.DUE_SOON, days_until - 1
+    return DeadlineStatus.UPCOMING, days_until - 7
+
+
+# Detected changes kept for notification; older ones are dropped
+CHANGE_HISTORY_SIZE = 10_000
+
+# Pages at least this long are parsed in worker processes so extraction
+# doesn't stall the event loop; shorter ones aren't worth the IPC
+PARSE_IN_POOL_MIN_CHARS = 16 * 1024
+
+# (ETag, Last-Modified, paragraph fingerprint) identifying a fetched page
+PageValidators = Tuple[Optional[str], Optional[str], Tuple[bytes, ...]]
+
+# Recent scrape results kept for stats; older ones are dropped
+SCRAPE_HISTORY_SIZE = 100
+
+# Portal scrapes run concurrently, up to this many at a time
+MAX_CONCURRENT_SCRAPES = 8
+SCRAPE_TIMEOUT_SECONDS = 10.0
+
+# Verification results are reused for this long unless forced; the oldest
+# tenth is dropped once the cache holds more than VERIFY_CACHE_SIZE entries
+VERIFY_CACHE_TTL_SECONDS = 300
+VERIFY_CACHE_SIZE = 1000
+
+# Conventional location for the warm-start snapshot of tracked deadlines
+DEFAULT_SNAPSHOT_PATH = os.path.expanduser("~/.cache/grant_getter/deadlines.mp")
+SNAPSHOT_VERSION = 1
+_EPOCH = datetime(1970, 1, 1)
+
 
 class DeadlineType(Enum):
     """Types of deadlines tracked."""
@@ -33,6 +116,155 @@ class DeadlineType(Enum):
     OTHER = "other"
 
 
+# Lookup from stored type string to DeadlineType, avoiding enum value
+# resolution (and its ValueError) for every scraped node
+_DEADLINE_TYPE_MAP = {t.value: t for t in DeadlineType}
+
+
+def _parse_due_date(value: str) -> date:
+    """Parse a commons due date in %Y-%m-%d form.
+
+    Zero-padded dates, the common case, are parsed in C by
+    date.fromisoformat. Anything else goes through strptime, so dates
+    that aren't zero-padded ("2025-3-1") are still accepted and ISO basic
+    format ("20250301") is still rejected.
+
+    Raises:
+        ValueError: If the value is not a %Y-%m-%d date
+    """
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+_MARKUP_RE = re.compile(r'<(script|style)\b.*?</\1\s*>|<[^>]+>', re.IGNORECASE | re.DOTALL)
+
+# Date formats seen on portals, compiled once into a single alternation so
+# each line is scanned in one pass: 2031-01-15, 1/15/31, January 15, 2031
+_DATE_RE = re.compile(
+    r'\b(?:'
+    r'(?P<iso_y>\d{4})-(?P<iso_m>\d{1,2})-(?P<iso_d>\d{1,2})'
+    r'|(?P<us_m>\d{1,2})/(?P<us_d>\d{1,2})/(?P<us_y>\d{4}|\d{2})'
+    r'|(?P<mon>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?'
+    r'\s+(?P<mon_d>\d{1,2})(?:st|nd|rd|th)?,?\s+(?P<mon_y>\d{4})'
+    r')\b',
+    re.IGNORECASE,
+)
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun",
+         "jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1,
+    )
+}
+
+
+def _match_date(match: re.Match) -> Optional[date]:
+    """Date for a _DATE_RE match, or None if it is not a real date."""
+    if match.group('iso_y'):
+        year, month, day = match.group('iso_y', 'iso_m', 'iso_d')
+    elif match.group('us_y'):
+        month, day, year = match.group('us_m', 'us_d', 'us_y')
+        if len(year) == 2:
+            year = f"20{year}"
+    else:
+        month = _MONTHS[match.group('mon').lower()]
+        day, year = match.group('mon_d', 'mon_y')
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+# First matching keyword in a line decides the deadline type
+_PAGE_TYPE_KEYWORDS = (
+    ("css", DeadlineType.CSS_PROFILE),
+    ("fafsa", DeadlineType.FAFSA),
+    ("priority", DeadlineType.SCHOOL_PRIORITY),
+    ("scholarship", DeadlineType.SCHOLARSHIP),
+    ("verification", DeadlineType.VERIFICATION),
+    ("appeal", DeadlineType.APPEAL),
+)
+
+
+def _page_paragraphs(html: str) -> List[str]:
+    """Visible text blocks of a page, whitespace-collapsed.
+
+    Scripts, styles and tags are dropped, so markup-only edits leave the
+    paragraphs (and the page fingerprint) unchanged.
+    """
+    text = _MARKUP_RE.sub("\n", html)
+    paragraphs = []
+    for raw_line in text.splitlines():
+        line = " ".join(raw_line.split())
+        if line:
+            paragraphs.append(line)
+    return paragraphs
+
+
+def _fingerprint(paragraphs: List[str]) -> Tuple[bytes, ...]:
+    """Per-paragraph digests identifying a page's content."""
+    return tuple(
+        hashlib.blake2b(p.encode(), digest_size=8).digest() for p in paragraphs
+    )
+
+
+def _parse_deadline_html(html: str, school_id: str) -> List[Dict[str, Any]]:
+    """Extract deadlines from a portal page.
+
+    Args:
+        html: Page body
+        school_id: School the page belongs to
+
+    Returns:
+        Deadline property dicts, in page order
+    """
+    return _parse_deadline_paragraphs(_page_paragraphs(html), school_id)
+
+
+def _parse_deadline_paragraphs(
+    paragraphs: List[str],
+    school_id: str,
+) -> List[Dict[str, Any]]:
+    """Extract deadlines from a page's paragraphs.
+
+    Runs in worker processes for large pages, so it is a module-level
+    function returning plain dicts shaped like Deadline node properties.
+
+    Args:
+        paragraphs: Output of _page_paragraphs
+        school_id: School the page belongs to
+
+    Returns:
+        Deadline property dicts, in page order
+    """
+    deadlines = []
+    seen: Dict[str, int] = defaultdict(int)
+    for line in paragraphs:
+        lowered = line.lower()
+        deadline_type = next(
+            (t for keyword, t in _PAGE_TYPE_KEYWORDS if keyword in lowered),
+            DeadlineType.OTHER,
+        )
+        for match in _DATE_RE.finditer(line):
+            due_date = _match_date(match)
+            if due_date is None:
+                continue
+            # Stable ids per type, so a moved date reads as an update
+            seen[deadline_type.value] += 1
+            count = seen[deadline_type.value]
+            deadline_id = f"{school_id}_{deadline_type.value}"
+            if count > 1:
+                deadline_id = f"{deadline_id}_{count}"
+            deadlines.append({
+                'id': deadline_id,
+                'name': line[:200],
+                'type': deadline_type.value,
+                'due_date': due_date.isoformat(),
+            })
+    return deadlines
+
+
 class DeadlineStatus(Enum):
     """Status of a deadline."""
     UPCOMING = "upcoming"
@@ -51,7 +283,7 @@ class SourceReliability(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeadlineEntry:
     """A tracked deadline."""
     id: str
@@ -64,23 +296,28 @@ class DeadlineEntry:
     source_url: Optional[str] = None
     source_reliability: SourceReliability = SourceReliability.UNKNOWN
     status: DeadlineStatus = DeadlineStatus.UPCOMING
-    student_ids: List[str] = field(default_factory=list)
+    student_ids: Set[str] = field(default_factory=set)
     last_verified: Optional[datetime] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Accept any iterable of subscribers, e.g. a list from an API call
+        if not isinstance(self.student_ids, set):
+            self.student_ids = set(self.student_ids)
+
     @property
     def days_until(self) -> int:
         """Get days until deadline."""
-        return (self.due_date - date.today()).days
+        return self.due_date.toordinal() - _today_ordinal()
 
     @property
     def is_past(self) -> bool:
         """Check if deadline has passed."""
-        return self.days_until < 0
+        return self.due_date.toordinal() < _today_ordinal()
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeResult:
     """Result from scraping a deadline source."""
     source_url: str
@@ -90,9 +327,10 @@ class ScrapeResult:
     scraped_at: datetime = field(default_factory=datetime.utcnow)
     errors: List[str] = field(default_factory=list)
     success: bool = True
+    unchanged: bool = False  # Page not modified since the last scrape
 
 
-@dataclass
+@dataclass(slots=True)
 class DeadlineChange:
     """A detected change in a deadline."""
     deadline_id: str
@@ -103,6 +341,98 @@ class DeadlineChange:
     notified: bool = False
 
 
+def _to_epoch_us(value: Optional[datetime]) -> Optional[int]:
+    """Naive UTC datetime to epoch microseconds."""
+    if value is None:
+        return None
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_epoch_us(value: Optional[int]) -> Optional[datetime]:
+    """Epoch microseconds to a naive UTC datetime."""
+    if value is None:
+        return None
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _to_ordinal(value: Optional[date]) -> Optional[int]:
+    """Date to a proleptic Gregorian ordinal."""
+    return value.toordinal() if value is not None else None
+
+
+def _from_ordinal(value: Optional[int]) -> Optional[date]:
+    """Proleptic Gregorian ordinal to a date."""
+    return date.fromordinal(value) if value is not None else None
+
+
+def _serialize_entry(entry: DeadlineEntry) -> tuple:
+    """Flatten a DeadlineEntry to primitives for a snapshot."""
+    return (
+        entry.id,
+        entry.deadline_type.value,
+        entry.name,
+        entry.due_date.toordinal(),
+        entry.school_id,
+        entry.school_name,
+        entry.description,
+        entry.source_url,
+        entry.source_reliability.value,
+        entry.status.value,
+        sorted(entry.student_ids),
+        _to_epoch_us(entry.last_verified),
+        _to_epoch_us(entry.created_at),
+        entry.metadata,
+    )
+
+
+def _deserialize_entry(row: List[Any]) -> DeadlineEntry:
+    """Rebuild a DeadlineEntry from _serialize_entry output."""
+    (deadline_id, deadline_type, name, due_ord, school_id, school_name,
+     description, source_url, reliability, status, student_ids,
+     last_verified, created_at, metadata) = row
+    return DeadlineEntry(
+        id=deadline_id,
+        deadline_type=DeadlineType(deadline_type),
+        name=name,
+        due_date=date.fromordinal(due_ord),
+        school_id=school_id,
+        school_name=school_name,
+        description=description,
+        source_url=source_url,
+        source_reliability=SourceReliability(reliability),
+        status=DeadlineStatus(status),
+        student_ids=set(student_ids),
+        last_verified=_from_epoch_us(last_verified),
+        created_at=_from_epoch_us(created_at),
+        metadata=dict(metadata),
+    )
+
+
+def _serialize_change(change: DeadlineChange) -> tuple:
+    """Flatten a DeadlineChange to primitives for a snapshot."""
+    return (
+        change.deadline_id,
+        change.change_type,
+        _to_ordinal(change.old_date),
+        _to_ordinal(change.new_date),
+        _to_epoch_us(change.detected_at),
+        change.notified,
+    )
+
+
+def _deserialize_change(row: List[Any]) -> DeadlineChange:
+    """Rebuild a DeadlineChange from _serialize_change output."""
+    deadline_id, change_type, old_ord, new_ord, detected_at, notified = row
+    return DeadlineChange(
+        deadline_id=deadline_id,
+        change_type=change_type,
+        old_date=_from_ordinal(old_ord),
+        new_date=_from_ordinal(new_ord),
+        detected_at=_from_epoch_us(detected_at),
+        notified=notified,
+    )
+
+
 # Known FAFSA deadlines (federal)
 FAFSA_DEADLINES = {
     "fafsa_open": {
@@ -144,6 +474,8 @@ class DeadlineSentinelAgent:
         config: AgentConfig = None,
         falkordb_client=None,
         graphiti_client=None,
+        http_client=None,
+        snapshot_path: Optional[str] = None,
     ):
         """Initialize the deadline sentinel agent.
 
@@ -151,19 +483,37 @@ class DeadlineSentinelAgent:
             config: Agent configuration
             falkordb_client: FalkorDB client for deadline storage
             graphiti_client: Graphiti client for student associations
+            http_client: Optional pooled async HTTP client (e.g. httpx)
+                used to fetch portal pages; pages are not fetched without one
+            snapshot_path: File to warm-start deadlines from and snapshot
+                them to (e.g. DEFAULT_SNAPSHOT_PATH); None disables snapshots
         """
         self.config = config or deadline_sentinel_config
         self.falkordb = falkordb_client
         self.graphiti = graphiti_client
-
-        # Deadline state
+        self._http_client = http_client
+        # url -> (ETag, Last-Modified, paragraph fingerprint) from the last
+        # fetch whose deadlines were stored
+        self._etag_cache: Dict[str, PageValidators] = {}
+        self._snapshot_path = snapshot_path
+        self._scrape_slots = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+        # Deadline state, indexed by due date, school and type
         self._deadlines: Dict[str, DeadlineEntry] = {}
-        self._changes: List[DeadlineChange] = []
-        self._scrape_history: List[ScrapeResult] = []
+        self._by_date: List[Tuple[date, str]] = []  # sorted (due_date, id)
+        self._by_school: Dict[str, Set[str]] = defaultdict(set)
+        self._by_type: Dict[DeadlineType, Set[str]] = defaultdict(set)
+        self._changes: deque[DeadlineChange] = deque(maxlen=CHANGE_HISTORY_SIZE)
+        self._scrape_history: deque[ScrapeResult] = deque(maxlen=SCRAPE_HISTORY_SIZE)
+        self._status_tasks: Dict[str, asyncio.Task] = {}
+        # deadline_id -> (monotonic time verified, verification result)
+        self._verify_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
         # Scheduling state
         self._is_running = False
         self._last_scrape: Optional[datetime] = None
+        self._last_scrape_per_url: Dict[str, datetime] = {}
         self._scrape_interval_hours = 24
 
         # Initialize FAFSA deadlines
@@ -176,7 +526,7 @@ class DeadlineSentinelAgent:
 
     def _initialize_fafsa_deadlines(self):
         """Initialize known FAFSA deadlines."""
-        today = date.today()
+        today = _today()
         current_year = today.year
 
         # Determine academic year (FAFSA opens Oct 1 for next academic year)
@@ -207,82 +557,332 @@ class DeadlineSentinelAgent:
             )
 
             # Set status based on date
-            if entry.is_past:
-                entry.status = DeadlineStatus.PASSED
-            elif entry.days_until <= 1:
-                entry.status = DeadlineStatus.URGENT
-            elif entry.days_until <= 7:
-                entry.status = DeadlineStatus.DUE_SOON
+            entry.status = _status_for(entry.days_until)[0]
+
+            self._store_deadline(entry)
+
+    def _store_deadline(self, deadline: DeadlineEntry):
+        """Add or replace a deadline, keeping the indexes in sync.
+
+        Args:
+            deadline: Deadline entry to store
+        """
+        existing = self._deadlines.get(deadline.id)
+        if existing is not None:
+            self._unindex_deadline(existing)
+            self._verify_cache.pop(deadline.id, None)
+
+        self._deadlines[deadline.id] = deadline
+        insort(self._by_date, (deadline.due_date, deadline.id))
+        if deadline.school_id:
+            self._by_school[deadline.school_id].add(deadline.id)
+        self._by_type[deadline.deadline_type].add(deadline.id)
+        self._schedule_status(deadline)
+
+    def _schedule_status(self, deadline: DeadlineEntry):
+        """(Re)start the task that moves a deadline through its statuses.
+
+        Tasks only run while the sentinel is started; start() schedules
+        every deadline stored before then.
+
+        Args:
+            deadline: Deadline whose status should track its due date
+        """
+        task = self._status_tasks.pop(deadline.id, None)
+        if task is not None:
+            task.cancel()
+        if self._is_running and deadline.status != DeadlineStatus.COMPLETED:
+            self._status_tasks[deadline.id] = asyncio.create_task(
+                self._track_status(deadline)
+            )
+
+    async def _track_status(self, deadline: DeadlineEntry):
+        """Update a deadline's status at each boundary until it passes.
+
+        Sleeps until the local midnight on which the status next changes
+        (7 days out, 1 day out, then past due) instead of polling.
+
+        Args:
+            deadline: Deadline to track
+        """
+        try:
+            while deadline.status != DeadlineStatus.COMPLETED:
+                status, days_to_change = _status_for(deadline.days_until)
+                deadline.status = status
+                if days_to_change is None:
+                    break
+                change_at = datetime.combine(
+                    _today() + timedelta(days=days_to_change), datetime.min.time()
+                )
+                await asyncio.sleep(max(change_at.timestamp() - time.time(), 0))
+        finally:
+            if self._status_tasks.get(deadline.id) is asyncio.current_task():
+                del self._status_tasks[deadline.id]
+
+    def _unindex_deadline(self, deadline: DeadlineEntry):
+        """Remove a deadline from the date, school and type indexes."""
+        key = (deadline.due_date, deadline.id)
+        index = bisect_left(self._by_date, key)
+        if index < len(self._by_date) and self._by_date[index] == key:
+            del self._by_date[index]
+
+        if deadline.school_id:
+            school_ids = self._by_school[deadline.school_id]
+            school_ids.discard(deadline.id)
+            if not school_ids:
+                del self._by_school[deadline.school_id]
+
+        type_ids = self._by_type[deadline.deadline_type]
+        type_ids.discard(deadline.id)
+        if not type_ids:
+            del self._by_type[deadline.deadline_type]
+
+    def _date_position(self, day: date) -> int:
+        """Index of the first deadline due on or after a day."""
+        return bisect_left(self._by_date, (day,))
+
+    def _iter_by_date(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Iterator[DeadlineEntry]:
+        """Iterate deadlines due within [start, end], earliest first.
+
+        Args:
+            start: First due date to include (None for no lower bound)
+            end: Last due date to include (None for no upper bound)
+
+        Yields:
+            DeadlineEntry objects in due-date order
+        """
+        lo = self._date_position(start) if start is not None else 0
+        hi = self._date_position(end + timedelta(days=1)) if end is not None else len(self._by_date)
+        for index in range(lo, hi):
+            yield self._deadlines[self._by_date[index][1]]
 
-            self._deadlines[deadline_id] = entry
+    def bind_http_client(self, http_client):
+        """Use a shared HTTP client, e.g. the A2A protocol's pool.
+
+        Args:
+            http_client: Async HTTP client owned by the caller
+        """
+        self._http_client = http_client
 
     async def start(self):
-        """Start the sentinel agent."""
+        """Start the sentinel agent, restoring the last snapshot if any."""
+        self.load_snapshot()
         self._is_running = True
+        for deadline in self._deadlines.values():
+            self._schedule_status(deadline)
         logger.info("Deadline Sentinel Agent started")
 
     async def stop(self):
-        """Stop the sentinel agent."""
+        """Stop the sentinel agent and snapshot its deadlines."""
         self._is_running = False
+        tasks = list(self._status_tasks.values())
+        self._status_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+        self.save_snapshot()
         logger.info("Deadline Sentinel Agent stopped")
 
-    async def run_scrape_cycle(self) -> List[ScrapeResult]:
-        """Run a complete scrape cycle across all sources.
+    def save_snapshot(self) -> bool:
+        """Write deadlines and change history to the snapshot file.
+
+        The file is replaced atomically, so a crash mid-write leaves the
+        previous snapshot intact.
+
+        Returns:
+            True if a snapshot was written
+        """
+        if not self._snapshot_path:
+            return False
+
+        payload = {
+            'version': SNAPSHOT_VERSION,
+            'deadlines': [_serialize_entry(e) for e in self._deadlines.values()],
+            'changes': [_serialize_change(c) for c in self._changes],
+        }
+        if msgpack is not None:
+            data = msgpack.packb(payload, default=str)
+        else:
+            data = json.dumps(payload, default=str, separators=(',', ':')).encode()
+
+        tmp_path = f"{self._snapshot_path}.tmp"
+        try:
+            directory = os.path.dirname(self._snapshot_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._snapshot_path)
+        except OSError as e:
+            logger.warning(f"Failed to write deadline snapshot: {e}")
+            return False
+        return True
+
+    def load_snapshot(self) -> bool:
+        """Restore deadlines and change history from the snapshot file.
+
+        The snapshot's change history replaces the one in memory, so a
+        restart in the same process doesn't record changes twice.
+
+        Returns:
+            True if a snapshot was loaded
+        """
+        if not self._snapshot_path or not os.path.exists(self._snapshot_path):
+            return False
+
+        try:
+            with open(self._snapshot_path, 'rb') as f:
+                data = f.read()
+            if data[:1] == b'{':
+                payload = json.loads(data)
+            elif msgpack is not None:
+                payload = msgpack.unpackb(data)
+            else:
+                logger.warning("Deadline snapshot is msgpack but msgpack is not installed")
+                return False
+
+            if payload.get('version') != SNAPSHOT_VERSION:
+                logger.warning("Ignoring deadline snapshot with unknown version")
+                return False
+            deadlines = [_deserialize_entry(row) for row in payload['deadlines']]
+            changes = [_deserialize_change(row) for row in payload['changes']]
+        except Exception as e:
+            logger.warning(f"Failed to load deadline snapshot: {e}")
+            return False
+
+        for entry in deadlines:
+            self._store_deadline(entry)
+        self._changes.clear()
+        self._changes.extend(changes)
+        logger.info(f"Restored {len(deadlines)} deadlines from snapshot")
+        return True
+
+    async def run_scrape_cycle(self, force: bool = False) -> List[ScrapeResult]:
+        """Run a scrape cycle across all sources.
+
+        Portals scraped successfully within the scrape interval are skipped
+        unless forced.
+
+        Args:
+            force: Scrape every portal regardless of when it was last scraped
 
         Returns:
-            List of ScrapeResult objects
+            List of ScrapeResult objects for the portals scraped
         """
         if not self._is_running:
             logger.warning("Sentinel not running, skipping scrape")
             return []
 
-        results = []
+        # One timestamp for everything recorded during the cycle
+        now = datetime.utcnow()
 
-        # Scrape each school portal
-        for school_id, url in SCHOOL_PORTAL_PATTERNS.items():
-            result = await self._scrape_school(school_id, url)
-            results.append(result)
+        # Look up every school's deadlines in one query, then scrape every
+        # school portal concurrently
+        if force:
+            portals = list(SCHOOL_PORTAL_PATTERNS.items())
+        else:
+            due_before = now - timedelta(hours=self._scrape_interval_hours)
+            portals = [
+                (school_id, url)
+                for school_id, url in SCHOOL_PORTAL_PATTERNS.items()
+                if self._last_scrape_per_url.get(url, datetime.min) <= due_before
+            ]
+        discovered = await self._discover_all_from_falkordb(
+            [school_id for school_id, _ in portals], now
+        )
+        outcomes = await asyncio.gather(
+            *(
+                self._scrape_school(school_id, url, discovered.get(school_id, []), now)
+                for school_id, url in portals
+            ),
+            return_exceptions=True,
+        )
 
-        self._last_scrape = datetime.utcnow()
-        self._scrape_history.extend(results)
+        results = []
+        for (school_id, url), outcome in zip(portals, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Scrape failed for {school_id}: {outcome}")
+                outcome = ScrapeResult(
+                    source_url=url,
+                    deadlines_found=0,
+                    new_deadlines=0,
+                    updated_deadlines=0,
+                    scraped_at=now,
+                    errors=[str(outcome)],
+                    success=False,
+                )
+            if outcome.success:
+                self._last_scrape_per_url[url] = now
+            results.append(outcome)
 
-        # Keep only recent history
-        if len(self._scrape_history) > 100:
-            self._scrape_history = self._scrape_history[-100:]
+        self._last_scrape = now
+        self._scrape_history.extend(results)
 
+        self.save_snapshot()
         return results
 
     async def _scrape_school(
         self,
         school_id: str,
         url: str,
+        deadlines: Optional[List[DeadlineEntry]] = None,
+        now: Optional[datetime] = None,
     ) -> ScrapeResult:
         """Scrape deadlines from a school's financial aid page.
 
         Args:
             school_id: School identifier
             url: URL to scrape
+            deadlines: Deadlines already discovered for the school; looked
+                up in FalkorDB when omitted
+            now: Timestamp for the scrape (UTC); defaults to the current time
 
         Returns:
             ScrapeResult
         """
         logger.info(f"Scraping deadlines from {school_id}...")
+        if now is None:
+            now = datetime.utcnow()
 
         try:
-            # In production, this would:
-            # 1. Fetch the URL
-            # 2. Parse HTML for deadline information
-            # 3. Extract dates using NLP/patterns
-            # For now, simulate with FalkorDB data
-
-            deadlines = await self._discover_from_falkordb(school_id)
+            # Fetch and discovery share the I/O slots; parsing happens after
+            # the slot is released. An unchanged page only skips parsing;
+            # FalkorDB deadlines are still stored.
+            page = None
+            validators = None
+            unchanged = False
+            async with self._scrape_slots:
+                if self._http_client is not None:
+                    page, validators = await self._fetch_page(url)
+                    unchanged = page is None
+
+                if deadlines is None:
+                    deadlines = await self._discover_from_falkordb(school_id, now)
+
+            if page:
+                parsed = await self._parse_page(page, school_id)
+                deadlines = deadlines + [
+                    entry
+                    for entry in (
+                        self._entry_from_props(school_id, {**props, 'url': url}, now)
+                        for props in parsed
+                    )
+                    if entry is not None
+                ]
 
             new_count = 0
             updated_count = 0
 
             for deadline in deadlines:
                 if deadline.id not in self._deadlines:
-                    self._deadlines[deadline.id] = deadline
+                    self._store_deadline(deadline)
                     new_count += 1
 
                     # Record change
@@ -290,6 +890,7 @@ class DeadlineSentinelAgent:
                         deadline_id=deadline.id,
                         change_type="new",
                         new_date=deadline.due_date,
+                        detected_at=now,
                     ))
                 else:
                     existing = self._deadlines[deadline.id]
@@ -300,15 +901,23 @@ class DeadlineSentinelAgent:
                             change_type="updated",
                             old_date=existing.due_date,
                             new_date=deadline.due_date,
+                            detected_at=now,
                         ))
-                        self._deadlines[deadline.id] = deadline
+                        self._store_deadline(deadline)
                         updated_count += 1
 
+            # Only remember the page once its deadlines are stored, so a
+            # failed parse is retried on the next cycle
+            if validators is not None:
+                self._etag_cache[url] = validators
+
             return ScrapeResult(
                 source_url=url,
                 deadlines_found=len(deadlines),
                 new_deadlines=new_count,
                 updated_deadlines=updated_count,
+                scraped_at=now,
+                unchanged=unchanged,
             )
 
         except Exception as e:
@@ -318,18 +927,102 @@ class DeadlineSentinelAgent:
                 deadlines_found=0,
                 new_deadlines=0,
                 updated_deadlines=0,
+                scraped_at=now,
                 errors=[str(e)],
                 success=False,
             )
 
+    async def _fetch_page(
+        self,
+        url: str,
+    ) -> Tuple[Optional[List[str]], Optional[PageValidators]]:
+        """Fetch a page through the shared HTTP client.
+
+        Sends the previous response's validators so an unmodified page can
+        be answered with 304. For servers that ignore conditional requests,
+        the page's paragraph fingerprint is compared with the last one, so
+        changes to markup, scripts or whitespace alone don't count.
+
+        The new validators are returned rather than cached; the caller
+        records them in _etag_cache once the page has been processed.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            (paragraphs, validators): paragraphs is None if the content is
+            unchanged since the last processed fetch; validators is None
+            when the server answered 304
+
+        Raises:
+            Exception: If the request fails or returns an error status
+        """
+        cached = self._etag_cache.get(url)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = await self._http_client.get(
+            url, headers=headers, timeout=SCRAPE_TIMEOUT_SECONDS
+        )
+        if cached is not None and response.status_code == 304:
+            return None, None
+        response.raise_for_status()
+
+        paragraphs = _page_paragraphs(response.text)
+        fingerprint = _fingerprint(paragraphs)
+        validators = (
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            fingerprint,
+        )
+        if cached is not None:
+            if cached[2] == fingerprint:
+                return None, validators
+            changed = len(set(fingerprint).difference(cached[2]))
+            logger.debug(f"{url}: {changed} of {len(paragraphs)} paragraphs changed")
+        return paragraphs, validators
+
+    async def _parse_page(
+        self,
+        paragraphs: List[str],
+        school_id: str,
+    ) -> List[Dict[str, Any]]:
+        """Extract deadline properties from a page, off-loop if it is large.
+
+        The whole page is always parsed, since ids are numbered in page order.
+
+        Args:
+            paragraphs: The page's paragraphs
+            school_id: School the page belongs to
+
+        Returns:
+            Deadline property dicts
+        """
+        if sum(map(len, paragraphs)) < PARSE_IN_POOL_MIN_CHARS:
+            return _parse_deadline_paragraphs(paragraphs, school_id)
+
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._parse_pool, _parse_deadline_paragraphs, paragraphs, school_id
+        )
+
     async def _discover_from_falkordb(
         self,
         school_id: str,
+        now: Optional[datetime] = None,
     ) -> List[DeadlineEntry]:
         """Discover deadlines from FalkorDB.
 
         Args:
             school_id: School identifier
+            now: Verification timestamp (UTC); defaults to the current time
 
         Returns:
             List of deadline entries
@@ -347,43 +1040,12 @@ class DeadlineSentinelAgent:
                 {'school_id': school_id}
             )
 
+            now = now or datetime.utcnow()
             deadlines = []
             for row in result.result_set:
-                node = row[0]
-                props = node.properties
-
-                # Parse due date
-                due_date_val = props.get('due_date')
-                if isinstance(due_date_val, str):
-                    try:
-                        due_date = datetime.strptime(due_date_val, "%Y-%m-%d").date()
-                    except ValueError:
-                        continue
-                elif isinstance(due_date_val, date):
-                    due_date = due_date_val
-                else:
-                    continue
-
-                # Determine deadline type
-                deadline_type_str = props.get('type', 'other').lower()
-                try:
-                    deadline_type = DeadlineType(deadline_type_str)
-                except ValueError:
-                    deadline_type = DeadlineType.OTHER
-
-                entry = DeadlineEntry(
-                    id=props.get('id', ''),
-                    deadline_type=deadline_type,
-                    name=props.get('name', ''),
-                    due_date=due_date,
-                    school_id=school_id,
-                    school_name=props.get('school_name', school_id.title()),
-                    description=props.get('description', ''),
-                    source_url=props.get('url'),
-                    source_reliability=SourceReliability.SCRAPED,
-                    last_verified=datetime.utcnow(),
-                )
-                deadlines.append(entry)
+                entry = self._parse_deadline_node(school_id, row[0], now)
+                if entry is not None:
+                    deadlines.append(entry)
 
             return deadlines
 
@@ -391,6 +1053,112 @@ class DeadlineSentinelAgent:
             logger.error(f"FalkorDB query failed: {e}")
             return []
 
+    async def _discover_all_from_falkordb(
+        self,
+        school_ids: List[str],
+        now: Optional[datetime] = None,
+    ) -> Dict[str, List[DeadlineEntry]]:
+        """Discover deadlines for several schools in a single query.
+
+        Args:
+            school_ids: School identifiers
+            now: Verification timestamp (UTC); defaults to the current time
+
+        Returns:
+            Dict of school_id -> deadline entries; schools without
+            deadlines are omitted
+        """
+        if not self.falkordb or not school_ids:
+            return {}
+
+        try:
+            result = self.falkordb.query(
+                """
+                UNWIND $ids AS sid
+                MATCH (s:School {id: sid})-[:HAS_DEADLINE]->(d:Deadline)
+                RETURN sid, d
+                """,
+                {'ids': school_ids}
+            )
+
+            now = now or datetime.utcnow()
+            deadlines: Dict[str, List[DeadlineEntry]] = defaultdict(list)
+            for row in result.result_set:
+                school_id = row[0]
+                entry = self._parse_deadline_node(school_id, row[1], now)
+                if entry is not None:
+                    deadlines[school_id].append(entry)
+
+            return dict(deadlines)
+
+        except Exception as e:
+            logger.error(f"FalkorDB query failed: {e}")
+            return {}
+
+    def _parse_deadline_node(
+        self,
+        school_id: str,
+        node: Any,
+        now: Optional[datetime] = None,
+    ) -> Optional[DeadlineEntry]:
+        """Build a DeadlineEntry from a Deadline node.
+
+        Args:
+            school_id: School the deadline belongs to
+            node: Deadline node from FalkorDB
+            now: Verification timestamp (UTC); defaults to the current time
+
+        Returns:
+            DeadlineEntry, or None if the node has no usable due date
+        """
+        return self._entry_from_props(school_id, node.properties, now)
+
+    def _entry_from_props(
+        self,
+        school_id: str,
+        props: Dict[str, Any],
+        now: Optional[datetime] = None,
+    ) -> Optional[DeadlineEntry]:
+        """Build a DeadlineEntry from Deadline properties.
+
+        Args:
+            school_id: School the deadline belongs to
+            props: Node properties, or the same shape parsed from a page
+            now: Verification timestamp (UTC); defaults to the current time
+
+        Returns:
+            DeadlineEntry, or None if there is no usable due date
+        """
+        # Parse due date
+        due_date_val = props.get('due_date')
+        if isinstance(due_date_val, str):
+            try:
+                due_date = _parse_due_date(due_date_val)
+            except ValueError:
+                return None
+        elif isinstance(due_date_val, date):
+            due_date = due_date_val
+        else:
+            return None
+
+        # Determine deadline type
+        deadline_type = _DEADLINE_TYPE_MAP.get(
+            props.get('type', 'other').lower(), DeadlineType.OTHER
+        )
+
+        return DeadlineEntry(
+            id=props.get('id', ''),
+            deadline_type=deadline_type,
+            name=props.get('name', ''),
+            due_date=due_date,
+            school_id=school_id,
+            school_name=props.get('school_name', school_id.title()),
+            description=props.get('description', ''),
+            source_url=props.get('url'),
+            source_reliability=SourceReliability.SCRAPED,
+            last_verified=now or datetime.utcnow(),
+        )
+
     async def add_deadline(
         self,
         deadline: DeadlineEntry,
@@ -403,7 +1171,7 @@ class DeadlineSentinelAgent:
         Returns:
             True if successful
         """
-        self._deadlines[deadline.id] = deadline
+        self._store_deadline(deadline)
 
         # Store in Graphiti for temporal tracking
         if self.graphiti:
@@ -422,15 +1190,28 @@ class DeadlineSentinelAgent:
     async def verify_deadline(
         self,
         deadline_id: str,
+        force: bool = False,
     ) -> Dict[str, Any]:
         """Verify a deadline is still accurate.
 
+        Results are reused for VERIFY_CACHE_TTL_SECONDS, or until the
+        deadline is replaced.
+
         Args:
             deadline_id: ID of deadline to verify
+            force: Verify again even if a recent result is cached
 
         Returns:
             Verification result dict
         """
+        cached = self._verify_cache.get(deadline_id)
+        if (
+            cached is not None
+            and not force
+            and time.monotonic() - cached[0] < VERIFY_CACHE_TTL_SECONDS
+        ):
+            return dict(cached[1])
+
         deadline = self._deadlines.get(deadline_id)
         if not deadline:
             return {
@@ -443,7 +1224,7 @@ class DeadlineSentinelAgent:
         # For now, mark as verified
         deadline.last_verified = datetime.utcnow()
 
-        return {
+        result = {
             "deadline_id": deadline_id,
             "found": True,
             "name": deadline.name,
@@ -454,6 +1235,17 @@ class DeadlineSentinelAgent:
             "last_verified": deadline.last_verified.isoformat(),
             "verified": True,
         }
+        self._cache_verification(deadline_id, result)
+        return dict(result)
+
+    def _cache_verification(self, deadline_id: str, result: Dict[str, Any]):
+        """Store a verification result, trimming the oldest when full."""
+        self._verify_cache.pop(deadline_id, None)
+        self._verify_cache[deadline_id] = (time.monotonic(), result)
+        if len(self._verify_cache) > VERIFY_CACHE_SIZE:
+            stale = list(islice(self._verify_cache, VERIFY_CACHE_SIZE // 10))
+            for key in stale:
+                del self._verify_cache[key]
 
     # =========================================================================
     # A2A Query Interface (for Ambassador)
@@ -479,19 +1271,22 @@ class DeadlineSentinelAgent:
         Returns:
             List of DeadlineEntry objects
         """
-        results = []
-
-        for deadline in self._deadlines.values():
-            # Filter by past
-            if not include_past and deadline.is_past:
-                continue
+        # Narrow by the school and type indexes, then walk the date index
+        # so results come out sorted and the scan stops at the limit
+        candidates: Optional[Set[str]] = None
+        if school_id:
+            candidates = self._by_school.get(school_id, set())
+        if deadline_type:
+            type_ids = self._by_type.get(deadline_type, set())
+            candidates = type_ids if candidates is None else candidates & type_ids
 
-            # Filter by school
-            if school_id and deadline.school_id != school_id:
-                continue
+        results = []
+        if limit <= 0 or candidates is not None and not candidates:
+            return results
 
-            # Filter by type
-            if deadline_type and deadline.deadline_type != deadline_type:
+        start = None if include_past else _today()
+        for deadline in self._iter_by_date(start):
+            if candidates is not None and deadline.id not in candidates:
                 continue
 
             # Filter by student
@@ -501,11 +1296,10 @@ class DeadlineSentinelAgent:
                 pass
 
             results.append(deadline)
+            if len(results) >= limit:
+                break
 
-        # Sort by due date
-        results.sort(key=lambda x: x.due_date)
-
-        return results[:limit]
+        return results
 
     async def get_upcoming_deadlines(
         self,
@@ -519,16 +1313,8 @@ class DeadlineSentinelAgent:
         Returns:
             List of upcoming DeadlineEntry objects
         """
-        cutoff = date.today() + timedelta(days=days_ahead)
-        today = date.today()
-
-        results = []
-        for deadline in self._deadlines.values():
-            if today <= deadline.due_date <= cutoff:
-                results.append(deadline)
-
-        results.sort(key=lambda x: x.due_date)
-        return results
+        today = _today()
+        return list(self._iter_by_date(today, today + timedelta(days=days_ahead)))
 
     async def get_urgent_deadlines(self) -> List[DeadlineEntry]:
         """Get deadlines that are urgent (within 7 days).
@@ -536,13 +1322,8 @@ class DeadlineSentinelAgent:
         Returns:
             List of urgent DeadlineEntry objects
         """
-        results = []
-        for deadline in self._deadlines.values():
-            if not deadline.is_past and deadline.days_until <= 7:
-                results.append(deadline)
-
-        results.sort(key=lambda x: x.due_date)
-        return results
+        today = _today()
+        return list(self._iter_by_date(today, today + timedelta(days=7)))
 
     async def scrape_deadline(
         self,
@@ -578,8 +1359,7 @@ class DeadlineSentinelAgent:
         if not deadline:
             return False
 
-        if student_id not in deadline.student_ids:
-            deadline.student_ids.append(student_id)
+        deadline.student_ids.add(student_id)
 
         return True
 
@@ -601,8 +1381,7 @@ class DeadlineSentinelAgent:
         if not deadline:
             return False
 
-        if student_id in deadline.student_ids:
-            deadline.student_ids.remove(student_id)
+        deadline.student_ids.discard(student_id)
 
         return True
 
@@ -620,14 +1399,17 @@ class DeadlineSentinelAgent:
         Returns:
             List of DeadlineChange objects
         """
+        # Changes are appended as they are detected, so walk back from the
+        # newest and stop at the first one older than `since`
         results = []
-        for change in self._changes:
+        for change in reversed(self._changes):
             if since and change.detected_at < since:
-                continue
+                break
             if unnotified_only and change.notified:
                 continue
             results.append(change)
 
+        results.reverse()
         return results
 
     def mark_changes_notified(self, change_ids: List[str]):
@@ -636,8 +1418,9 @@ class DeadlineSentinelAgent:
         Args:
             change_ids: IDs of changes to mark
         """
+        change_ids = set(change_ids)
         for change in self._changes:
-            if change.deadline_id in change_ids:
+            if not change.notified and change.deadline_id in change_ids:
                 change.notified = True
 
     def get_stats(self) -> Dict[str, Any]:
@@ -646,17 +1429,18 @@ class DeadlineSentinelAgent:
         Returns:
             Stats dict
         """
-        today = date.today()
+        today = _today()
 
+        # Counts come from the indexes rather than a scan of every deadline
         total = len(self._deadlines)
-        upcoming = sum(1 for d in self._deadlines.values() if not d.is_past)
-        urgent = sum(1 for d in self._deadlines.values() if not d.is_past and d.days_until <= 7)
-        past = sum(1 for d in self._deadlines.values() if d.is_past)
+        past = self._date_position(today)
+        upcoming = total - past
+        urgent = self._date_position(today + timedelta(days=8)) - past
 
-        by_type = {}
-        for deadline in self._deadlines.values():
-            key = deadline.deadline_type.value
-            by_type[key] = by_type.get(key, 0) + 1
+        by_type = {
+            deadline_type.value: len(ids)
+            for deadline_type, ids in self._by_type.items()
+        }
 
         unnotified_changes = sum(1 for c in self._changes if not c.notified)
 
@@ -5,8 +5,13 @@ Parses award letters, transcripts, and validates completeness.
 CRITICAL: No document content ever leaves the device.
 """
 
+import asyncio
 import logging
+import math
 import re
+from array import array
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from typing import List, Dict, Any, Optional, Tuple
@@ -21,6 +26,62 @@ from agents.config import (
 
 logger = logging.getLogger(__name__)
 
+# Number of recent analyses kept for get_stats()
+ANALYSIS_HISTORY_SIZE = 50
+
+# Most conditions reported per award letter
+MAX_CONDITIONS = 5
+
+# Field extraction patterns, compiled once at import
+# The 'amount' group excludes the dollar sign
+_MONEY_PATTERN = re.compile(r'\$(?P<amount>[\d,]+(?:\.\d{2})?)')
+_DATE_PATTERN = re.compile(
+    r'(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4})|'
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}'
+)
+_ACADEMIC_YEAR_PATTERN = re.compile(r'20\d{2}[-–]20\d{2}')
+
+# The second school pattern only starts at the beginning of a run of word
+# and space characters. Any later start in the same run finds the same
+# name or nothing, so skipping them turns a quadratic search into a
+# linear one without changing the match.
+_SCHOOL_PATTERNS = [
+    re.compile(r'((?:University|College|Institute|School)\s+of\s+[\w\s]+)', re.I),
+    re.compile(r'((?<![\w\s])[\w\s]+(?:University|College|Institute))', re.I),
+]
+
+_EFC_PATTERN = re.compile(r'(?:EFC|Expected Family Contribution)[:\s]*\$?([\d,]+)', re.I)
+
+_CONDITION_PATTERNS = [
+    re.compile(r'(?:must|required to|condition)[:\s]+([\w\s,]+)', re.I),
+    re.compile(r'(?:maintain|keep)[:\s]+(?:a\s+)?(\d+\.\d+)\s+GPA', re.I),
+    re.compile(r'full[- ]time\s+enrollment\s+required', re.I),
+]
+
+_GPA_PATTERNS = [
+    re.compile(r'(?:cumulative|overall)\s+GPA[:\s]+(\d+\.\d{1,2})', re.I),
+    re.compile(r'GPA[:\s]+(\d+\.\d{1,2})\s*/\s*(\d+\.\d{1,2})', re.I),
+    re.compile(r'(\d+\.\d{1,2})\s+(?:out of|/)\s+(\d+\.\d{1,2})', re.I),
+]
+
+_EARNED_CREDITS = re.compile(r'(?:credits?\s+earned|earned\s+credits?)[:\s]+(\d+(?:\.\d)?)', re.I)
+_ATTEMPTED_CREDITS = re.compile(r'(?:credits?\s+attempted|attempted\s+credits?)[:\s]+(\d+(?:\.\d)?)', re.I)
+
+# Simple course pattern: SUBJ ### or similar. The whitespace before the
+# number is possessive and the optional credit/grade tails are atomic, so a
+# failed attempt never backtracks through long runs of transcript text.
+_COURSE_PATTERN = re.compile(
+    r'([A-Z]{2,4})\s*+(\d{3,4})\s+(.+?)'
+    r'(?>\s+(\d+(?:\.\d)?)\s*(?:cr|credits?)?)?'
+    r'(?>\s+([A-F][+-]?))?',
+    re.I,
+)
+
+_STANDING_PATTERNS = [
+    re.compile(r"(?:academic\s+standing|standing)[:\s]+([\w\s]+)", re.I),
+    re.compile(r"(good\s+standing|probation|dean'?s?\s+list)", re.I),
+]
+
 
 class DocumentType(Enum):
     """Types of documents we can analyze."""
@@ -51,7 +112,7 @@ class CompletionStatus(Enum):
     INVALID = "invalid"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedField:
     """An extracted field from a document."""
     name: str
@@ -88,6 +149,7 @@ class AwardLetterData:
     net_cost: Optional[float] = None
     total_gift_aid: Optional[float] = None
     total_self_help: Optional[float] = None
+    total_loans: Optional[float] = None
 
     # Metadata
     deadline: Optional[date] = None
@@ -100,8 +162,8 @@ class AwardLetterData:
         self.total_gift_aid = sum(self.grants.values()) + sum(self.scholarships.values())
 
         # Total self-help (loans + work study)
-        loan_total = sum(self.loans.values())
-        self.total_self_help = loan_total + (self.work_study or 0)
+        self.total_loans = sum(self.loans.values())
+        self.total_self_help = self.total_loans + (self.work_study or 0)
 
         # Net cost
         if self.total_cost and self.total_aid:
@@ -135,7 +197,7 @@ class TranscriptData:
     advanced_courses: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentAnalysisResult:
     """Result of analyzing a document."""
     document_type: DocumentType
@@ -162,6 +224,89 @@ TRANSCRIPT_REQUIRED_FIELDS = [
     'credits_earned',
 ]
 
+# Award letter labels (lowercase), tried in order for each amount
+COST_LABELS = ['cost of attendance', 'total cost', 'coa']
+TUITION_LABELS = ['tuition']
+ROOM_BOARD_LABELS = ['room', 'board', 'housing']
+TOTAL_AID_LABELS = ['total aid', 'total financial aid', 'total package']
+WORK_STUDY_LABELS = ['work study', 'work-study']
+
+GRANT_LABELS = {
+    'pell': ['pell grant', 'federal pell'],
+    'seog': ['seog', 'supplemental educational'],
+    'state': ['state grant', 'cal grant', 'tap'],
+    'institutional': ['institutional grant', 'university grant', 'need-based grant'],
+}
+
+SCHOLARSHIP_LABELS = {
+    'merit': ['merit scholarship', 'academic scholarship'],
+    'athletic': ['athletic scholarship'],
+    'outside': ['outside scholarship', 'external scholarship'],
+}
+
+LOAN_LABELS = {
+    'subsidized': ['subsidized loan', 'direct subsidized'],
+    'unsubsidized': ['unsubsidized loan', 'direct unsubsidized'],
+    'plus': ['plus loan', 'parent plus', 'parent loan'],
+    'perkins': ['perkins loan'],
+}
+
+# Content keywords for document type detection, in priority order
+AWARD_KEYWORDS = ['cost of attendance', 'financial aid award', 'grants', 'loans', 'net cost']
+TRANSCRIPT_KEYWORDS = ['transcript', 'cumulative gpa', 'credits earned', 'course', 'grade']
+SAR_KEYWORDS = ['student aid report', 'expected family contribution', 'efc']
+
+# Honors (lowercase) and how they are reported
+HONOR_KEYWORDS = ['dean\'s list', 'honor roll', 'cum laude', 'magna cum laude', 'summa cum laude', 'honors']
+_HONOR_TITLES = [(keyword, keyword.title()) for keyword in HONOR_KEYWORDS]
+
+STEM_KEYWORDS = ['math', 'science', 'physics', 'chemistry', 'biology', 'computer', 'engineering', 'calculus', 'statistics']
+
+
+def _keyword_alternation(keywords: List[str]) -> str:
+    """Regex alternation of literal keywords, longest first."""
+    return '|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+
+
+# All detection keywords in one case-insensitive scan; the lookahead tries
+# every position so overlapping keywords are not hidden by each other
+_DOCUMENT_KEYWORDS_RE = re.compile(
+    '(?=(?P<award>{})|(?P<transcript>{})|(?P<sar>{}))'.format(
+        _keyword_alternation(AWARD_KEYWORDS),
+        _keyword_alternation(TRANSCRIPT_KEYWORDS),
+        _keyword_alternation(SAR_KEYWORDS),
+    ),
+    re.I,
+)
+_STEM_KEYWORDS_RE = re.compile(_keyword_alternation(STEM_KEYWORDS), re.I)
+
+AWARD_LABELS = sorted(
+    {
+        label
+        for labels in (
+            COST_LABELS, TUITION_LABELS, ROOM_BOARD_LABELS,
+            TOTAL_AID_LABELS, WORK_STUDY_LABELS,
+            *GRANT_LABELS.values(), *SCHOLARSHIP_LABELS.values(), *LOAN_LABELS.values(),
+        )
+        for label in labels
+    },
+    key=len,
+    reverse=True,
+)
+
+# Every award letter label in one scan. The lookahead matches at each
+# position, so overlapping labels ("federal pell grant") are all seen;
+# longest labels are listed first, and shorter labels that prefix the
+# match are credited from _LABEL_PREFIXES.
+_LABEL_SCANNER = re.compile(
+    '(?=(' + '|'.join(re.escape(label) for label in AWARD_LABELS) + '))',
+    re.I,
+)
+_LABEL_PREFIXES = {
+    label: [other for other in AWARD_LABELS if other != label and label.startswith(other)]
+    for label in AWARD_LABELS
+}
+
 
 class DocumentAnalystAgent:
     """On-device agent for analyzing sensitive documents.
@@ -188,36 +333,15 @@ class DocumentAnalystAgent:
         self.config = config or document_analyst_config
 
         # Analysis history (in-memory only)
-        self._analysis_history: List[DocumentAnalysisResult] = []
-
-        # Pattern matchers for field extraction
-        self._init_patterns()
+        self._analysis_history: deque[DocumentAnalysisResult] = deque(
+            maxlen=ANALYSIS_HISTORY_SIZE
+        )
 
     @property
     def model_name(self) -> str:
         """Get the model name for this agent."""
         return get_model_name(self.config.model)
 
-    def _init_patterns(self):
-        """Initialize regex patterns for field extraction."""
-        # Money patterns
-        self._money_pattern = re.compile(r'\$[\d,]+(?:\.\d{2})?')
-
-        # GPA patterns
-        self._gpa_pattern = re.compile(r'(\d+\.\d{1,2})\s*(?:/\s*(\d+\.\d{1,2}))?')
-
-        # Date patterns
-        self._date_pattern = re.compile(
-            r'(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4})|'
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}'
-        )
-
-        # Academic year pattern
-        self._academic_year_pattern = re.compile(r'20\d{2}[-–]20\d{2}')
-
-        # Credit patterns
-        self._credit_pattern = re.compile(r'(\d+(?:\.\d)?)\s*(?:credits?|hours?|units?)', re.I)
-
     async def analyze_document(
         self,
         content: str,
@@ -237,28 +361,59 @@ class DocumentAnalystAgent:
         Returns:
             DocumentAnalysisResult
         """
+        result = self._analyze(content, document_type, filename)
+
+        # Store in history (bounded by the deque's maxlen)
+        self._analysis_history.append(result)
+
+        return result
+
+    async def analyze_documents(
+        self,
+        documents: List[Tuple[str, Optional[DocumentType], Optional[str]]],
+    ) -> List[DocumentAnalysisResult]:
+        """Analyze a batch of documents, e.g. a folder of uploads.
+
+        The whole batch runs in one call on the default executor, so the
+        event loop stays responsive and is not rescheduled per document.
+        Everything still runs on-device.
+
+        Args:
+            documents: (content, document_type, filename) triples, with
+                the same meaning as the analyze_document arguments
+
+        Returns:
+            One DocumentAnalysisResult per document, in input order
+        """
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            None,
+            lambda: [self._analyze(*document) for document in documents],
+        )
+        self._analysis_history.extend(results)
+        return results
+
+    def _analyze(
+        self,
+        content: str,
+        document_type: Optional[DocumentType],
+        filename: Optional[str],
+    ) -> DocumentAnalysisResult:
+        """Detect the document type if needed and run its analyzer."""
         # Auto-detect document type if not specified
         if document_type is None:
             document_type = self._detect_document_type(content, filename)
 
-        # Route to appropriate analyzer
+        # Route to appropriate analyzer. Analysis is CPU-only, so the
+        # analyzers are plain functions. Case-insensitive substring checks
+        # share one lowercased copy of the document.
         if document_type == DocumentType.AWARD_LETTER:
-            result = await self._analyze_award_letter(content)
-        elif document_type == DocumentType.TRANSCRIPT:
-            result = await self._analyze_transcript(content)
-        elif document_type == DocumentType.SAR:
-            result = await self._analyze_sar(content)
-        else:
-            result = await self._analyze_generic(content, document_type)
-
-        # Store in history
-        self._analysis_history.append(result)
-
-        # Keep history bounded
-        if len(self._analysis_history) > 50:
-            self._analysis_history = self._analysis_history[-50:]
-
-        return result
+            return self._analyze_award_letter(content)
+        if document_type == DocumentType.TRANSCRIPT:
+            return self._analyze_transcript(content, content.lower())
+        if document_type == DocumentType.SAR:
+            return self._analyze_sar(content, content.lower())
+        return self._analyze_generic(content, document_type)
 
     def _detect_document_type(
         self,
@@ -274,8 +429,6 @@ class DocumentAnalystAgent:
         Returns:
             Detected DocumentType
         """
-        content_lower = content.lower()
-
         # Check filename first
         if filename:
             filename_lower = filename.lower()
@@ -286,22 +439,22 @@ class DocumentAnalystAgent:
             if 'sar' in filename_lower:
                 return DocumentType.SAR
 
-        # Content-based detection
-        award_keywords = ['cost of attendance', 'financial aid award', 'grants', 'loans', 'net cost']
-        if any(kw in content_lower for kw in award_keywords):
-            return DocumentType.AWARD_LETTER
+        # Content-based detection: one scan for every keyword, stopping as
+        # soon as an award keyword (the highest priority) is seen
+        found = set()
+        for match in _DOCUMENT_KEYWORDS_RE.finditer(content):
+            if match.lastgroup == 'award':
+                return DocumentType.AWARD_LETTER
+            found.add(match.lastgroup)
 
-        transcript_keywords = ['transcript', 'cumulative gpa', 'credits earned', 'course', 'grade']
-        if any(kw in content_lower for kw in transcript_keywords):
+        if 'transcript' in found:
             return DocumentType.TRANSCRIPT
-
-        sar_keywords = ['student aid report', 'expected family contribution', 'efc']
-        if any(kw in content_lower for kw in sar_keywords):
+        if 'sar' in found:
             return DocumentType.SAR
 
         return DocumentType.OTHER
 
-    async def _analyze_award_letter(
+    def _analyze_award_letter(
         self,
         content: str,
     ) -> DocumentAnalysisResult:
@@ -332,7 +485,7 @@ class DocumentAnalystAgent:
             missing_fields.append('school_name')
 
         # Extract academic year
-        year_match = self._academic_year_pattern.search(content)
+        year_match = _ACADEMIC_YEAR_PATTERN.search(content)
         if year_match:
             data.academic_year = year_match.group()
             extracted_fields.append(ExtractedField(
@@ -343,11 +496,12 @@ class DocumentAnalystAgent:
         else:
             missing_fields.append('academic_year')
 
-        # Extract monetary values
+        # Extract monetary values, and the value following each label
         money_extractions = self._extract_money_values(content)
+        label_values = self._find_label_values(content, money_extractions)
 
         # Cost of Attendance
-        coa_value = self._find_value_near_label(content, ['cost of attendance', 'total cost', 'coa'], money_extractions)
+        coa_value = self._find_value_near_label(COST_LABELS, label_values)
         if coa_value:
             data.total_cost = coa_value
             extracted_fields.append(ExtractedField(name='total_cost', value=coa_value, confidence=0.85))
@@ -355,19 +509,19 @@ class DocumentAnalystAgent:
             missing_fields.append('total_cost')
 
         # Tuition
-        tuition = self._find_value_near_label(content, ['tuition'], money_extractions)
+        tuition = self._find_value_near_label(TUITION_LABELS, label_values)
         if tuition:
             data.tuition = tuition
             extracted_fields.append(ExtractedField(name='tuition', value=tuition, confidence=0.8))
 
         # Room & Board
-        room_board = self._find_value_near_label(content, ['room', 'board', 'housing'], money_extractions)
+        room_board = self._find_value_near_label(ROOM_BOARD_LABELS, label_values)
         if room_board:
             data.room_board = room_board
             extracted_fields.append(ExtractedField(name='room_board', value=room_board, confidence=0.75))
 
         # Total Aid
-        total_aid = self._find_value_near_label(content, ['total aid', 'total financial aid', 'total package'], money_extractions)
+        total_aid = self._find_value_near_label(TOTAL_AID_LABELS, label_values)
         if total_aid:
             data.total_aid = total_aid
             extracted_fields.append(ExtractedField(name='total_aid', value=total_aid, confidence=0.85))
@@ -375,24 +529,24 @@ class DocumentAnalystAgent:
             missing_fields.append('total_aid')
 
         # Extract grants (Pell, State, Institutional)
-        data.grants = self._extract_grants(content, money_extractions)
+        data.grants = self._extract_grants(label_values)
         for name, value in data.grants.items():
             extracted_fields.append(ExtractedField(name=f'grant_{name}', value=value, confidence=0.75))
 
         # Extract scholarships
-        data.scholarships = self._extract_scholarships(content, money_extractions)
+        data.scholarships = self._extract_scholarships(label_values)
         for name, value in data.scholarships.items():
             extracted_fields.append(ExtractedField(name=f'scholarship_{name}', value=value, confidence=0.75))
 
         # Extract loans
-        data.loans = self._extract_loans(content, money_extractions)
+        data.loans = self._extract_loans(label_values)
         for name, value in data.loans.items():
             extracted_fields.append(ExtractedField(name=f'loan_{name}', value=value, confidence=0.8))
             if value > 10000:
                 warnings.append(f"High loan amount detected: ${value:,.2f}")
 
         # Work study
-        work_study = self._find_value_near_label(content, ['work study', 'work-study'], money_extractions)
+        work_study = self._find_value_near_label(WORK_STUDY_LABELS, label_values)
         if work_study:
             data.work_study = work_study
             extracted_fields.append(ExtractedField(name='work_study', value=work_study, confidence=0.8))
@@ -422,18 +576,23 @@ class DocumentAnalystAgent:
             confidence_score=confidence,
         )
 
-    async def _analyze_transcript(
+    def _analyze_transcript(
         self,
         content: str,
+        content_lower: Optional[str] = None,
     ) -> DocumentAnalysisResult:
         """Analyze a transcript.
 
         Args:
             content: Transcript text
+            content_lower: content.lower(), if the caller already has it
 
         Returns:
             DocumentAnalysisResult with TranscriptData
         """
+        if content_lower is None:
+            content_lower = content.lower()
+
         extracted_fields = []
         missing_fields = []
         warnings = []
@@ -477,8 +636,7 @@ class DocumentAnalystAgent:
             extracted_fields.append(ExtractedField(name='courses', value=f"{len(courses)} courses", confidence=0.7))
 
             # Count STEM courses
-            stem_keywords = ['math', 'science', 'physics', 'chemistry', 'biology', 'computer', 'engineering', 'calculus', 'statistics']
-            data.stem_courses = sum(1 for c in courses if any(kw in c.get('name', '').lower() for kw in stem_keywords))
+            data.stem_courses = sum(1 for c in courses if _STEM_KEYWORDS_RE.search(c.get('name', '')))
 
         # Extract academic standing
         standing = self._extract_standing(content)
@@ -487,7 +645,7 @@ class DocumentAnalystAgent:
             extracted_fields.append(ExtractedField(name='standing', value=standing, confidence=0.85))
 
         # Extract honors
-        honors = self._extract_honors(content)
+        honors = self._extract_honors(content_lower)
         if honors:
             data.honors = honors
             extracted_fields.append(ExtractedField(name='honors', value=honors, confidence=0.8))
@@ -508,14 +666,16 @@ class DocumentAnalystAgent:
             confidence_score=confidence,
         )
 
-    async def _analyze_sar(
+    def _analyze_sar(
         self,
         content: str,
+        content_lower: Optional[str] = None,
     ) -> DocumentAnalysisResult:
         """Analyze a Student Aid Report.
 
         Args:
             content: SAR text
+            content_lower: content.lower(), if the caller already has it
 
         Returns:
             DocumentAnalysisResult
@@ -524,8 +684,7 @@ class DocumentAnalystAgent:
         missing_fields = []
 
         # Extract EFC
-        efc_pattern = re.compile(r'(?:EFC|Expected Family Contribution)[:\s]*\$?([\d,]+)', re.I)
-        efc_match = efc_pattern.search(content)
+        efc_match = _EFC_PATTERN.search(content)
 
         if efc_match:
             efc = float(efc_match.group(1).replace(',', ''))
@@ -534,7 +693,9 @@ class DocumentAnalystAgent:
             missing_fields.append('efc')
 
         # Extract verification status
-        if 'selected for verification' in content.lower():
+        if content_lower is None:
+            content_lower = content.lower()
+        if 'selected for verification' in content_lower:
             extracted_fields.append(ExtractedField(name='verification_required', value=True, confidence=0.95))
 
         completeness = CompletionStatus.COMPLETE if not missing_fields else CompletionStatus.MISSING_FIELDS
@@ -549,7 +710,7 @@ class DocumentAnalystAgent:
             confidence_score=confidence,
         )
 
-    async def _analyze_generic(
+    def _analyze_generic(
         self,
         content: str,
         doc_type: DocumentType,
@@ -565,21 +726,24 @@ class DocumentAnalystAgent:
         """
         extracted_fields = []
 
-        # Extract any money values
-        money_values = self._extract_money_values(content)
-        if money_values:
+        # Only the counts are reported, so count matches without building
+        # lists. An amount of bare commas ("$,") is not a money value.
+        money_count = sum(
+            1 for match in _MONEY_PATTERN.finditer(content)
+            if match['amount'].strip(',')
+        )
+        if money_count:
             extracted_fields.append(ExtractedField(
                 name='monetary_values',
-                value=f"{len(money_values)} values found",
+                value=f"{money_count} values found",
                 confidence=0.7,
             ))
 
-        # Extract dates
-        dates = self._date_pattern.findall(content)
-        if dates:
+        date_count = sum(1 for _ in _DATE_PATTERN.finditer(content))
+        if date_count:
             extracted_fields.append(ExtractedField(
                 name='dates',
-                value=f"{len(dates)} dates found",
+                value=f"{date_count} dates found",
                 confidence=0.6,
             ))
 
@@ -597,146 +761,134 @@ class DocumentAnalystAgent:
 
     def _extract_school_name(self, content: str) -> Optional[str]:
         """Extract school name from content."""
-        # Common patterns
-        patterns = [
-            r'((?:University|College|Institute|School)\s+of\s+[\w\s]+)',
-            r'([\w\s]+(?:University|College|Institute))',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content, re.I)
+        for pattern in _SCHOOL_PATTERNS:
+            match = pattern.search(content)
             if match:
                 return match.group(1).strip()
 
         return None
 
-    def _extract_money_values(self, content: str) -> List[Tuple[float, int]]:
-        """Extract all money values with their positions."""
-        values = []
-        for match in self._money_pattern.finditer(content):
-            value_str = match.group().replace('$', '').replace(',', '')
+    def _extract_money_values(self, content: str) -> Tuple[array, array]:
+        """Extract all money values and their positions.
+
+        Returns:
+            (positions, values) as parallel arrays of int64 and float64,
+            in increasing position order
+        """
+        positions = array('q')
+        values = array('d')
+        for match in _MONEY_PATTERN.finditer(content):
             try:
-                value = float(value_str)
-                values.append((value, match.start()))
+                value = float(match['amount'].replace(',', ''))
             except ValueError:
-                pass
-        return values
+                continue
+            positions.append(match.start())
+            values.append(value)
+        return positions, values
 
-    def _find_value_near_label(
+    def _find_label_values(
         self,
         content: str,
-        labels: List[str],
-        money_values: List[Tuple[float, int]],
+        money_values: Tuple[array, array],
         max_distance: int = 100,
-    ) -> Optional[float]:
-        """Find a money value near a label."""
-        content_lower = content.lower()
+    ) -> Dict[str, float]:
+        """Map each award label to the first money value after it.
 
-        for label in labels:
-            label_pos = content_lower.find(label.lower())
-            if label_pos >= 0:
-                # Find closest money value after the label
-                for value, pos in money_values:
-                    if label_pos <= pos <= label_pos + max_distance:
-                        return value
+        Only a label's first occurrence counts. Labels are found in one
+        scan, and each is matched to a value by bisecting the positions.
 
-        return None
+        Args:
+            content: Document text
+            money_values: (positions, values) from _extract_money_values
+            max_distance: Furthest a value may start after its label
 
-    def _extract_grants(
-        self,
-        content: str,
-        money_values: List[Tuple[float, int]],
-    ) -> Dict[str, float]:
-        """Extract grant amounts."""
-        grants = {}
+        Returns:
+            Dict of lowercase label -> value, for labels followed by a value
+        """
+        positions, values = money_values
+        seen = set()
+        label_values = {}
+        for match in _LABEL_SCANNER.finditer(content):
+            label = match.group(1).lower()
+            label_pos = match.start()
+            index = bisect_left(positions, label_pos)
+            value = None
+            if index < len(positions) and positions[index] - label_pos <= max_distance:
+                value = values[index]
+
+            for hit in (label, *_LABEL_PREFIXES[label]):
+                if hit not in seen:
+                    seen.add(hit)
+                    if value is not None:
+                        label_values[hit] = value
+
+        return label_values
 
-        grant_labels = {
-            'pell': ['pell grant', 'federal pell'],
-            'seog': ['seog', 'supplemental educational'],
-            'state': ['state grant', 'cal grant', 'tap'],
-            'institutional': ['institutional grant', 'university grant', 'need-based grant'],
-        }
+    def _find_value_near_label(
+        self,
+        labels: List[str],
+        label_values: Dict[str, float],
+    ) -> Optional[float]:
+        """Find the money value for the first label that has one.
 
-        for grant_name, labels in grant_labels.items():
-            value = self._find_value_near_label(content, labels, money_values)
-            if value:
-                grants[grant_name] = value
+        Labels must be lowercase, like the keys of label_values.
+        """
+        for label in labels:
+            value = label_values.get(label)
+            if value is not None:
+                return value
 
-        return grants
+        return None
 
-    def _extract_scholarships(
+    def _extract_labeled_amounts(
         self,
-        content: str,
-        money_values: List[Tuple[float, int]],
+        labels_by_name: Dict[str, List[str]],
+        label_values: Dict[str, float],
     ) -> Dict[str, float]:
-        """Extract scholarship amounts."""
-        scholarships = {}
+        """Extract named amounts, e.g. grants by kind."""
+        amounts = {}
 
-        scholarship_labels = {
-            'merit': ['merit scholarship', 'academic scholarship'],
-            'athletic': ['athletic scholarship'],
-            'outside': ['outside scholarship', 'external scholarship'],
-        }
-
-        for name, labels in scholarship_labels.items():
-            value = self._find_value_near_label(content, labels, money_values)
+        for name, labels in labels_by_name.items():
+            value = self._find_value_near_label(labels, label_values)
             if value:
-                scholarships[name] = value
-
-        return scholarships
+                amounts[name] = value
 
-    def _extract_loans(
-        self,
-        content: str,
-        money_values: List[Tuple[float, int]],
-    ) -> Dict[str, float]:
-        """Extract loan amounts."""
-        loans = {}
+        return amounts
 
-        loan_labels = {
-            'subsidized': ['subsidized loan', 'direct subsidized'],
-            'unsubsidized': ['unsubsidized loan', 'direct unsubsidized'],
-            'plus': ['plus loan', 'parent plus', 'parent loan'],
-            'perkins': ['perkins loan'],
-        }
+    def _extract_grants(self, label_values: Dict[str, float]) -> Dict[str, float]:
+        """Extract grant amounts."""
+        return self._extract_labeled_amounts(GRANT_LABELS, label_values)
 
-        for loan_name, labels in loan_labels.items():
-            value = self._find_value_near_label(content, labels, money_values)
-            if value:
-                loans[loan_name] = value
+    def _extract_scholarships(self, label_values: Dict[str, float]) -> Dict[str, float]:
+        """Extract scholarship amounts."""
+        return self._extract_labeled_amounts(SCHOLARSHIP_LABELS, label_values)
 
-        return loans
+    def _extract_loans(self, label_values: Dict[str, float]) -> Dict[str, float]:
+        """Extract loan amounts."""
+        return self._extract_labeled_amounts(LOAN_LABELS, label_values)
 
     def _extract_conditions(self, content: str) -> List[str]:
-        """Extract conditions on aid."""
-        conditions = []
+        """Extract conditions on aid.
 
-        condition_patterns = [
-            r'(?:must|required to|condition)[:\s]+([\w\s,]+)',
-            r'(?:maintain|keep)[:\s]+(?:a\s+)?(\d+\.\d+)\s+GPA',
-            r'full[- ]time\s+enrollment\s+required',
-        ]
+        Patterns are tried in order, and scanning stops as soon as
+        MAX_CONDITIONS have been found.
+        """
+        conditions = []
 
-        for pattern in condition_patterns:
-            matches = re.findall(pattern, content, re.I)
-            if matches:
-                if isinstance(matches[0], str):
-                    conditions.extend(matches)
-                else:
-                    conditions.extend([m[0] if isinstance(m, tuple) else m for m in matches])
+        for pattern in _CONDITION_PATTERNS:
+            # Report the captured detail when the pattern has one
+            group = 1 if pattern.groups else 0
+            for match in pattern.finditer(content):
+                conditions.append(match.group(group))
+                if len(conditions) == MAX_CONDITIONS:
+                    return conditions
 
-        return conditions[:5]  # Limit to 5 conditions
+        return conditions
 
     def _extract_gpa(self, content: str) -> Optional[Tuple[float, float]]:
         """Extract GPA and scale."""
-        gpa_patterns = [
-            r'(?:cumulative|overall)\s+GPA[:\s]+(\d+\.\d{1,2})',
-            r'GPA[:\s]+(\d+\.\d{1,2})\s*/\s*(\d+\.\d{1,2})',
-            r'(\d+\.\d{1,2})\s+(?:out of|/)\s+(\d+\.\d{1,2})',
-        ]
-
-        for pattern in gpa_patterns:
-            match = re.search(pattern, content, re.I)
+        for pattern in _GPA_PATTERNS:
+            match = pattern.search(content)
             if match:
                 gpa = float(match.group(1))
                 scale = float(match.group(2)) if match.lastindex >= 2 else 4.0
@@ -746,8 +898,8 @@ class DocumentAnalystAgent:
 
     def _extract_credits(self, content: str) -> Optional[Tuple[float, float]]:
         """Extract credits earned and attempted."""
-        earned_match = re.search(r'(?:credits?\s+earned|earned\s+credits?)[:\s]+(\d+(?:\.\d)?)', content, re.I)
-        attempted_match = re.search(r'(?:credits?\s+attempted|attempted\s+credits?)[:\s]+(\d+(?:\.\d)?)', content, re.I)
+        earned_match = _EARNED_CREDITS.search(content)
+        attempted_match = _ATTEMPTED_CREDITS.search(content)
 
         if earned_match:
             earned = float(earned_match.group(1))
@@ -760,10 +912,7 @@ class DocumentAnalystAgent:
         """Extract course information."""
         courses = []
 
-        # Simple course pattern: SUBJ ### or similar
-        course_pattern = re.compile(r'([A-Z]{2,4})\s*(\d{3,4})\s+(.+?)(?:\s+(\d+(?:\.\d)?)\s*(?:cr|credits?)?)?(?:\s+([A-F][+-]?))?', re.I)
-
-        for match in course_pattern.finditer(content):
+        for match in _COURSE_PATTERN.finditer(content):
             course = {
                 'subject': match.group(1),
                 'number': match.group(2),
@@ -777,29 +926,16 @@ class DocumentAnalystAgent:
 
     def _extract_standing(self, content: str) -> Optional[str]:
         """Extract academic standing."""
-        standing_patterns = [
-            r"(?:academic\s+standing|standing)[:\s]+([\w\s]+)",
-            r"(good\s+standing|probation|dean'?s?\s+list)",
-        ]
-
-        for pattern in standing_patterns:
-            match = re.search(pattern, content, re.I)
+        for pattern in _STANDING_PATTERNS:
+            match = pattern.search(content)
             if match:
                 return match.group(1).strip()
 
         return None
 
-    def _extract_honors(self, content: str) -> List[str]:
-        """Extract honors and awards."""
-        honors = []
-
-        honor_keywords = ['dean\'s list', 'honor roll', 'cum laude', 'magna cum laude', 'summa cum laude', 'honors']
-
-        for keyword in honor_keywords:
-            if keyword.lower() in content.lower():
-                honors.append(keyword.title())
-
-        return honors
+    def _extract_honors(self, content_lower: str) -> List[str]:
+        """Extract honors and awards from lowercased content."""
+        return [title for keyword, title in _HONOR_TITLES if keyword in content_lower]
 
     def _validate_award_letter(
         self,
@@ -850,20 +986,31 @@ class DocumentAnalystAgent:
                     "school": data.school_name,
                     "net_cost": data.net_cost,
                     "total_gift_aid": data.total_gift_aid,
-                    "total_loans": sum(data.loans.values()),
+                    "total_loans": (
+                        data.total_loans if data.total_loans is not None
+                        else sum(data.loans.values())
+                    ),
                 }
                 comparison["schools"].append(school_info)
 
-        # Find best options
-        if comparison["schools"]:
-            sorted_by_cost = sorted(comparison["schools"], key=lambda x: x.get("net_cost") or float('inf'))
-            comparison["lowest_net_cost"] = sorted_by_cost[0]["school"] if sorted_by_cost else None
-
-            sorted_by_gift = sorted(comparison["schools"], key=lambda x: x.get("total_gift_aid") or 0, reverse=True)
-            comparison["highest_gift_aid"] = sorted_by_gift[0]["school"] if sorted_by_gift else None
+        # Find best options in one pass. Strict comparisons keep the first
+        # school on ties; missing (or zero) costs and loans rank last.
+        best_cost = best_gift = best_loans = None
+        for info in comparison["schools"]:
+            cost = info["net_cost"] or math.inf
+            gift = info["total_gift_aid"] or 0
+            loans = info["total_loans"] or math.inf
+            if best_cost is None or cost < best_cost[0]:
+                best_cost = (cost, info["school"])
+            if best_gift is None or gift > best_gift[0]:
+                best_gift = (gift, info["school"])
+            if best_loans is None or loans < best_loans[0]:
+                best_loans = (loans, info["school"])
 
-            sorted_by_loans = sorted(comparison["schools"], key=lambda x: x.get("total_loans") or float('inf'))
-            comparison["lowest_loans"] = sorted_by_loans[0]["school"] if sorted_by_loans else None
+        if comparison["schools"]:
+            comparison["lowest_net_cost"] = best_cost[1]
+            comparison["highest_gift_aid"] = best_gift[1]
+            comparison["lowest_loans"] = best_loans[1]
 
         return comparison
 
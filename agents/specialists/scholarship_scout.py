@@ -7,6 +7,7 @@ Runs on schedule to discover new opportunities and match to anonymized profiles.
 import logging
 import asyncio
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Any, Optional, Set
 from enum import Enum
@@ -65,6 +66,11 @@ class ScholarshipDiscovery:
     discovered_at: datetime = field(default_factory=datetime.utcnow)
     last_verified: Optional[datetime] = None
 
+    @cached_property
+    def deadline_iso(self) -> Optional[str]:
+        """Deadline as an ISO date string, formatted once per scholarship."""
+        return self.deadline.isoformat() if self.deadline else None
+
 
 @dataclass
 class ProfileMatch:
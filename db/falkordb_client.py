@@ -34,6 +34,9 @@ class FalkorDBClient:
         self.graph_name = graph_name
         self._client: Optional[FalkorDB] = None
         self._graph = None
+        # Bumped on every write made through this client so readers can
+        # cheaply tell whether cached query results are stale
+        self.generation = 0
 
     def connect(self) -> None:
         """Establish connection to FalkorDB."""
@@ -72,6 +75,21 @@ class FalkorDBClient:
             return self.graph.query(cypher, params)
         return self.graph.query(cypher)
 
+    def write(self, cypher: str, params: Optional[dict] = None) -> Any:
+        """
+        Execute a Cypher query that modifies the graph.
+
+        Args:
+            cypher: Cypher query string
+            params: Optional query parameters
+
+        Returns:
+            Query result
+        """
+        result = self.query(cypher, params)
+        self.generation += 1
+        return result
+
     def execute_many(self, queries: list[str]) -> list[Any]:
         """
         Execute multiple Cypher queries.
@@ -85,13 +103,13 @@ class FalkorDBClient:
         results = []
         for query in queries:
             if query.strip():
-                result = self.query(query)
+                result = self.write(query)
                 results.append(result)
         return results
 
     def delete_all(self) -> None:
         """Delete all nodes and relationships in the graph."""
-        self.query("MATCH (n) DETACH DELETE n")
+        self.write("MATCH (n) DETACH DELETE n")
 
     # ==========================================================================
     # School Operations
@@ -128,7 +146,7 @@ class FalkorDBClient:
         })
         RETURN s
         """
-        return self.query(query, {
+        return self.write(query, {
             'id': school_id,
             'name': name,
             'type': school_type,
@@ -197,7 +215,7 @@ class FalkorDBClient:
         })
         RETURN ss
         """
-        return self.query(query, {
+        return self.write(query, {
             'id': source_id,
             'name': name,
             'amount_min': amount_min,
@@ -274,7 +292,7 @@ class FalkorDBClient:
         }]->(b)
         RETURN r
         """
-        return self.query(query, {
+        return self.write(query, {
             'school_id': school_id,
             'behavior_id': behavior_id,
             'confidence': confidence,
@@ -16,6 +16,7 @@ from dataclasses import dataclass
 try:
     from graphiti_core import Graphiti
     from graphiti_core.nodes import EpisodeType
+    from graphiti_core.utils.bulk_utils import RawEpisode
     GRAPHITI_AVAILABLE = True
 except ImportError:
     GRAPHITI_AVAILABLE = False
@@ -27,6 +28,15 @@ except ImportError:
         json = "json"
         message = "message"
 
+    # Mock RawEpisode for when graphiti_core is not installed
+    @dataclass
+    class RawEpisode:
+        name: str
+        content: str
+        source_description: str
+        source: Any
+        reference_time: datetime
+
 
 @dataclass
 class Episode:
@@ -185,6 +195,51 @@ class GraphitiClient:
             print(f"Failed to add episode: {e}")
             return None
 
+    async def add_episodes_batch(
+        self,
+        episodes: list[dict],
+        group_id: Optional[str] = None
+    ) -> bool:
+        """
+        Add several episodes to the temporal graph in one bulk write.
+
+        Either the whole batch is written or the call reports failure, so
+        callers can keep their buffer until the write succeeds.
+
+        Args:
+            episodes: Episode dicts with 'name', 'episode_body' and optional
+                'source_description' and 'reference_time' (defaults to now)
+            group_id: Optional group identifier for the student
+
+        Returns:
+            True if the batch was written, False otherwise
+        """
+        if not self._initialized or not self._graphiti:
+            return False
+
+        if not episodes:
+            return True
+
+        now = datetime.now(timezone.utc)
+        raw_episodes = [
+            RawEpisode(
+                name=episode['name'],
+                content=episode['episode_body'],
+                source_description=episode.get('source_description', 'conversation'),
+                source=EpisodeType.text,
+                reference_time=episode.get('reference_time') or now,
+            )
+            for episode in episodes
+        ]
+
+        try:
+            await self._graphiti.add_episode_bulk(raw_episodes, group_id=group_id)
+            return True
+
+        except Exception as e:
+            print(f"Failed to add episode batch: {e}")
+            return False
+
     async def add_conversation(
         self,
         student_id: str,
@@ -440,6 +495,62 @@ class GraphitiClient:
             group_ids=[student_id]
         )
 
+    async def batch_get_episodes(
+        self,
+        student_id: str,
+        limit: int = 50,
+        reference_time: Optional[datetime] = None
+    ) -> list[dict]:
+        """
+        Get a student's most recent episodes in a single query.
+
+        Unlike get_student_history, this does not run a hybrid search; it
+        issues one episode retrieval for the student's group and returns
+        every field needed to rebuild the conversation, oldest first.
+        Conversation episodes record the speaker's role after a colon in
+        their source description (e.g. "sms_conversation:assistant").
+
+        Args:
+            student_id: The student's anonymous identifier
+            limit: Maximum episodes to return
+            reference_time: Only return episodes before this time (defaults to now)
+
+        Returns:
+            List of episode dicts ordered by time; 'role' is None for
+            episodes stored without one
+        """
+        if not self._initialized or not self._graphiti:
+            return []
+
+        if reference_time is None:
+            reference_time = datetime.now(timezone.utc)
+
+        try:
+            episodes = await self._graphiti.retrieve_episodes(
+                reference_time=reference_time,
+                last_n=limit,
+                group_ids=[student_id]
+            )
+
+            results = []
+            for episode in episodes:
+                source_description = getattr(episode, 'source_description', '') or ''
+                _, has_role, role = source_description.rpartition(':')
+                results.append({
+                    'uuid': getattr(episode, 'uuid', None),
+                    'name': getattr(episode, 'name', ''),
+                    'fact': getattr(episode, 'content', ''),
+                    'role': role if has_role else None,
+                    'source_description': source_description,
+                    'valid_at': getattr(episode, 'valid_at', None),
+                    'created_at': getattr(episode, 'created_at', None),
+                })
+            return results
+
+        except Exception as e:
+            print(f"Episode retrieval failed: {e}")
+            return []
+
     async def detect_invalidated_facts(
         self,
         entity: str
@@ -91,7 +91,7 @@ def init_database(
                 statements = load_cypher_file(str(seed_file))
                 for stmt in statements:
                     try:
-                        client.query(stmt)
+                        client.write(stmt)
                     except Exception as e:
                         results['errors'].append(f"Error executing: {stmt[:50]}... - {str(e)}")
 
@@ -218,7 +218,7 @@ def verify_database(client: Optional[FalkorDBClient] = None) -> dict:
         test['passed'] = len(verify.result_set) == 1
         test['result'] = "Successfully created and verified new school"
         # Clean up
-        client.query("MATCH (s:School {id: 'school_test_temp'}) DELETE s")
+        client.write("MATCH (s:School {id: 'school_test_temp'}) DELETE s")
     except Exception as e:
         test['result'] = str(e)
         results['success'] = False
@@ -241,7 +241,7 @@ def verify_database(client: Optional[FalkorDBClient] = None) -> dict:
         test['passed'] = len(verify.result_set) == 1
         test['result'] = "Successfully created and verified new scholarship source"
         # Clean up
-        client.query("MATCH (ss:ScholarshipSource {id: 'scholarship_test_temp'}) DELETE ss")
+        client.write("MATCH (ss:ScholarshipSource {id: 'scholarship_test_temp'}) DELETE ss")
     except Exception as e:
         test['result'] = str(e)
         results['success'] = False
@@ -70,6 +70,8 @@ class TestAgentConfig:
         assert config.tools == []
         assert config.temperature == 0.7
         assert config.max_tokens == 4096
+        assert config.history_window == 20
+        assert config.context_limit_tokens == 200_000
 
 
 class TestAmbassadorConfig:
@@ -219,9 +221,21 @@ class TestMessageDataclass:
         msg = Message(role="user", content="Hello")
         assert msg.role == "user"
         assert msg.content == "Hello"
-        assert msg.timestamp is not None
+        assert isinstance(msg.timestamp, int)
         assert msg.metadata == {}
 
+    def test_timestamp_conversions(self):
+        """Test nanosecond timestamps round-trip through datetimes."""
+        from datetime import timezone
+        from agents.ambassador import datetime_to_ns, ns_to_datetime
+
+        naive = datetime(2025, 1, 15, 12, 0, 0, 250)
+        aware = naive.replace(tzinfo=timezone.utc)
+
+        assert datetime_to_ns(naive) == 1736942400000250000
+        assert datetime_to_ns(aware) == datetime_to_ns(naive)
+        assert ns_to_datetime(1736942400000250999) == aware
+
     def test_message_with_metadata(self):
         """Test Message with metadata."""
         from agents.ambassador import Message
@@ -233,6 +247,13 @@ class TestMessageDataclass:
         )
         assert msg.metadata["channel"] == "sms"
 
+    def test_message_has_no_instance_dict(self):
+        """Test Message uses slots to keep per-message memory small."""
+        from agents.ambassador import Message
+
+        msg = Message(role="user", content="Hello")
+        assert not hasattr(msg, "__dict__")
+
 
 class TestAgentResponseDataclass:
     """Tests for AgentResponse dataclass."""
@@ -269,7 +290,8 @@ class TestAmbassadorAgent:
         mock = AsyncMock()
         mock.initialize.return_value = True
         mock.add_episode.return_value = "episode-123"
-        mock.get_student_history.return_value = []
+        mock.add_episodes_batch.return_value = True
+        mock.batch_get_episodes.return_value = []
         return mock
 
     @pytest.fixture
@@ -287,7 +309,7 @@ class TestAmbassadorAgent:
         agent = AmbassadorAgent()
         assert agent.config == ambassador_config
         assert agent.student_id is None
-        assert agent._conversation_history == []
+        assert list(agent._conversation_history) == []
 
     def test_agent_with_student_id(self):
         """Test agent with student ID."""
@@ -317,6 +339,26 @@ class TestAmbassadorAgent:
         agent = AmbassadorAgent()
         assert "claude-haiku-4" in agent.fallback_model_name
 
+    def test_agents_share_anthropic_client(self, monkeypatch):
+        """Test every agent reuses the process-wide Anthropic client."""
+        from agents import ambassador
+        from agents.ambassador import AmbassadorAgent
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setattr(ambassador, "ANTHROPIC_AVAILABLE", True)
+        monkeypatch.setattr(ambassador, "AsyncAnthropic", MagicMock(side_effect=lambda **kw: object()))
+        ambassador._shared_anthropic_client.cache_clear()
+
+        try:
+            first = AmbassadorAgent()
+            second = AmbassadorAgent(student_id="student_123")
+
+            assert first._primary_client is not None
+            assert first._primary_client is second._primary_client
+            assert ambassador.AsyncAnthropic.call_count == 1
+        finally:
+            ambassador._shared_anthropic_client.cache_clear()
+
     @pytest.mark.asyncio
     async def test_initialize(self, mock_graphiti):
         """Test agent initialization."""
@@ -361,9 +403,121 @@ class TestAmbassadorAgent:
         )
 
         await agent.process_message("Hello!")
+        await agent.close()
+
+        # User and assistant messages go out in one bulk write
+        mock_graphiti.add_episodes_batch.assert_called_once()
+        episodes = mock_graphiti.add_episodes_batch.call_args[0][0]
+        assert episodes[0]['episode_body'] == "Hello!"
+        assert len(episodes) == 2
+        assert mock_graphiti.add_episodes_batch.call_args[1]['group_id'] == "student_123"
+
+    @pytest.mark.asyncio
+    async def test_history_round_trip_keeps_roles(self):
+        """Test assistant replies reload as assistant turns after a write."""
+        from agents.ambassador import AmbassadorAgent
+        from db.graphiti_client import GraphitiClient
+
+        stored = []
 
-        # Should have called add_episode twice (user + assistant)
-        assert mock_graphiti.add_episode.call_count == 2
+        async def add_episode_bulk(raw_episodes, group_id=None):
+            stored.extend(raw_episodes)
+
+        async def retrieve_episodes(reference_time, last_n, group_ids):
+            return stored[-last_n:]
+
+        backend = AsyncMock()
+        backend.add_episode_bulk.side_effect = add_episode_bulk
+        backend.retrieve_episodes.side_effect = retrieve_episodes
+        graphiti = GraphitiClient()
+        graphiti._graphiti = backend
+        graphiti._initialized = True
+
+        writer = AmbassadorAgent(graphiti_client=graphiti, student_id="student_123")
+        await writer.process_message("Hello!")
+        await writer.close()
+
+        reader = AmbassadorAgent(graphiti_client=graphiti, student_id="student_123")
+        await reader.initialize()
+
+        history = reader.get_conversation_history()
+        assert [m.role for m in history] == ["user", "assistant"]
+        assert history[0].content == "Hello!"
+
+    def test_episode_name_uses_epoch_microseconds(self):
+        """Test episode names use integer microseconds."""
+        from agents.ambassador import episode_name
+
+        assert episode_name("s1", 1736942400000250999) == "s1_1736942400000250"
+
+    @pytest.mark.asyncio
+    async def test_process_message_does_not_wait_for_episode_writes(self, mock_graphiti):
+        """Test the reply is returned before Graphiti writes complete."""
+        import asyncio
+        from agents.ambassador import AmbassadorAgent
+
+        release = asyncio.Event()
+
+        async def slow_add_episodes_batch(episodes, group_id=None):
+            await release.wait()
+            return True
+
+        mock_graphiti.add_episodes_batch.side_effect = slow_add_episodes_batch
+
+        agent = AmbassadorAgent(
+            graphiti_client=mock_graphiti,
+            student_id="student_123"
+        )
+
+        response = await agent.process_message("Hello!")
+        assert response.content
+        assert len(agent._pending_writes) == 1
+        assert len(agent._pending_episodes) == 2
+
+        release.set()
+        await agent.close()
+        assert len(agent._pending_writes) == 0
+        assert agent._pending_episodes == []
+        assert mock_graphiti.add_episodes_batch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_episode_buffer_flushes_full_batch(self, mock_graphiti):
+        """Test a full batch is flushed without waiting for the interval."""
+        import asyncio
+        from agents import ambassador
+        from agents.ambassador import AmbassadorAgent, Message
+
+        agent = AmbassadorAgent(
+            graphiti_client=mock_graphiti,
+            student_id="student_123"
+        )
+
+        with patch.object(ambassador, 'EPISODE_FLUSH_INTERVAL_SECONDS', 60):
+            for i in range(ambassador.EPISODE_BATCH_SIZE):
+                agent._schedule_episode_write(Message(role="user", content=f"m{i}"), "web")
+            await asyncio.wait_for(asyncio.gather(*agent._pending_writes), 1)
+
+        mock_graphiti.add_episodes_batch.assert_called_once()
+        assert agent._pending_episodes == []
+
+    @pytest.mark.asyncio
+    async def test_episode_buffer_kept_on_failed_flush(self, mock_graphiti):
+        """Test episodes stay queued until a bulk write succeeds."""
+        from agents.ambassador import AmbassadorAgent, Message
+
+        mock_graphiti.add_episodes_batch.return_value = False
+        agent = AmbassadorAgent(
+            graphiti_client=mock_graphiti,
+            student_id="student_123"
+        )
+        agent._pending_episodes.append((Message(role="user", content="Hi"), "web"))
+
+        assert await agent._flush_episodes() is False
+        assert len(agent._pending_episodes) == 1
+
+        mock_graphiti.add_episodes_batch.return_value = True
+        assert await agent._flush_episodes() is True
+        assert agent._pending_episodes == []
 
     @pytest.mark.asyncio
     async def test_check_delegation_scholarship(self):
@@ -415,6 +569,113 @@ class TestAmbassadorAgent:
         result = await agent._check_delegation_needed("How are you today?")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_check_delegations_multiple(self):
+        """Test every matching specialist is returned in priority order."""
+        from agents.ambassador import AmbassadorAgent
+
+        agent = AmbassadorAgent()
+
+        result = await agent._check_delegations_needed(
+            "Find me scholarships for nursing and tell me the deadline"
+        )
+        assert result == ["scholarship_scout", "deadline_sentinel"]
+
+    @pytest.mark.asyncio
+    async def test_specialist_does_not_delegate_to_itself(self):
+        """Test a specialist sub-agent skips delegating to its own config."""
+        from agents.ambassador import AmbassadorAgent
+        from agents.config import deadline_sentinel_config
+
+        agent = AmbassadorAgent(config=deadline_sentinel_config)
+
+        result = await agent._check_delegations_needed("When is the FAFSA deadline?")
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_multi_specialist_message_does_not_recurse(self, monkeypatch):
+        """Test sub-agents answer a multi-specialist message without re-delegating."""
+        from agents.ambassador import AmbassadorAgent
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        agent = AmbassadorAgent()
+
+        response = await agent.process_message("find scholarship deadline")
+
+        assert response.metadata['delegations'] == ["scholarship_scout", "deadline_sentinel"]
+        for sub_agent in agent._sub_agents.values():
+            assert sub_agent._delegation_targets == ()
+            assert sub_agent._sub_agents == {}
+
+    @pytest.mark.asyncio
+    async def test_delegate_to_agents_merges_responses(self):
+        """Test concurrent delegation merges specialist responses."""
+        from agents.ambassador import AmbassadorAgent, AgentResponse
+
+        agent = AmbassadorAgent()
+
+        async def fake_delegate(agent_name, message):
+            return AgentResponse(
+                content=f"{agent_name} reply",
+                delegated_to=agent_name,
+                tools_used=["shared", agent_name],
+            )
+
+        agent._delegate_to_agent = fake_delegate
+
+        response = await agent._delegate_to_agents(
+            ["scholarship_scout", "deadline_sentinel"], "message"
+        )
+        assert response.content == "scholarship_scout reply\n\ndeadline_sentinel reply"
+        assert response.delegated_to == "scholarship_scout"
+        assert response.metadata['delegations'] == ["scholarship_scout", "deadline_sentinel"]
+        assert response.tools_used == ["shared", "scholarship_scout", "deadline_sentinel"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_delegation_creates_one_sub_agent(self, mock_graphiti):
+        """Test concurrent delegations to one specialist share an instance."""
+        import asyncio
+        from agents.ambassador import AmbassadorAgent
+
+        async def slow_history(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return []
+
+        mock_graphiti.batch_get_episodes.side_effect = slow_history
+
+        agent = AmbassadorAgent(
+            graphiti_client=mock_graphiti,
+            student_id="student_123"
+        )
+
+        first, second = await asyncio.gather(
+            agent._get_sub_agent("deadline_sentinel"),
+            agent._get_sub_agent("deadline_sentinel"),
+        )
+
+        assert first is second
+        assert mock_graphiti.batch_get_episodes.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_delegate_to_agents_skips_failures(self):
+        """Test a failing specialist does not drop the other replies."""
+        from agents.ambassador import AmbassadorAgent, AgentResponse
+
+        agent = AmbassadorAgent()
+
+        async def fake_delegate(agent_name, message):
+            if agent_name == "appeal_strategist":
+                raise RuntimeError("boom")
+            return AgentResponse(content="ok", delegated_to=agent_name)
+
+        agent._delegate_to_agent = fake_delegate
+
+        response = await agent._delegate_to_agents(
+            ["appeal_strategist", "deadline_sentinel"], "message"
+        )
+        assert response.content == "ok"
+        assert response.delegated_to == "deadline_sentinel"
+
     def test_register_tool(self):
         """Test tool registration."""
         from agents.ambassador import AmbassadorAgent
@@ -424,8 +685,26 @@ class TestAmbassadorAgent:
         async def mock_tool(query: str) -> str:
             return f"Result for {query}"
 
-        agent.register_tool("scholarship_search", mock_tool)
-        assert "scholarship_search" in agent._tools
+        index = agent.register_tool("scholarship_search", mock_tool)
+        assert index == agent.get_tool_index("scholarship_search")
+        assert agent._tool_handlers[index] is mock_tool
+
+    @pytest.mark.asyncio
+    async def test_call_tool_by_index(self):
+        """Test registered tools are dispatched by index."""
+        from agents.ambassador import AmbassadorAgent
+
+        agent = AmbassadorAgent()
+
+        async def mock_tool(query: str) -> str:
+            return f"Result for {query}"
+
+        index = agent.register_tool("custom_tool", mock_tool)
+        assert index == len(agent.config.tools)
+        assert await agent.call_tool(index, "nursing") == "Result for nursing"
+
+        with pytest.raises(LookupError):
+            await agent.call_tool(agent.get_tool_index("web_research"))
 
     def test_get_conversation_history(self):
         """Test getting conversation history."""
@@ -438,9 +717,62 @@ class TestAmbassadorAgent:
         assert len(history) == 1
         assert history[0].content == "Test"
 
-        # Should be a copy, not the original
-        history.append(Message(role="assistant", content="Response"))
-        assert len(agent._conversation_history) == 1
+        # Should be read-only
+        assert not hasattr(history, 'append')
+        assert history[-1:] == [history[0]]
+
+        # A live view, so later messages show up without another call
+        agent._conversation_history.append(Message(role="assistant", content="Response"))
+        assert [m.content for m in history] == ["Test", "Response"]
+
+    def test_conversation_history_is_bounded(self):
+        """Test history keeps only the configured window of messages."""
+        from agents.ambassador import AmbassadorAgent, Message
+
+        agent = AmbassadorAgent()
+        window = agent.config.history_window
+
+        for i in range(window + 5):
+            agent._record_message(Message(role="user", content=str(i)))
+
+        assert len(agent._conversation_history) == window
+
+        messages = agent._build_messages_for_api()
+        assert len(messages) == window
+        assert messages[0]["content"] == "5"
+        assert messages[-1]["content"] == str(window + 4)
+
+    def test_build_messages_trims_to_token_budget(self):
+        """Test oldest messages are dropped when the context budget is exceeded."""
+        from agents.ambassador import AmbassadorAgent, Message, estimate_tokens
+        from agents.config import AgentConfig, ModelType
+
+        config = AgentConfig(
+            name="TestAgent",
+            model=ModelType.CLAUDE_HAIKU_4,
+            max_tokens=100,
+            context_limit_tokens=400,
+        )
+        agent = AmbassadorAgent(config=config)
+
+        # Each message is ~101 tokens; only two fit the 300-token budget
+        for i in range(4):
+            agent._record_message(Message(role="user", content=f"{i}" * 400))
+
+        messages = agent._build_messages_for_api()
+        assert [m["content"][0] for m in messages] == ["2", "3"]
+        assert agent._api_tokens == 2 * estimate_tokens("x" * 400)
+
+    def test_build_messages_skips_non_chat_roles(self):
+        """Test system messages are recorded but not sent to the API."""
+        from agents.ambassador import AmbassadorAgent, Message
+
+        agent = AmbassadorAgent()
+        agent._record_message(Message(role="system", content="note"))
+        agent._record_message(Message(role="user", content="Hi"))
+
+        assert len(agent.get_conversation_history()) == 2
+        assert agent._build_messages_for_api() == [{"role": "user", "content": "Hi"}]
 
     @pytest.mark.asyncio
     async def test_close(self):
@@ -460,10 +792,337 @@ class TestAmbassadorAgent:
         triggers = await agent.check_triggers()
         assert triggers == []
 
+    @pytest.mark.asyncio
+    async def test_check_triggers_with_features(self):
+        """Test numeric and flag conditions are evaluated in priority order."""
+        from agents.ambassador import AmbassadorAgent
+
+        agent = AmbassadorAgent()
+        triggers = await agent.check_triggers({
+            'deadline_within_days': 0.5,
+            'new_scholarship_match': True,
+            'days_since_interaction': 2,
+        })
+
+        assert [t['action'] for t in triggers] == [
+            'send_urgent', 'send_reminder', 'queue_conversation'
+        ]
+
+    def test_compile_triggers_skips_unsupported_conditions(self):
+        """Test conditions that cannot be parsed are dropped."""
+        from agents.ambassador import compile_triggers
+        from agents.config import ProactiveTrigger
+
+        compiled = compile_triggers([
+            ProactiveTrigger(condition="gpa >= 3.5", action="a", priority=2),
+            ProactiveTrigger(condition="gpa is high", action="b", priority=1),
+        ])
+
+        assert len(compiled) == 1
+        assert compiled[0].matches({'gpa': 3.7})
+        assert not compiled[0].matches({'gpa': 3.0})
+        assert not compiled[0].matches({})
+
+    @pytest.mark.asyncio
+    async def test_evaluate_triggers_for_all(self):
+        """Test triggers for many students load features in one batch."""
+        from agents import ambassador
+        from agents.ambassador import AmbassadorAgent, evaluate_triggers_for_all
+
+        agents = [
+            AmbassadorAgent(student_id='s1'),
+            AmbassadorAgent(student_id='s2'),
+            AmbassadorAgent(),
+        ]
+        loader = AsyncMock(return_value={
+            's1': {'days_since_interaction': 9},
+        })
+
+        with patch.object(ambassador, 'load_trigger_features', loader):
+            results = await evaluate_triggers_for_all(agents)
+
+        loader.assert_awaited_once_with(['s1', 's2'])
+        assert [t['action'] for t in results['s1']] == ['check_in']
+        assert results['s2'] == []
+        assert None not in results
+
+
+class TestResponseCache:
+    """Tests for the model response cache."""
+
+    def test_key_ignores_case_and_whitespace(self):
+        """Test trivially different messages share a cache key."""
+        from agents.ambassador import ResponseCache
+
+        key1 = ResponseCache.make_key("s1", "m", "sys", [{"role": "user", "content": "When is the FAFSA deadline?"}])
+        key2 = ResponseCache.make_key("s1", "m", "sys", [{"role": "user", "content": "when is  the fafsa deadline"}])
+        key3 = ResponseCache.make_key("s1", "m", "sys", [{"role": "user", "content": "When is the CSS deadline?"}])
+
+        assert key1 == key2
+        assert key1 != key3
+        assert key1 != ResponseCache.make_key(
+            "s2", "m", "sys", [{"role": "user", "content": "When is the FAFSA deadline?"}]
+        )
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted when full."""
+        from agents.ambassador import ResponseCache, AgentResponse
+
+        cache = ResponseCache(maxsize=2)
+        cache.put("a", "s1", AgentResponse(content="A"))
+        cache.put("b", "s1", AgentResponse(content="B"))
+        cache.get("a")
+        cache.put("c", "s1", AgentResponse(content="C"))
+
+        assert cache.get("a").content == "A"
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        """Test expired entries are not returned."""
+        from agents.ambassador import ResponseCache, AgentResponse
+
+        cache = ResponseCache(ttl_seconds=0)
+        cache.put("a", "s1", AgentResponse(content="A"))
+
+        assert cache.get("a") is None
+
+    def test_invalidate_student(self):
+        """Test per-student invalidation."""
+        from agents.ambassador import ResponseCache, AgentResponse
+
+        cache = ResponseCache()
+        cache.put("a", "s1", AgentResponse(content="A"))
+        cache.put("b", "s2", AgentResponse(content="B"))
+
+        assert cache.invalidate_student("s1") == 1
+        assert cache.get("a") is None
+        assert cache.get("b").content == "B"
+
+    @pytest.mark.asyncio
+    async def test_repeat_question_skips_api_call(self):
+        """Test an identical conversation state is served from the cache."""
+        from agents import ambassador
+        from agents.ambassador import AmbassadorAgent
+
+        ambassador._response_cache.clear()
+
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=Mock(
+            content=[Mock(text="The FAFSA opens October 1.")],
+            usage=Mock(output_tokens=7),
+        ))
+
+        replies = []
+        for _ in range(2):
+            agent = AmbassadorAgent(student_id="student_123")
+            agent._primary_client = client
+            replies.append(await agent.process_message("What does the FAFSA cover?"))
+
+        assert client.messages.create.call_count == 1
+        assert replies[1].content == replies[0].content
+        assert replies[1].metadata['cached'] is True
+        assert 'cached' not in replies[0].metadata
+
+        ambassador._response_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_only_affects_one_student(self):
+        """Test students asking the same question keep separate entries."""
+        from agents import ambassador
+        from agents.ambassador import AmbassadorAgent
+
+        ambassador._response_cache.clear()
+
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=Mock(
+            content=[Mock(text="The FAFSA opens October 1.")],
+            usage=Mock(output_tokens=7),
+        ))
+
+        def make_agent(student_id):
+            agent = AmbassadorAgent(student_id=student_id)
+            agent._primary_client = client
+            return agent
+
+        await make_agent("student_a").process_message("What does the FAFSA cover?")
+        await make_agent("student_b").process_message("What does the FAFSA cover?")
+        assert client.messages.create.call_count == 2
+
+        assert make_agent("student_a").invalidate_cached_responses() == 1
+
+        reply_b = await make_agent("student_b").process_message("What does the FAFSA cover?")
+        assert reply_b.metadata['cached'] is True
+        assert client.messages.create.call_count == 2
+
+        reply_a = await make_agent("student_a").process_message("What does the FAFSA cover?")
+        assert 'cached' not in reply_a.metadata
+        assert client.messages.create.call_count == 3
+
+        ambassador._response_cache.clear()
+
+
+class TestStreaming:
+    """Tests for streaming replies through on_chunk."""
+
+    @pytest.mark.asyncio
+    async def test_stream_forwards_chunks(self):
+        """Test text deltas reach the callback and form the full reply."""
+        from agents import ambassador
+        from agents.ambassador import AmbassadorAgent
+
+        ambassador._response_cache.clear()
+
+        class FakeStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            @property
+            async def text_stream(self):
+                for text in ["Hello", ", ", "student!"]:
+                    yield text
+
+            async def get_final_message(self):
+                return Mock(usage=Mock(output_tokens=3))
+
+        client = MagicMock()
+        client.messages.stream = MagicMock(return_value=FakeStream())
+        client.messages.create = AsyncMock()
+
+        agent = AmbassadorAgent(student_id="stream_student")
+        agent._primary_client = client
+
+        chunks = []
+
+        async def on_chunk(text):
+            chunks.append(text)
+
+        response = await agent.process_message("Tell me something nice", on_chunk=on_chunk)
+
+        assert chunks == ["Hello", ", ", "student!"]
+        assert response.content == "Hello, student!"
+        assert response.metadata['tokens_used'] == 3
+        client.messages.create.assert_not_called()
+
+        ambassador._response_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_partial_stream_failure_skips_fallback(self):
+        """Test a stream that fails mid-reply is not followed by a fallback reply."""
+        from agents import ambassador
+        from agents.ambassador import AmbassadorAgent
+
+        ambassador._response_cache.clear()
+
+        class BrokenStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            @property
+            async def text_stream(self):
+                yield "Half of an"
+                raise ConnectionError("stream dropped")
+
+        client = MagicMock()
+        client.messages.stream = MagicMock(return_value=BrokenStream())
+
+        agent = AmbassadorAgent(student_id="stream_student")
+        agent._primary_client = client
+        agent._fallback_client = client
+        assert agent.fallback_model_name
+
+        chunks = []
+        with pytest.raises(ConnectionError):
+            await agent.process_message("Tell me something nice", on_chunk=chunks.append)
+
+        assert chunks == ["Half of an"]
+        assert client.messages.stream.call_count == 1
+
+        ambassador._response_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_before_output_uses_fallback(self):
+        """Test the fallback model answers when the primary failed before streaming."""
+        from agents import ambassador
+        from agents.ambassador import AmbassadorAgent
+
+        ambassador._response_cache.clear()
+
+        class FakeStream:
+            def __init__(self, texts, error=None):
+                self.texts = texts
+                self.error = error
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            @property
+            async def text_stream(self):
+                if self.error:
+                    raise self.error
+                for text in self.texts:
+                    yield text
+
+            async def get_final_message(self):
+                return Mock(usage=Mock(output_tokens=1))
+
+        client = MagicMock()
+        client.messages.stream = MagicMock(side_effect=[
+            FakeStream([], ConnectionError("refused")),
+            FakeStream(["Fallback reply"]),
+        ])
+
+        agent = AmbassadorAgent(student_id="stream_student")
+        agent._primary_client = client
+        agent._fallback_client = client
+
+        chunks = []
+        response = await agent.process_message("Tell me something nice", on_chunk=chunks.append)
+
+        assert chunks == ["Fallback reply"]
+        assert response.content == "Fallback reply"
+        assert client.messages.stream.call_args.kwargs['model'] == agent.fallback_model_name
+
+        ambassador._response_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_fallback_reply_is_emitted(self):
+        """Test the no-client fallback reply is sent to a sync callback."""
+        from agents.ambassador import AmbassadorAgent
+
+        agent = AmbassadorAgent()
+        # Hermetic even when ANTHROPIC_API_KEY is set in the environment
+        agent._primary_client = None
+        agent._fallback_client = None
+        chunks = []
+
+        response = await agent.process_message("Hello!", on_chunk=chunks.append)
+
+        assert chunks == [response.content]
+
 
 class TestGetAmbassador:
     """Tests for get_ambassador factory function."""
 
+    @pytest.fixture(autouse=True)
+    def empty_agent_cache(self):
+        """Start and finish each test with no cached agents."""
+        from agents import ambassador
+
+        ambassador._agent_cache.clear()
+        yield
+        ambassador._agent_cache.clear()
+        assert ambassador._agent_inflight == {}
+
     @pytest.mark.asyncio
     async def test_get_ambassador_creates_agent(self):
         """Test get_ambassador creates new agent."""
@@ -471,7 +1130,7 @@ class TestGetAmbassador:
 
         mock_graphiti = AsyncMock()
         mock_graphiti.initialize.return_value = True
-        mock_graphiti.get_student_history.return_value = []
+        mock_graphiti.batch_get_episodes.return_value = []
 
         agent = await get_ambassador(
             student_id="student_123",
@@ -488,7 +1147,7 @@ class TestGetAmbassador:
 
         mock_graphiti = AsyncMock()
         mock_graphiti.initialize.return_value = True
-        mock_graphiti.get_student_history.return_value = []
+        mock_graphiti.batch_get_episodes.return_value = []
 
         agent = await get_ambassador(
             student_id="student_456",
@@ -497,6 +1156,121 @@ class TestGetAmbassador:
 
         mock_graphiti.initialize.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_ambassador_reuses_cached_agent(self):
+        """Test repeat calls for a student return the same initialized agent."""
+        from agents.ambassador import get_ambassador
+
+        mock_graphiti = AsyncMock()
+        mock_graphiti.batch_get_episodes.return_value = []
+
+        first = await get_ambassador("student_789", graphiti_client=mock_graphiti)
+        second = await get_ambassador("student_789", graphiti_client=mock_graphiti)
+
+        assert first is second
+        mock_graphiti.initialize.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_ambassador_evicts_least_recent(self, monkeypatch):
+        """Test the cache evicts and closes the least recently used agent."""
+        from agents import ambassador
+        from agents.ambassador import get_ambassador
+
+        monkeypatch.setattr(ambassador, "AGENT_CACHE_SIZE", 2)
+
+        first = await get_ambassador("s1")
+        await get_ambassador("s2")
+        await get_ambassador("s1")
+        await get_ambassador("s3")
+
+        assert list(ambassador._agent_cache) == ["s1", "s3"]
+        assert await get_ambassador("s1") is first
+
+    @pytest.mark.asyncio
+    async def test_get_ambassador_initialization_does_not_block_others(self, monkeypatch):
+        """Test a slow cold start neither blocks other students nor runs twice."""
+        import asyncio
+        from agents import ambassador
+        from agents.ambassador import get_ambassador
+
+        cached = await get_ambassador("warm")
+        release = asyncio.Event()
+        inits = []
+
+        async def slow_initialize(agent):
+            inits.append(agent.student_id)
+            await release.wait()
+            return True
+
+        monkeypatch.setattr(ambassador.AmbassadorAgent, "initialize", slow_initialize)
+
+        cold = [asyncio.ensure_future(get_ambassador("cold")) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert await asyncio.wait_for(get_ambassador("warm"), timeout=1) is cached
+
+        release.set()
+        first, second, third = await asyncio.gather(*cold)
+        assert first is second is third
+        assert inits == ["cold"]
+
+    @pytest.mark.asyncio
+    async def test_get_ambassador_retries_after_failed_initialization(self, monkeypatch):
+        """Test callers waiting on a failed initialization start their own."""
+        import asyncio
+        from agents import ambassador
+        from agents.ambassador import get_ambassador
+
+        release = asyncio.Event()
+        attempts = []
+
+        async def flaky_initialize(agent):
+            attempts.append(agent)
+            if len(attempts) == 1:
+                await release.wait()
+                raise ConnectionError("graph unavailable")
+            return True
+
+        monkeypatch.setattr(ambassador.AmbassadorAgent, "initialize", flaky_initialize)
+
+        failing = asyncio.ensure_future(get_ambassador("student"))
+        await asyncio.sleep(0)
+        waiting = asyncio.ensure_future(get_ambassador("student"))
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(ConnectionError):
+            await failing
+        agent = await waiting
+
+        assert agent is attempts[1]
+        assert await get_ambassador("student") is agent
+
+    @pytest.mark.asyncio
+    async def test_get_ambassador_refreshes_stale_history(self, monkeypatch):
+        """Test a stale cached agent reloads its history in the background."""
+        import asyncio
+        from agents import ambassador
+        from agents.ambassador import get_ambassador
+
+        mock_graphiti = AsyncMock()
+        mock_graphiti.batch_get_episodes.return_value = [{"fact": "Earlier chat"}]
+
+        agent = await get_ambassador("student_stale", graphiti_client=mock_graphiti)
+        assert len(agent.get_conversation_history()) == 1
+
+        monkeypatch.setattr(ambassador, "AGENT_REFRESH_SECONDS", -1)
+        mock_graphiti.batch_get_episodes.return_value = [
+            {"fact": "Earlier chat"}, {"fact": "Newer chat", "role": "assistant"}
+        ]
+
+        assert await get_ambassador("student_stale") is agent
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        history = agent.get_conversation_history()
+        assert [m.content for m in history] == ["Earlier chat", "Newer chat"]
+
 
 class TestAcceptanceCriteria:
     """Tests verifying Story 2.1 acceptance criteria."""
@@ -526,8 +1300,8 @@ class TestAcceptanceCriteria:
         # Verify agent can use Graphiti
         mock_graphiti = AsyncMock()
         mock_graphiti.initialize.return_value = True
-        mock_graphiti.get_student_history.return_value = [
-            {"fact": "Previous conversation", "is_assistant": True}
+        mock_graphiti.batch_get_episodes.return_value = [
+            {"fact": "Previous conversation", "role": "assistant"}
         ]
 
         agent = AmbassadorAgent(
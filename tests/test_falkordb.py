@@ -357,6 +357,28 @@ class TestRelationshipOperations:
         call_args = mock_graph.query.call_args
         assert 'EXHIBITS_BEHAVIOR' in call_args[0][0]
 
+    @patch('db.falkordb_client.FalkorDB')
+    def test_writes_bump_generation(self, mock_falkordb_class):
+        """Test that writes bump the generation and reads do not."""
+        from db.falkordb_client import FalkorDBClient
+
+        mock_db = MagicMock()
+        mock_graph = MagicMock()
+        mock_falkordb_class.return_value = mock_db
+        mock_db.select_graph.return_value = mock_graph
+        mock_graph.query.return_value = MockResult([])
+
+        client = FalkorDBClient()
+        client.connect()
+        assert client.generation == 0
+
+        client.get_school('school_test')
+        assert client.generation == 0
+
+        client.create_school_behavior('school_test', 'behavior_test', 0.85, 100)
+        client.write("MATCH (s:School {id: 'school_test'}) DELETE s")
+        assert client.generation == 2
+
     @patch('db.falkordb_client.FalkorDB')
     def test_get_school_behaviors(self, mock_falkordb_class):
         """Test retrieving behaviors for a school."""
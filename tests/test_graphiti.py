@@ -94,6 +94,44 @@ class TestGraphitiClientWithMocks:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_add_episodes_batch(self, mock_graphiti):
+        """Test several episodes are written with one bulk call."""
+        from db.graphiti_client import GraphitiClient
+
+        client = GraphitiClient()
+        client._graphiti = mock_graphiti
+        client._initialized = True
+
+        result = await client.add_episodes_batch(
+            [
+                {'name': 'e1', 'episode_body': 'Hello'},
+                {'name': 'e2', 'episode_body': 'Hi there', 'source_description': 'sms_conversation'},
+            ],
+            group_id="student_123"
+        )
+
+        assert result is True
+        mock_graphiti.add_episode_bulk.assert_called_once()
+        raw_episodes = mock_graphiti.add_episode_bulk.call_args[0][0]
+        assert [e.content for e in raw_episodes] == ['Hello', 'Hi there']
+        assert raw_episodes[1].source_description == 'sms_conversation'
+        assert mock_graphiti.add_episode_bulk.call_args[1]['group_id'] == "student_123"
+
+    @pytest.mark.asyncio
+    async def test_add_episodes_batch_failure(self, mock_graphiti):
+        """Test a failed bulk write is reported so callers keep the batch."""
+        from db.graphiti_client import GraphitiClient
+
+        mock_graphiti.add_episode_bulk.side_effect = Exception("write failed")
+        client = GraphitiClient()
+        client._graphiti = mock_graphiti
+        client._initialized = True
+
+        result = await client.add_episodes_batch([{'name': 'e1', 'episode_body': 'Hello'}])
+
+        assert result is False
+
     @pytest.mark.asyncio
     async def test_add_conversation(self, mock_graphiti):
         """Test adding a formatted conversation."""
@@ -313,6 +351,40 @@ class TestStudentHistory:
         call_kwargs = mock_graphiti.search.call_args.kwargs
         assert call_kwargs['group_ids'] == ["student_123"]
 
+    @pytest.mark.asyncio
+    async def test_batch_get_episodes(self):
+        """Test retrieving all recent episodes with a single query."""
+        from db.graphiti_client import GraphitiClient
+
+        mock_graphiti = AsyncMock()
+        mock_graphiti.retrieve_episodes = AsyncMock(return_value=[
+            Mock(uuid="ep1", content="Hi", source_description="web_conversation",
+                 valid_at=None, created_at=None),
+            Mock(uuid="ep2", content="Hello!", source_description="web_conversation:assistant",
+                 valid_at=None, created_at=None),
+        ])
+
+        client = GraphitiClient()
+        client._graphiti = mock_graphiti
+        client._initialized = True
+
+        episodes = await client.batch_get_episodes("student_123", limit=50)
+
+        assert [e['fact'] for e in episodes] == ["Hi", "Hello!"]
+        assert [e['role'] for e in episodes] == [None, "assistant"]
+        mock_graphiti.retrieve_episodes.assert_called_once()
+        call_kwargs = mock_graphiti.retrieve_episodes.call_args.kwargs
+        assert call_kwargs['group_ids'] == ["student_123"]
+        assert call_kwargs['last_n'] == 50
+
+    @pytest.mark.asyncio
+    async def test_batch_get_episodes_not_initialized(self):
+        """Test batch episode retrieval when client not initialized."""
+        from db.graphiti_client import GraphitiClient
+
+        client = GraphitiClient()
+        assert await client.batch_get_episodes("student_123") == []
+
 
 class TestHealthCheck:
     """Tests for health check functionality."""
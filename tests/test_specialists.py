@@ -75,6 +75,24 @@ class TestScholarshipScoutAgent:
         assert LegitimacyStatus.VERIFIED.value == "verified"
         assert LegitimacyStatus.SCAM.value == "scam"
 
+    def test_discovery_deadline_iso(self):
+        """Test the deadline string is formatted once and cached."""
+        from agents.specialists.scholarship_scout import (
+            ScholarshipDiscovery, LegitimacyStatus
+        )
+
+        def discovery(deadline):
+            return ScholarshipDiscovery(
+                id="s1", name="Test", source_url="", amount_min=0, amount_max=0,
+                deadline=deadline, criteria="", eligibility=[], how_to_apply="",
+                legitimacy=LegitimacyStatus.VERIFIED,
+            )
+
+        dated = discovery(date(2026, 3, 1))
+        assert dated.deadline_iso == "2026-03-01"
+        assert 'deadline_iso' in vars(dated)
+        assert discovery(None).deadline_iso is None
+
     def test_crawl_result_dataclass(self):
         """Test CrawlResult dataclass."""
         from agents.specialists.scholarship_scout import CrawlResult, CrawlStatus
@@ -306,6 +324,26 @@ class TestAppealStrategistAgent:
         assert behavior.negotiates is True
         assert behavior.success_rate == 0.4
 
+    def test_school_behavior_argument_values(self):
+        """Argument values are converted once and reused."""
+        from agents.specialists.appeal_strategist import SchoolBehavior, ArgumentType
+
+        behavior = SchoolBehavior(
+            school_id="stanford",
+            school_name="Stanford University",
+            negotiates=True,
+            responds_to_competing_offers=True,
+            typical_increase_percent=12.0,
+            typical_increase_amount=3000.0,
+            success_rate=0.4,
+            sample_size=100,
+            common_arguments=[ArgumentType.COMPETING_OFFERS, ArgumentType.FINANCIAL_HARDSHIP],
+            best_timing="Within 2 weeks",
+        )
+
+        assert behavior.common_argument_values == ("competing_offers", "financial_hardship")
+        assert behavior.common_argument_values is behavior.common_argument_values
+
     def test_strategist_initialization(self):
         """Test strategist initialization."""
         from agents.specialists.appeal_strategist import AppealStrategistAgent
@@ -331,6 +369,40 @@ class TestAppealStrategistAgent:
 
         assert 'negotiates' in result or 'found' in result
 
+    def test_recommend_bulk_matches_single(self):
+        """Bulk recommendations match per-school recommendations."""
+        from agents.specialists.appeal_strategist import (
+            AppealStrategistAgent, SchoolBehavior, ArgumentType,
+        )
+
+        def behavior(negotiates, competing, rate):
+            return SchoolBehavior(
+                school_id="s", school_name="S", negotiates=negotiates,
+                responds_to_competing_offers=competing,
+                typical_increase_percent=10.0, typical_increase_amount=2500.0,
+                success_rate=rate, sample_size=10,
+                common_arguments=[ArgumentType.FINANCIAL_HARDSHIP],
+                best_timing="Within 2 weeks",
+            )
+
+        behaviors = [
+            behavior(False, False, 0.1),
+            behavior(True, False, 0.5),
+            behavior(True, True, 0.2),
+            behavior(True, False, 0.2),
+            behavior(True, False, 0.5),
+        ]
+
+        strategist = AppealStrategistAgent()
+        bulk = strategist.recommend_bulk(behaviors)
+
+        assert bulk == [strategist._generate_recommendation(b) for b in behaviors]
+        assert "not negotiated" in bulk[0]
+        assert "50%" in bulk[1] and "$2,500" in bulk[1]
+        assert "competing offers" in bulk[2]
+        assert "20%" in bulk[3]
+        assert bulk[1] is bulk[4]
+
     @pytest.mark.asyncio
     async def test_get_strategies(self):
         """AC: Strategist can identify effective arguments."""
@@ -386,6 +458,118 @@ class TestAppealStrategistAgent:
         assert 'full_text' in draft
         assert 'change' in draft['full_text'].lower() or 'circumstance' in draft['full_text'].lower()
 
+    @pytest.mark.asyncio
+    async def test_draft_ids_are_unique(self):
+        """Back-to-back drafts for the same school get distinct IDs."""
+        from agents.specialists.appeal_strategist import AppealStrategistAgent
+
+        strategist = AppealStrategistAgent()
+        other = AppealStrategistAgent()
+
+        ids = [
+            (await agent.draft_appeal("stanford", {}))['draft_id']
+            for agent in (strategist, strategist, other)
+        ]
+
+        assert len(set(ids)) == 3
+        assert all(i.startswith("draft_stanford_") for i in ids)
+
+    def test_compose_full_letter_layout(self):
+        """Letter paragraphs are separated by single blank lines."""
+        from agents.specialists.appeal_strategist import (
+            AppealStrategistAgent, AppealDraft, StrategyType,
+        )
+
+        draft = AppealDraft(
+            draft_id="d", school_id="s", strategy_used=StrategyType.MERIT_BASED,
+            subject_line="Subject", greeting="Dear Office,", opening="Opening.",
+            body_paragraphs=["Body one.", "Body two."], closing="Closing.",
+            signature_block="Sincerely,\nName", key_points_addressed=[],
+            tone="professional", word_count=0,
+        )
+
+        text = AppealStrategistAgent()._compose_full_letter(draft)
+
+        assert text == (
+            "Dear Office,\n\nOpening.\n\nBody one.\n\nBody two.\n\n"
+            "Closing.\n\nSincerely,\nName"
+        )
+
+    def test_compiled_templates_match_format(self):
+        """Precompiled templates render the same text as str.format."""
+        from agents.specialists.appeal_strategist import (
+            APPEAL_TEMPLATES, TEMPLATE_SECTIONS, _COMPILED_TEMPLATES, _render,
+        )
+
+        values = {
+            'school_name': 'Stanford University',
+            'competing_school': 'MIT',
+            'competing_amount': '$50,000',
+            'circumstance_description': 'a job loss',
+            'new_achievements': 'a national award',
+        }
+
+        for strategy_type, template in APPEAL_TEMPLATES.items():
+            for section in TEMPLATE_SECTIONS:
+                rendered = _render(getattr(_COMPILED_TEMPLATES[strategy_type], section), values)
+                assert rendered == template[section].format(**values)
+
+    def test_appeal_templates_are_read_only(self):
+        """Templates cannot be modified at runtime."""
+        from agents.specialists.appeal_strategist import APPEAL_TEMPLATES, StrategyType
+
+        with pytest.raises(TypeError):
+            APPEAL_TEMPLATES[StrategyType.NEED_BASED] = {}
+        with pytest.raises(TypeError):
+            APPEAL_TEMPLATES[StrategyType.MERIT_BASED]['subject'] = "Changed"
+
+    def test_static_template_sections_prerendered(self):
+        """Sections without fields are stored as their final text."""
+        from agents.specialists.appeal_strategist import (
+            APPEAL_TEMPLATES, StrategyType, _COMPILED_TEMPLATES,
+        )
+
+        opening = _COMPILED_TEMPLATES[StrategyType.CHANGED_CIRCUMSTANCES].opening
+        assert opening == APPEAL_TEMPLATES[StrategyType.CHANGED_CIRCUMSTANCES]['opening']
+        assert not isinstance(_COMPILED_TEMPLATES[StrategyType.MERIT_BASED].opening, str)
+
+    @pytest.mark.asyncio
+    async def test_draft_appeal_word_count(self):
+        """Word count covers the opening, body and closing."""
+        from agents.specialists.appeal_strategist import AppealStrategistAgent
+
+        strategist = AppealStrategistAgent()
+        draft = await strategist.draft_appeal(
+            school_id="stanford",
+            student_context={'school_name': 'Stanford University', 'has_competing_offer': True},
+        )
+
+        letter_body = draft['full_text'].split("\n\n")[1:4]
+        assert draft['word_count'] == len(" ".join(letter_body).split())
+
+    @pytest.mark.asyncio
+    async def test_draft_appeal_strategy_id_lookup(self):
+        """Strategy IDs from get_strategies select the matching template."""
+        from agents.specialists.appeal_strategist import AppealStrategistAgent
+
+        strategist = AppealStrategistAgent()
+        context = {'has_competing_offer': True}
+
+        for strategy_id, expected in [
+            ('competing_offer_1', 'competing_offer'),
+            ('changed_circumstances_1', 'changed_circumstances'),
+            ('merit_based_1', 'merit_based'),
+            ('need_based_1', 'need_based'),
+            ('unknown_1', 'competing_offer'),  # falls back to context
+            # Bare type values, as A2A params may carry them
+            ('competing_offer', 'competing_offer'),
+            ('changed_circumstances', 'changed_circumstances'),
+            ('merit_based', 'merit_based'),
+            ('need_based', 'need_based'),
+        ]:
+            draft = await strategist.draft_appeal("stanford", context, strategy_id=strategy_id)
+            assert draft['strategy_used'] == expected
+
     @pytest.mark.asyncio
     async def test_get_success_patterns(self, mock_falkordb):
         """Test getting success patterns."""
@@ -399,6 +583,29 @@ class TestAppealStrategistAgent:
         assert len(patterns) > 0
         assert all('success_rate' in p for p in patterns)
 
+    @pytest.mark.asyncio
+    async def test_success_patterns_cached_per_generation(self):
+        """Patterns are re-queried only after the commons generation changes."""
+        from agents.specialists.appeal_strategist import AppealStrategistAgent
+
+        strategy_node = MagicMock()
+        strategy_node.properties = {'id': 'st1', 'type': 'appeal', 'description': 'Appeal'}
+        mock = MagicMock()
+        mock.generation = 0
+        mock.query.return_value.result_set = [[strategy_node, 0.6, 40]]
+
+        strategist = AppealStrategistAgent(falkordb_client=mock)
+
+        first = await strategist.get_success_patterns()
+        first[0]['success_rate'] = 0  # callers get their own copies
+        second = await strategist.get_success_patterns()
+        assert mock.query.call_count == 1
+        assert second[0]['success_rate'] == 0.6
+
+        mock.generation = 1
+        await strategist.get_success_patterns()
+        assert mock.query.call_count == 2
+
     @pytest.mark.asyncio
     async def test_all_inputs_anonymized(self):
         """AC: All inputs are anonymized."""
@@ -419,6 +626,169 @@ class TestAppealStrategistAgent:
         assert 'full_text' in draft
         assert len(draft['full_text']) > 50
 
+    @pytest.mark.asyncio
+    async def test_school_behavior_cache_hit(self, mock_falkordb):
+        """Repeated lookups are served from the behavior cache."""
+        from agents.specialists.appeal_strategist import AppealStrategistAgent
+
+        strategist = AppealStrategistAgent(falkordb_client=mock_falkordb)
+
+        await strategist.analyze_school("stanford")
+        await strategist.get_strategies("stanford")
+
+        assert mock_falkordb.query.call_count == 1
+        stats = strategist.get_stats()
+        assert stats['cache_hits'] == 1
+        assert stats['cache_misses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_analyses_share_one_fetch(self):
+        """Concurrent lookups for one school wait on a single fetch."""
+        import asyncio
+        from agents.specialists.appeal_strategist import AppealStrategistAgent
+
+        strategist = AppealStrategistAgent()
+        fetches = []
+
+        async def slow_fetch(school_id):
+            fetches.append(school_id)
+            await asyncio.sleep(0.01)
+            return None  # not found, so nothing is cached
+
+        strategist._fetch_school_behavior = slow_fetch
+
+        results = await asyncio.gather(*(
+            strategist.analyze_school("stanford") for _ in range(5)
+        ))
+
+        assert fetches == ["stanford"]
+        assert all(r['found'] is False for r in results)
+        assert strategist._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_shared_fetch_is_retried(self):
+        """Waiters fetch again when the shared fetch fails."""
+        import asyncio
+        from agents.specialists.appeal_strategist import AppealStrategistAgent
+
+        strategist = AppealStrategistAgent()
+        calls = 0
+
+        async def flaky_fetch(school_id):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            if calls == 1:
+                raise RuntimeError("commons unavailable")
+            return strategist._get_default_behavior(school_id)
+
+        strategist._fetch_school_behavior = flaky_fetch
+
+        first, second = await asyncio.gather(
+            strategist.analyze_school("stanford"),
+            strategist.analyze_school("stanford"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(first, RuntimeError)
+        assert second['found'] is True
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_school_behavior_cache_expires(self, mock_falkordb, monkeypatch):
+        """Entries older than the TTL are refetched."""
+        from agents.specialists import appeal_strategist
+        from agents.specialists.appeal_strategist import AppealStrategistAgent
+
+        strategist = AppealStrategistAgent(falkordb_client=mock_falkordb)
+
+        monkeypatch.setattr(appeal_strategist.time, 'monotonic', lambda: 0.0)
+        await strategist.analyze_school("stanford")
+        later = appeal_strategist.SCHOOL_BEHAVIOR_TTL_SECONDS + 1
+        monkeypatch.setattr(appeal_strategist.time, 'monotonic', lambda: later)
+        await strategist.analyze_school("stanford")
+
+        assert mock_falkordb.query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_school_behavior_cache_bounded(self, monkeypatch):
+        """The behavior cache evicts least recently used schools."""
+        from agents.specialists import appeal_strategist
+        from agents.specialists.appeal_strategist import AppealStrategistAgent
+
+        strategist = AppealStrategistAgent()
+
+        monkeypatch.setattr(appeal_strategist, 'SCHOOL_BEHAVIOR_CACHE_SIZE', 2)
+        await strategist.analyze_school("a")
+        await strategist.analyze_school("b")
+        await strategist.analyze_school("a")
+        await strategist.analyze_school("c")
+
+        assert list(strategist._school_behaviors) == ["a", "c"]
+
+    def test_parse_school_behavior_keywords(self):
+        """Behavior patterns are matched case-insensitively, each keyword once."""
+        from agents.specialists.appeal_strategist import AppealStrategistAgent, ArgumentType
+
+        def behavior(pattern):
+            node = MagicMock()
+            node.properties = {'pattern': pattern}
+            return {'behavior': node}
+
+        school = MagicMock()
+        school.properties = {'name': 'Stanford University'}
+        strategist = AppealStrategistAgent()
+
+        parsed = strategist._parse_school_behavior("stanford", school, [
+            behavior('Negotiates_With_COMPETING_offers_competing'),
+            behavior('meets_full_need'),
+            {'behavior': None},
+        ])
+        assert parsed.negotiates is True
+        assert parsed.responds_to_competing_offers is True
+        assert parsed.common_arguments == [ArgumentType.COMPETING_OFFERS]
+
+        parsed = strategist._parse_school_behavior("stanford", school, [behavior('meets_full_need')])
+        assert parsed.negotiates is False
+        assert parsed.responds_to_competing_offers is False
+
+    @pytest.mark.asyncio
+    async def test_analyze_schools_batches_misses(self):
+        """Uncached schools are fetched with a single UNWIND query."""
+        from agents.specialists.appeal_strategist import AppealStrategistAgent
+
+        def school(school_id, name):
+            node = MagicMock()
+            node.properties = {'id': school_id, 'name': name}
+            return node
+
+        behavior_node = MagicMock()
+        behavior_node.properties = {'pattern': 'negotiates_with_competing_offers'}
+
+        mock = MagicMock()
+        mock.query.return_value.result_set = [
+            ['mit', school('mit', 'MIT'), [{'behavior': behavior_node}]],
+            ['yale', school('yale', 'Yale'), []],
+        ]
+
+        strategist = AppealStrategistAgent(falkordb_client=mock)
+        strategist._cache_behavior('stanford', strategist._get_default_behavior('stanford'))
+
+        results = await strategist.analyze_schools(['stanford', 'mit', 'yale', 'nowhere'])
+
+        assert mock.query.call_count == 1
+        assert 'UNWIND' in mock.query.call_args[0][0]
+        assert mock.query.call_args[0][1] == {'ids': ['mit', 'yale', 'nowhere']}
+        assert [r['school_id'] for r in results] == ['stanford', 'mit', 'yale', 'nowhere']
+        assert results[1]['school_name'] == 'MIT'
+        assert results[1]['negotiates'] is True
+        assert results[2]['negotiates'] is False
+        assert results[3]['found'] is False
+
+        # Fetched schools are now served from the cache
+        await strategist.analyze_school('mit')
+        assert mock.query.call_count == 1
+
     def test_get_stats(self):
         """Test getting strategist stats."""
         from agents.specialists.appeal_strategist import AppealStrategistAgent
@@ -488,6 +858,35 @@ class TestDeadlineSentinelAgent:
         assert deadline.is_past is True
         assert deadline.days_until < 0
 
+    def test_days_until_uses_cached_day(self, monkeypatch):
+        """days_until reads a per-day cache that refreshes after midnight."""
+        import time
+        from agents.specialists import deadline_sentinel
+        from agents.specialists.deadline_sentinel import DeadlineEntry, DeadlineType
+
+        cached_day = date(2020, 1, 1)
+        deadline = DeadlineEntry(
+            id="cached",
+            deadline_type=DeadlineType.FAFSA,
+            name="Cached",
+            due_date=date(2020, 1, 11),
+        )
+
+        # Before the cached midnight, the cached day is used
+        monkeypatch.setattr(deadline_sentinel, '_today_cache', (
+            time.time() + 3600, cached_day, cached_day.toordinal(),
+        ))
+        assert deadline.days_until == 10
+        assert deadline.is_past is False
+
+        # Once midnight has passed, the real date is picked up
+        monkeypatch.setattr(deadline_sentinel, '_today_cache', (
+            0.0, cached_day, cached_day.toordinal(),
+        ))
+        assert deadline.days_until == (date(2020, 1, 11) - date.today()).days
+        assert deadline.is_past is True
+        assert deadline_sentinel._today() == date.today()
+
     def test_scrape_result_dataclass(self):
         """Test ScrapeResult dataclass."""
         from agents.specialists.deadline_sentinel import ScrapeResult
@@ -574,6 +973,629 @@ class TestDeadlineSentinelAgent:
         assert len(results) > 0
         assert sentinel._last_scrape is not None
 
+    @pytest.mark.asyncio
+    async def test_scrape_cycle_runs_portals_concurrently(self):
+        """Portal scrapes overlap instead of running one after another."""
+        import asyncio
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, SCHOOL_PORTAL_PATTERNS,
+        )
+
+        active = 0
+        peak = 0
+
+        async def slow_get(url, headers, timeout):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if "mit" in url:
+                raise RuntimeError("boom")
+            return MagicMock(text="")
+
+        http_client = MagicMock()
+        http_client.get = slow_get
+
+        sentinel = DeadlineSentinelAgent(http_client=http_client)
+        await sentinel.start()
+
+        results = await sentinel.run_scrape_cycle()
+
+        assert peak == len(SCHOOL_PORTAL_PATTERNS)
+        assert [r.source_url for r in results] == list(SCHOOL_PORTAL_PATTERNS.values())
+        failed = [r for r in results if not r.success]
+        assert len(failed) == 1
+        assert failed[0].errors == ["boom"]
+
+    @pytest.mark.asyncio
+    async def test_scrape_cycle_discovers_in_one_query(self):
+        """All schools' deadlines are looked up with a single UNWIND query."""
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, DeadlineType, SCHOOL_PORTAL_PATTERNS,
+        )
+
+        def deadline_node(deadline_id, due_date, deadline_type):
+            node = MagicMock()
+            node.properties = {
+                'id': deadline_id,
+                'name': deadline_id,
+                'due_date': due_date,
+                'type': deadline_type,
+            }
+            return node
+
+        due = (date.today() + timedelta(days=40)).isoformat()
+        mock = MagicMock()
+        mock.query.return_value.result_set = [
+            ['stanford', deadline_node('stanford_priority', due, 'school_priority')],
+            ['stanford', deadline_node('stanford_bad', 'not a date', 'other')],
+            ['mit', deadline_node('mit_css', due, 'CSS_PROFILE')],
+        ]
+
+        sentinel = DeadlineSentinelAgent(falkordb_client=mock)
+        await sentinel.start()
+        results = await sentinel.run_scrape_cycle()
+
+        assert mock.query.call_count == 1
+        query, params = mock.query.call_args[0]
+        assert 'UNWIND' in query
+        assert params == {'ids': list(SCHOOL_PORTAL_PATTERNS)}
+
+        by_url = {r.source_url: r for r in results}
+        assert by_url[SCHOOL_PORTAL_PATTERNS['stanford']].new_deadlines == 1
+        assert by_url[SCHOOL_PORTAL_PATTERNS['mit']].new_deadlines == 1
+        assert by_url[SCHOOL_PORTAL_PATTERNS['yale']].deadlines_found == 0
+        assert sentinel._deadlines['mit_css'].deadline_type == DeadlineType.CSS_PROFILE
+        assert sentinel._deadlines['mit_css'].school_id == 'mit'
+
+    def test_records_use_slots(self):
+        """Sentinel records carry no per-instance __dict__."""
+        from agents.specialists.deadline_sentinel import (
+            DeadlineEntry, DeadlineChange, DeadlineType, ScrapeResult,
+        )
+
+        entry = DeadlineEntry(
+            id="x", deadline_type=DeadlineType.OTHER, name="X", due_date=date.today(),
+        )
+        change = DeadlineChange(deadline_id="x", change_type="new")
+        result = ScrapeResult(
+            source_url="u", deadlines_found=0, new_deadlines=0, updated_deadlines=0,
+        )
+        for record in (entry, change, result):
+            assert not hasattr(record, "__dict__")
+        assert entry.days_until == 0
+        assert entry.is_past is False
+
+    @pytest.mark.asyncio
+    async def test_subscribers_are_a_set(self):
+        """Subscribers are stored as a set, whatever iterable is passed in."""
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, DeadlineEntry, DeadlineType,
+        )
+
+        entry = DeadlineEntry(
+            id="subs",
+            deadline_type=DeadlineType.OTHER,
+            name="Subs",
+            due_date=date.today(),
+            student_ids=["a", "b", "a"],
+        )
+        assert entry.student_ids == {"a", "b"}
+
+        sentinel = DeadlineSentinelAgent()
+        await sentinel.add_deadline(entry)
+        assert await sentinel.subscribe_student("a", "subs") is True
+        assert await sentinel.unsubscribe_student("c", "subs") is True
+        assert sentinel._deadlines["subs"].student_ids == {"a", "b"}
+
+    def test_status_boundaries(self):
+        """Statuses change 7 days out, 1 day out and once past due."""
+        from agents.specialists.deadline_sentinel import _status_for, DeadlineStatus
+
+        assert _status_for(30) == (DeadlineStatus.UPCOMING, 23)
+        assert _status_for(7) == (DeadlineStatus.DUE_SOON, 6)
+        assert _status_for(1) == (DeadlineStatus.URGENT, 2)
+        assert _status_for(0) == (DeadlineStatus.URGENT, 1)
+        assert _status_for(-1) == (DeadlineStatus.PASSED, None)
+
+    @pytest.mark.asyncio
+    async def test_status_tasks_follow_deadlines(self):
+        """Running sentinels keep one status task per live deadline."""
+        import asyncio
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, DeadlineEntry, DeadlineType, DeadlineStatus,
+        )
+
+        sentinel = DeadlineSentinelAgent()
+        assert sentinel._status_tasks == {}
+
+        await sentinel.start()
+        await asyncio.sleep(0)
+        # Passed FAFSA deadlines need no task
+        live = {d.id for d in sentinel._deadlines.values() if not d.is_past}
+        assert set(sentinel._status_tasks) == live
+
+        soon = DeadlineEntry(
+            id="soon",
+            deadline_type=DeadlineType.SCHOLARSHIP,
+            name="Soon",
+            due_date=date.today() + timedelta(days=3),
+        )
+        await sentinel.add_deadline(soon)
+        first = sentinel._status_tasks["soon"]
+        await asyncio.sleep(0)
+        assert soon.status == DeadlineStatus.DUE_SOON
+
+        await sentinel.add_deadline(soon)
+        assert sentinel._status_tasks["soon"] is not first
+        await asyncio.sleep(0)
+        assert first.cancelled()
+
+        tasks = list(sentinel._status_tasks.values())
+        await sentinel.stop()
+        assert sentinel._status_tasks == {}
+        assert all(task.done() for task in tasks)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_round_trip(self, tmp_path):
+        """Deadlines and changes saved on stop are restored on start."""
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, DeadlineEntry, DeadlineChange, DeadlineType,
+        )
+
+        path = tmp_path / "cache" / "deadlines.mp"
+        sentinel = DeadlineSentinelAgent(snapshot_path=str(path))
+        await sentinel.start()
+        await sentinel.add_deadline(DeadlineEntry(
+            id="mit_css",
+            deadline_type=DeadlineType.CSS_PROFILE,
+            name="MIT CSS Profile",
+            due_date=date(2030, 2, 15),
+            school_id="mit",
+            student_ids=["s1"],
+            last_verified=datetime(2029, 12, 1, 8, 30),
+            metadata={"round": "regular"},
+        ))
+        sentinel._changes.append(DeadlineChange(
+            deadline_id="mit_css",
+            change_type="updated",
+            old_date=date(2030, 2, 1),
+            new_date=date(2030, 2, 15),
+        ))
+        await sentinel.stop()
+        assert path.exists()
+
+        restored = DeadlineSentinelAgent(snapshot_path=str(path))
+        await restored.start()
+        entry = restored._deadlines["mit_css"]
+        original = sentinel._deadlines["mit_css"]
+        assert entry == original
+        assert restored._by_school["mit"] == {"mit_css"}
+        assert len(restored._deadlines) == len(sentinel._deadlines)
+        assert list(restored._changes) == list(sentinel._changes)
+
+    @pytest.mark.asyncio
+    async def test_restart_does_not_duplicate_changes(self, tmp_path):
+        """Stopping and restarting the same sentinel keeps one copy of each change."""
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, DeadlineChange,
+        )
+
+        sentinel = DeadlineSentinelAgent(snapshot_path=str(tmp_path / "deadlines.mp"))
+        await sentinel.start()
+        sentinel._changes.append(DeadlineChange(
+            deadline_id="fafsa_2025",
+            change_type="updated",
+            old_date=date(2030, 2, 1),
+            new_date=date(2030, 2, 15),
+        ))
+        await sentinel.stop()
+        await sentinel.start()
+
+        assert len(sentinel._changes) == 1
+        assert sentinel.get_stats()["changes_detected"] == 1
+        await sentinel.stop()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_missing_or_corrupt(self, tmp_path):
+        """A missing or unreadable snapshot leaves the default deadlines."""
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        path = tmp_path / "deadlines.mp"
+        sentinel = DeadlineSentinelAgent(snapshot_path=str(path))
+        assert sentinel.load_snapshot() is False
+
+        path.write_bytes(b"{not json")
+        assert sentinel.load_snapshot() is False
+        await sentinel.start()
+        assert len(sentinel._deadlines) == len(DeadlineSentinelAgent()._deadlines)
+
+    def test_parse_deadline_node_types_and_dates(self):
+        """Deadline nodes map unknown types to OTHER and reject bad dates."""
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, DeadlineType,
+        )
+
+        sentinel = DeadlineSentinelAgent()
+        node = MagicMock()
+        node.properties = {'id': 'x', 'due_date': '2030-01-15', 'type': 'Scholarship'}
+        entry = sentinel._parse_deadline_node('mit', node)
+        assert entry.due_date == date(2030, 1, 15)
+        assert entry.deadline_type == DeadlineType.SCHOLARSHIP
+
+        node.properties = {'id': 'y', 'due_date': date(2030, 2, 1), 'type': 'mystery'}
+        entry = sentinel._parse_deadline_node('mit', node)
+        assert entry.due_date == date(2030, 2, 1)
+        assert entry.deadline_type == DeadlineType.OTHER
+
+        node.properties = {'id': 'z', 'due_date': '2030-13-45'}
+        assert sentinel._parse_deadline_node('mit', node) is None
+
+    def test_parse_deadline_node_accepts_unpadded_dates(self):
+        """Commons dates without zero padding parse; ISO basic format does not."""
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        sentinel = DeadlineSentinelAgent()
+        node = MagicMock()
+        node.properties = {'id': 'x', 'due_date': '2030-3-1'}
+        assert sentinel._parse_deadline_node('mit', node).due_date == date(2030, 3, 1)
+
+        node.properties = {'id': 'y', 'due_date': '2030-03-1'}
+        assert sentinel._parse_deadline_node('mit', node).due_date == date(2030, 3, 1)
+
+        node.properties = {'id': 'z', 'due_date': '20300301'}
+        assert sentinel._parse_deadline_node('mit', node) is None
+
+    @pytest.mark.asyncio
+    async def test_scrape_fetches_pages_with_bound_client(self):
+        """A bound HTTP client is used to fetch portals; errors fail the scrape."""
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        ok = MagicMock(text="<html></html>")
+        broken = MagicMock()
+        broken.raise_for_status.side_effect = RuntimeError("404 Not Found")
+
+        http_client = AsyncMock()
+        http_client.get.side_effect = lambda url, headers, timeout: broken if "mit" in url else ok
+
+        sentinel = DeadlineSentinelAgent()
+        sentinel.bind_http_client(http_client)
+        await sentinel.start()
+
+        results = await sentinel.run_scrape_cycle()
+
+        assert http_client.get.call_count == len(results)
+        failed = [r for r in results if not r.success]
+        assert len(failed) == 1
+        assert "mit" in failed[0].source_url
+        assert failed[0].errors == ["404 Not Found"]
+
+    @pytest.mark.asyncio
+    async def test_scrape_cycle_shares_one_timestamp(self):
+        """Everything recorded in one scrape cycle carries the same time."""
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        node = MagicMock()
+        node.properties = {
+            'id': 'mit_css',
+            'due_date': (date.today() + timedelta(days=40)).isoformat(),
+        }
+        mock = MagicMock()
+        mock.query.return_value.result_set = [['mit', node]]
+
+        sentinel = DeadlineSentinelAgent(falkordb_client=mock)
+        await sentinel.start()
+        results = await sentinel.run_scrape_cycle()
+
+        stamps = {r.scraped_at for r in results}
+        stamps.add(sentinel._changes[-1].detected_at)
+        stamps.add(sentinel._deadlines['mit_css'].last_verified)
+        assert stamps == {sentinel._last_scrape}
+
+    def test_parse_deadline_html(self):
+        """Dates in page text become typed deadline properties."""
+        from agents.specialists.deadline_sentinel import _parse_deadline_html
+
+        html = """
+        <html><head><script>var d = "2030-09-09";</script></head>
+        <body>
+          <p>CSS Profile priority: 2030-11-01</p>
+          <li>Priority filing deadline 2031-02-01</li>
+          <li>Final  deadline: 2031-03-01 or 2031-03-15</li>
+        </body></html>
+        """
+        parsed = _parse_deadline_html(html, "mit")
+
+        assert [(p['id'], p['type'], p['due_date']) for p in parsed] == [
+            ("mit_css_profile", "css_profile", "2030-11-01"),
+            ("mit_school_priority", "school_priority", "2031-02-01"),
+            ("mit_other", "other", "2031-03-01"),
+            ("mit_other_2", "other", "2031-03-15"),
+        ]
+        assert parsed[2]['name'] == "Final deadline: 2031-03-01 or 2031-03-15"
+
+    def test_parse_deadline_html_date_formats(self):
+        """Numeric, ISO and month-name dates are recognised; bad ones skipped."""
+        from agents.specialists.deadline_sentinel import _parse_deadline_html
+
+        html = (
+            "<p>Scholarship essays due January 15th, 2031.</p>"
+            "<p>Verification documents: 3/1/31 (not 13/45/2031)</p>"
+            "<p>Appeals close Sept. 30 2031 and 2031-6-5</p>"
+        )
+        parsed = _parse_deadline_html(html, "yale")
+
+        assert [(p['type'], p['due_date']) for p in parsed] == [
+            ("scholarship", "2031-01-15"),
+            ("verification", "2031-03-01"),
+            ("appeal", "2031-09-30"),
+            ("appeal", "2031-06-05"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_scrape_adds_deadlines_parsed_from_page(self, monkeypatch):
+        """Fetched pages are parsed, in a process pool when they are large."""
+        from agents.specialists import deadline_sentinel
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        url = "https://sfs.mit.edu/"
+        page = MagicMock(status_code=200, text="<p>Priority deadline 2031-02-01</p>", headers={})
+        http_client = AsyncMock()
+        http_client.get.return_value = page
+
+        monkeypatch.setattr(deadline_sentinel, "PARSE_IN_POOL_MIN_CHARS", 0)
+        sentinel = DeadlineSentinelAgent(http_client=http_client)
+        await sentinel.start()
+
+        result = await sentinel._scrape_school("mit", url, [])
+        assert result.new_deadlines == 1
+        entry = sentinel._deadlines["mit_school_priority"]
+        assert entry.due_date == date(2031, 2, 1)
+        assert entry.source_url == url
+        assert sentinel._parse_pool is not None
+
+        await sentinel.stop()
+        assert sentinel._parse_pool is None
+
+    @pytest.mark.asyncio
+    async def test_scrape_cycle_skips_recent_portals(self):
+        """Portals scraped within the interval are skipped unless forced."""
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, SCHOOL_PORTAL_PATTERNS,
+        )
+
+        broken = MagicMock()
+        broken.raise_for_status.side_effect = RuntimeError("503")
+        http_client = AsyncMock()
+        http_client.get.side_effect = lambda url, headers, timeout: (
+            broken if "mit" in url else MagicMock(text="", headers={})
+        )
+
+        sentinel = DeadlineSentinelAgent(http_client=http_client)
+        await sentinel.start()
+
+        first = await sentinel.run_scrape_cycle()
+        assert len(first) == len(SCHOOL_PORTAL_PATTERNS)
+
+        # Only the failed portal is retried
+        second = await sentinel.run_scrape_cycle()
+        assert [r.source_url for r in second] == [SCHOOL_PORTAL_PATTERNS["mit"]]
+
+        sentinel._last_scrape_per_url = {
+            url: when - timedelta(hours=sentinel._scrape_interval_hours)
+            for url, when in sentinel._last_scrape_per_url.items()
+        }
+        third = await sentinel.run_scrape_cycle()
+        assert len(third) == len(SCHOOL_PORTAL_PATTERNS)
+
+        forced = await sentinel.run_scrape_cycle(force=True)
+        assert len(forced) == len(SCHOOL_PORTAL_PATTERNS)
+
+    @pytest.mark.asyncio
+    async def test_scrape_history_is_bounded(self, monkeypatch):
+        """Only the most recent scrape results are kept."""
+        from agents.specialists import deadline_sentinel
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, SCHOOL_PORTAL_PATTERNS,
+        )
+
+        monkeypatch.setattr(deadline_sentinel, "SCRAPE_HISTORY_SIZE", 7)
+        sentinel = DeadlineSentinelAgent()
+        await sentinel.start()
+        for _ in range(3):
+            await sentinel.run_scrape_cycle(force=True)
+
+        assert len(SCHOOL_PORTAL_PATTERNS) * 3 > 7
+        assert sentinel.get_stats()["scrape_count"] == 7
+
+    @pytest.mark.asyncio
+    async def test_scrape_skips_unchanged_pages(self):
+        """Unmodified portals are detected by 304 or by an identical body."""
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        url = "https://finaid.example.edu/"
+        first = MagicMock(status_code=200, text="<p>Due March 1</p>")
+        first.headers = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2029 00:00:00 GMT"}
+        not_modified = MagicMock(status_code=304)
+        same_body = MagicMock(status_code=200, text="<p>Due March 1</p>", headers={})
+        new_body = MagicMock(status_code=200, text="<p>Due March 15</p>", headers={})
+
+        http_client = AsyncMock()
+        http_client.get.side_effect = [first, not_modified, same_body, new_body]
+        sentinel = DeadlineSentinelAgent(http_client=http_client)
+
+        result = await sentinel._scrape_school("mit", url, [])
+        assert result.unchanged is False
+        assert http_client.get.call_args.kwargs["headers"] == {}
+
+        result = await sentinel._scrape_school("mit", url, [])
+        assert result.unchanged is True
+        assert result.success is True
+        assert http_client.get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2029 00:00:00 GMT",
+        }
+        not_modified.raise_for_status.assert_not_called()
+
+        assert (await sentinel._scrape_school("mit", url, [])).unchanged is True
+        assert (await sentinel._scrape_school("mit", url, [])).unchanged is False
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_still_stores_discovered_deadlines(self):
+        """An unchanged portal skips parsing, not FalkorDB discoveries."""
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, DeadlineEntry, DeadlineType,
+        )
+
+        url = "https://finaid.example.edu/"
+        first = MagicMock(status_code=200, text="<p>Welcome</p>", headers={"ETag": '"v1"'})
+        http_client = AsyncMock()
+        http_client.get.side_effect = [first, MagicMock(status_code=304)]
+        sentinel = DeadlineSentinelAgent(http_client=http_client)
+        await sentinel._scrape_school("mit", url, [])
+
+        added = DeadlineEntry(
+            id="mit_new_commons_deadline",
+            deadline_type=DeadlineType.SCHOOL_PRIORITY,
+            name="New commons deadline",
+            due_date=date.today() + timedelta(days=30),
+            school_id="mit",
+        )
+        result = await sentinel._scrape_school("mit", url, [added])
+
+        assert result.unchanged is True
+        assert result.new_deadlines == 1
+        assert "mit_new_commons_deadline" in sentinel._deadlines
+
+    @pytest.mark.asyncio
+    async def test_validators_saved_only_after_successful_scrape(self, monkeypatch):
+        """A failed scrape does not send validators that would earn a 304."""
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        url = "https://sfs.mit.edu/"
+
+        def page():
+            return MagicMock(
+                status_code=200,
+                text="<p>Priority deadline 2031-02-01</p>",
+                headers={"ETag": '"v1"'},
+            )
+
+        http_client = AsyncMock()
+        http_client.get.side_effect = [page(), page()]
+        sentinel = DeadlineSentinelAgent(http_client=http_client)
+        monkeypatch.setattr(
+            sentinel, "_parse_page", AsyncMock(side_effect=RuntimeError("parse failed"))
+        )
+
+        assert (await sentinel._scrape_school("mit", url, [])).success is False
+        assert url not in sentinel._etag_cache
+
+        monkeypatch.undo()
+        result = await sentinel._scrape_school("mit", url, [])
+        assert http_client.get.call_args.kwargs["headers"] == {}
+        assert result.new_deadlines == 1
+        assert sentinel._etag_cache[url][0] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_verify_deadline_is_cached(self, monkeypatch):
+        """Repeat verifications reuse the result until forced, expired or replaced."""
+        from agents.specialists import deadline_sentinel
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        clock = [1000.0]
+        monkeypatch.setattr(deadline_sentinel.time, "monotonic", lambda: clock[0])
+
+        sentinel = DeadlineSentinelAgent()
+        deadline_id = next(iter(sentinel._deadlines))
+
+        first = await sentinel.verify_deadline(deadline_id)
+        first["verified"] = False  # callers get copies
+        second = await sentinel.verify_deadline(deadline_id)
+        assert second["verified"] is True
+        assert second["last_verified"] == first["last_verified"]
+
+        forced = await sentinel.verify_deadline(deadline_id, force=True)
+        assert forced["last_verified"] >= first["last_verified"]
+        assert sentinel._verify_cache[deadline_id][1]["last_verified"] == forced["last_verified"]
+
+        clock[0] += deadline_sentinel.VERIFY_CACHE_TTL_SECONDS
+        before = sentinel._verify_cache[deadline_id]
+        await sentinel.verify_deadline(deadline_id)
+        assert sentinel._verify_cache[deadline_id] is not before
+
+        await sentinel.add_deadline(sentinel._deadlines[deadline_id])
+        assert deadline_id not in sentinel._verify_cache
+
+    def test_verify_cache_trims_oldest(self, monkeypatch):
+        """The verification cache drops its oldest tenth when it overflows."""
+        from agents.specialists import deadline_sentinel
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        monkeypatch.setattr(deadline_sentinel, "VERIFY_CACHE_SIZE", 20)
+        sentinel = DeadlineSentinelAgent()
+        for i in range(21):
+            sentinel._cache_verification(f"d{i}", {})
+
+        assert len(sentinel._verify_cache) == 19
+        assert "d0" not in sentinel._verify_cache
+        assert "d1" not in sentinel._verify_cache
+        assert "d20" in sentinel._verify_cache
+
+    @pytest.mark.asyncio
+    async def test_scrape_ignores_markup_only_changes(self):
+        """Pages whose visible paragraphs are unchanged count as unchanged."""
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        def page(html):
+            return MagicMock(status_code=200, text=html, headers={})
+
+        http_client = AsyncMock()
+        http_client.get.side_effect = [
+            page("<p>Priority deadline 2031-02-01</p><p>Contact us</p>"),
+            page('<div class="x">Priority   deadline 2031-02-01</div>\n'
+                 '<script>track()</script><p>Contact us</p>'),
+            page("<p>Priority deadline 2031-02-15</p><p>Contact us</p>"),
+        ]
+        sentinel = DeadlineSentinelAgent(http_client=http_client)
+        url = "https://sfs.mit.edu/"
+
+        assert (await sentinel._scrape_school("mit", url, [])).new_deadlines == 1
+        assert (await sentinel._scrape_school("mit", url, [])).unchanged is True
+
+        result = await sentinel._scrape_school("mit", url, [])
+        assert result.updated_deadlines == 1
+        assert sentinel._deadlines["mit_school_priority"].due_date == date(2031, 2, 15)
+        assert len(sentinel._etag_cache[url][2]) == 2
+
+    @pytest.mark.asyncio
+    async def test_identical_body_after_failed_parse_is_reparsed(self, monkeypatch):
+        """A failed parse does not leave a fingerprint that hides the page."""
+        from agents.specialists import deadline_sentinel
+        from agents.specialists.deadline_sentinel import DeadlineSentinelAgent
+
+        html = "<p>Priority deadline 2031-02-01</p><p>Contact us</p>"
+        http_client = AsyncMock()
+        http_client.get.side_effect = [
+            MagicMock(status_code=200, text=html, headers={}),
+            MagicMock(status_code=200, text=html, headers={}),
+        ]
+        sentinel = DeadlineSentinelAgent(http_client=http_client)
+        url = "https://sfs.mit.edu/"
+
+        def broken_parse(paragraphs, school_id):
+            raise ValueError("bad page")
+
+        with monkeypatch.context() as patched:
+            patched.setattr(deadline_sentinel, "_parse_deadline_paragraphs", broken_parse)
+            assert (await sentinel._scrape_school("mit", url, [])).success is False
+
+        result = await sentinel._scrape_school("mit", url, [])
+        assert result.unchanged is False
+        assert result.new_deadlines == 1
+        assert sentinel._deadlines["mit_school_priority"].due_date == date(2031, 2, 1)
+
     @pytest.mark.asyncio
     async def test_add_deadline(self):
         """Test adding a deadline."""
@@ -686,6 +1708,64 @@ class TestDeadlineSentinelAgent:
 
         assert any(d.id == "urgent_test" for d in deadlines)
 
+    @pytest.mark.asyncio
+    async def test_deadline_indexes(self):
+        """Queries use the date, school and type indexes and stay sorted."""
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, DeadlineEntry, DeadlineType
+        )
+
+        sentinel = DeadlineSentinelAgent()
+        sentinel._deadlines.clear()
+        sentinel._by_date.clear()
+        sentinel._by_school.clear()
+        sentinel._by_type.clear()
+
+        today = date.today()
+        for deadline_id, days, school, deadline_type in [
+            ("a", 20, "mit", DeadlineType.SCHOOL_PRIORITY),
+            ("b", 3, "mit", DeadlineType.SCHOLARSHIP),
+            ("c", -2, "mit", DeadlineType.SCHOOL_PRIORITY),
+            ("d", 10, "yale", DeadlineType.SCHOOL_PRIORITY),
+            ("e", 45, None, DeadlineType.FAFSA),
+        ]:
+            await sentinel.add_deadline(DeadlineEntry(
+                id=deadline_id,
+                deadline_type=deadline_type,
+                name=deadline_id,
+                due_date=today + timedelta(days=days),
+                school_id=school,
+            ))
+
+        assert [d.id for d in await sentinel.get_deadlines()] == ["b", "d", "a", "e"]
+        assert [d.id for d in await sentinel.get_deadlines(include_past=True, limit=2)] == ["c", "b"]
+        assert [d.id for d in await sentinel.get_deadlines(school_id="mit")] == ["b", "a"]
+        assert [d.id for d in await sentinel.get_deadlines(
+            school_id="mit", deadline_type=DeadlineType.SCHOOL_PRIORITY, include_past=True,
+        )] == ["c", "a"]
+        assert await sentinel.get_deadlines(school_id="harvard") == []
+        assert [d.id for d in await sentinel.get_upcoming_deadlines(days_ahead=20)] == ["b", "d", "a"]
+        assert [d.id for d in await sentinel.get_urgent_deadlines()] == ["b"]
+
+        # Replacing a deadline moves it in the indexes
+        await sentinel.add_deadline(DeadlineEntry(
+            id="a",
+            deadline_type=DeadlineType.SCHOLARSHIP,
+            name="a",
+            due_date=today + timedelta(days=1),
+            school_id="yale",
+        ))
+        assert [d.id for d in await sentinel.get_deadlines(school_id="yale")] == ["a", "d"]
+        assert [d.id for d in await sentinel.get_urgent_deadlines()] == ["a", "b"]
+        assert len(sentinel._by_date) == len(sentinel._deadlines) == 5
+
+        stats = sentinel.get_stats()
+        assert stats['total_deadlines'] == 5
+        assert stats['past_deadlines'] == 1
+        assert stats['upcoming_deadlines'] == 4
+        assert stats['urgent_deadlines'] == 2
+        assert stats['by_type'] == {'scholarship': 2, 'school_priority': 2, 'fafsa': 1}
+
     @pytest.mark.asyncio
     async def test_subscribe_student(self):
         """Test subscribing student to deadline."""
@@ -771,10 +1851,47 @@ class TestDeadlineSentinelAgent:
             notified=False,
         ))
 
-        changes = sentinel.get_changes(unnotified_only=True)
+        changes = sentinel.get_changes(unnotified_only=True)
+
+        assert len(changes) == 1
+        assert changes[0].deadline_id == "unnotified_change"
+
+    def test_get_changes_since(self):
+        """Changes before `since` are excluded, newest scanned first."""
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, DeadlineChange
+        )
+
+        sentinel = DeadlineSentinelAgent()
+        start = datetime(2025, 1, 1)
+        for day in range(5):
+            sentinel._changes.append(DeadlineChange(
+                deadline_id=f"change_{day}",
+                change_type="new",
+                detected_at=start + timedelta(days=day),
+                notified=day == 3,
+            ))
+
+        changes = sentinel.get_changes(since=start + timedelta(days=2))
+        assert [c.deadline_id for c in changes] == ["change_2", "change_3", "change_4"]
+
+        changes = sentinel.get_changes(since=start + timedelta(days=2), unnotified_only=True)
+        assert [c.deadline_id for c in changes] == ["change_2", "change_4"]
+
+    def test_change_history_is_bounded(self, monkeypatch):
+        """Only the most recent changes are kept."""
+        from agents.specialists import deadline_sentinel
+        from agents.specialists.deadline_sentinel import (
+            DeadlineSentinelAgent, DeadlineChange
+        )
+
+        monkeypatch.setattr(deadline_sentinel, 'CHANGE_HISTORY_SIZE', 2)
+        sentinel = DeadlineSentinelAgent()
+
+        for i in range(3):
+            sentinel._changes.append(DeadlineChange(deadline_id=f"c{i}", change_type="new"))
 
-        assert len(changes) == 1
-        assert changes[0].deadline_id == "unnotified_change"
+        assert [c.deadline_id for c in sentinel.get_changes()] == ["c1", "c2"]
 
     def test_mark_changes_notified(self):
         """AC: Alerts students of changes (can mark as notified)."""
@@ -947,7 +2064,7 @@ class TestDocumentAnalystAgent:
         from agents.specialists.document_analyst import DocumentAnalystAgent
 
         analyst = DocumentAnalystAgent()
-        assert analyst._analysis_history == []
+        assert len(analyst._analysis_history) == 0
 
     def test_analyst_model_name(self):
         """Test analyst uses correct model."""
@@ -1230,6 +2347,244 @@ class TestDocumentAnalystAgent:
         # History should be bounded
         assert len(analyst._analysis_history) <= 50
 
+    @pytest.mark.asyncio
+    async def test_analysis_history_keeps_most_recent(self):
+        """Oldest analyses are evicted first once history is full."""
+        from agents.specialists.document_analyst import (
+            ANALYSIS_HISTORY_SIZE,
+            DocumentAnalystAgent,
+        )
+
+        analyst = DocumentAnalystAgent()
+        results = [
+            await analyst.analyze_document(f"Simple content {i}", filename="test.pdf")
+            for i in range(ANALYSIS_HISTORY_SIZE + 5)
+        ]
+
+        assert list(analyst._analysis_history) == results[-ANALYSIS_HISTORY_SIZE:]
+
+
+    @pytest.mark.asyncio
+    async def test_award_labels_found_in_one_scan(self):
+        """Overlapping labels each map to the first amount after them."""
+        from agents.specialists.document_analyst import DocumentAnalystAgent
+
+        analyst = DocumentAnalystAgent()
+        content = (
+            "Federal Pell Grant: $7,395\n"
+            "Direct Unsubsidized Loan: $2,000\n"
+            + "x" * 120 + "\nTuition (see below)\n" + "y" * 120 + " $1"
+        )
+        money = analyst._extract_money_values(content)
+        label_values = analyst._find_label_values(content, money)
+
+        assert label_values["federal pell"] == 7395
+        assert label_values["pell grant"] == 7395
+        assert label_values["direct unsubsidized"] == 2000
+        assert label_values["unsubsidized loan"] == 2000
+        # "subsidized loan" occurs inside "unsubsidized loan"
+        assert label_values["subsidized loan"] == 2000
+        assert "tuition" not in label_values
+
+        assert analyst._extract_grants(label_values) == {"pell": 7395}
+
+    def test_course_pattern_handles_long_whitespace_runs(self):
+        """Course extraction stays correct on pathological spacing."""
+        from agents.specialists.document_analyst import DocumentAnalystAgent
+
+        analyst = DocumentAnalystAgent()
+
+        assert analyst._extract_courses("AB" + " " * 50000 + "1") == []
+        courses = analyst._extract_courses(self.SAMPLE_TRANSCRIPT)
+        assert [(c['subject'], c['number']) for c in courses[:3]] == [
+            ("MATH", "101"), ("CS", "101"), ("ENGL", "101"),
+        ]
+
+    def test_detect_document_type_priority(self):
+        """Award keywords win wherever they appear, then transcript, then SAR."""
+        from agents.specialists.document_analyst import DocumentAnalystAgent, DocumentType
+
+        analyst = DocumentAnalystAgent()
+        detect = lambda text: analyst._detect_document_type(text, None)
+
+        assert detect("Course grade report ... NET COST: $1") == DocumentType.AWARD_LETTER
+        assert detect("Your EFC is listed; see course catalog") == DocumentType.TRANSCRIPT
+        assert detect("Student Aid Report") == DocumentType.SAR
+        assert detect("Hello") == DocumentType.OTHER
+
+    def test_money_values_are_parallel_arrays(self):
+        """Money values come back as position-ordered parallel arrays."""
+        from array import array
+        from agents.specialists.document_analyst import DocumentAnalystAgent
+
+        analyst = DocumentAnalystAgent()
+        positions, values = analyst._extract_money_values("a $1,200 b $, c $3.50")
+
+        assert positions == array('q', [2, 16])
+        assert values == array('d', [1200.0, 3.5])
+
+    @pytest.mark.asyncio
+    async def test_compare_uses_calculated_loan_totals(self):
+        """Loan totals are computed with the other totals and reused."""
+        from agents.specialists.document_analyst import (
+            DocumentAnalystAgent, DocumentAnalysisResult, DocumentType,
+            AnalysisStatus, CompletionStatus, AwardLetterData,
+        )
+
+        def letter(school, loans):
+            data = AwardLetterData(school_name=school, loans=loans)
+            data.calculate_totals()
+            return DocumentAnalysisResult(
+                document_type=DocumentType.AWARD_LETTER,
+                status=AnalysisStatus.COMPLETED,
+                completeness=CompletionStatus.COMPLETE,
+                data=data,
+            )
+
+        a, b = letter("A", {'plus': 9000.0}), letter("B", {'subsidized': 3500.0, 'perkins': 500.0})
+        assert b.data.total_loans == 4000.0
+
+        comparison = await DocumentAnalystAgent().compare_award_letters([a, b])
+        assert [s["total_loans"] for s in comparison["schools"]] == [9000.0, 4000.0]
+        assert comparison["lowest_loans"] == "B"
+
+    def test_school_name_search_is_linear(self):
+        """School name extraction stays fast on long letters with no school."""
+        import time
+        from agents.specialists.document_analyst import DocumentAnalystAgent
+
+        analyst = DocumentAnalystAgent()
+        filler = "your award package includes tuition grant and loan aid " * 600
+
+        start = time.perf_counter()
+        assert analyst._extract_school_name(filler) is None
+        assert time.perf_counter() - start < 1.0
+
+        assert analyst._extract_school_name("Hi. " + filler + "at Stanford University.") == (
+            filler + "at Stanford University"
+        )
+
+    @pytest.mark.asyncio
+    async def test_compare_rankings_keep_first_on_ties(self):
+        """Single-pass comparison ranks like a stable sort would."""
+        from agents.specialists.document_analyst import (
+            DocumentAnalystAgent, DocumentAnalysisResult, DocumentType,
+            AnalysisStatus, CompletionStatus, AwardLetterData,
+        )
+
+        def letter(school, net_cost, gift, loans):
+            data = AwardLetterData(
+                school_name=school, net_cost=net_cost,
+                total_gift_aid=gift, total_loans=loans,
+            )
+            return DocumentAnalysisResult(
+                document_type=DocumentType.AWARD_LETTER,
+                status=AnalysisStatus.COMPLETED,
+                completeness=CompletionStatus.COMPLETE,
+                data=data,
+            )
+
+        letters = [
+            letter("A", None, 5000.0, 4000.0),
+            letter("B", 20000.0, 9000.0, 4000.0),
+            letter("C", 20000.0, 9000.0, 6000.0),
+        ]
+        comparison = await DocumentAnalystAgent().compare_award_letters(letters)
+
+        assert comparison["lowest_net_cost"] == "B"
+        assert comparison["highest_gift_aid"] == "B"
+        assert comparison["lowest_loans"] == "A"
+
+    def test_money_values_skip_bare_commas(self):
+        """Money amounts parse from the digit group; bare '$,' is ignored."""
+        from array import array
+        from agents.specialists.document_analyst import DocumentAnalystAgent
+
+        positions, values = DocumentAnalystAgent()._extract_money_values("$, then $12,345.67")
+
+        assert positions == array('q', [8])
+        assert values == array('d', [12345.67])
+
+    def test_analyzers_run_synchronously(self):
+        """Per-type analyzers return results directly, without a coroutine."""
+        from agents.specialists.document_analyst import (
+            DocumentAnalystAgent, DocumentAnalysisResult, DocumentType,
+        )
+
+        analyst = DocumentAnalystAgent()
+        result = analyst._analyze_award_letter("Stanford University\nTuition: $50,000")
+
+        assert isinstance(result, DocumentAnalysisResult)
+        assert result.document_type == DocumentType.AWARD_LETTER
+
+    def test_generic_analysis_counts_money_and_dates(self):
+        """Generic analysis reports how many amounts and dates it saw."""
+        from agents.specialists.document_analyst import DocumentAnalystAgent, DocumentType
+
+        result = DocumentAnalystAgent()._analyze_generic(
+            "Paid $1,200 and $, on 01/15/2024, then $300 on March 3, 2024.",
+            DocumentType.OTHER,
+        )
+        fields = {f.name: f.value for f in result.extracted_fields}
+
+        assert fields == {'monetary_values': "2 values found", 'dates': "2 dates found"}
+
+    def test_result_dataclasses_use_slots(self):
+        """Fields and results are slotted; they carry no per-instance dict."""
+        from agents.specialists.document_analyst import (
+            DocumentAnalysisResult, DocumentType, AnalysisStatus,
+            CompletionStatus, ExtractedField,
+        )
+
+        field = ExtractedField(name='tuition', value=1.0, confidence=0.8)
+        result = DocumentAnalysisResult(
+            document_type=DocumentType.OTHER,
+            status=AnalysisStatus.COMPLETED,
+            completeness=CompletionStatus.INCOMPLETE,
+            extracted_fields=[field],
+        )
+
+        assert not hasattr(field, '__dict__')
+        assert not hasattr(result, '__dict__')
+
+    def test_conditions_keep_pattern_order_and_limit(self):
+        """Conditions list each pattern's matches in turn, up to the limit."""
+        from agents.specialists.document_analyst import DocumentAnalystAgent, MAX_CONDITIONS
+
+        analyst = DocumentAnalystAgent()
+        content = (
+            "Full-time enrollment required. You must maintain a 3.0 GPA. "
+            "Students are required to: submit forms."
+        )
+
+        assert analyst._extract_conditions(content) == [
+            "maintain a 3",
+            "submit forms",
+            "3.0",
+            "Full-time enrollment required",
+        ]
+        assert len(analyst._extract_conditions("must attend. " * 20)) == MAX_CONDITIONS
+
+    @pytest.mark.asyncio
+    async def test_analyze_documents_batch(self):
+        """Batch analysis returns results in order and records history."""
+        from agents.specialists.document_analyst import DocumentAnalystAgent, DocumentType
+
+        analyst = DocumentAnalystAgent()
+        results = await analyst.analyze_documents([
+            ("Cost of Attendance: $60,000\nFederal Pell Grant: $7,395", None, None),
+            ("Official Transcript\nCumulative GPA: 3.5", None, None),
+            ("Anything at all", DocumentType.SAR, None),
+            ("Notes", None, "aid_letter.pdf"),
+        ])
+
+        assert [r.document_type for r in results] == [
+            DocumentType.AWARD_LETTER,
+            DocumentType.TRANSCRIPT,
+            DocumentType.SAR,
+            DocumentType.AWARD_LETTER,
+        ]
+        assert list(analyst._analysis_history) == results
 
 # ============================================================================
 # A2A Protocol Tests
@@ -1252,6 +2607,16 @@ class TestA2AProtocol:
         assert A2AStatus.COMPLETED.value == "completed"
         assert A2AStatus.FAILED.value == "failed"
 
+    def test_enum_value_maps(self):
+        """Test wire values map straight to enum members."""
+        from agents.specialists.a2a_protocol import (
+            A2AAction, A2AStatus, ACTION_BY_VALUE, STATUS_BY_VALUE
+        )
+
+        assert ACTION_BY_VALUE["draft_appeal"] is A2AAction.DRAFT_APPEAL
+        assert STATUS_BY_VALUE["failed"] is A2AStatus.FAILED
+        assert len(ACTION_BY_VALUE) == len(A2AAction)
+
     def test_a2a_request_creation(self):
         """Test A2ARequest creation."""
         from agents.specialists.a2a_protocol import A2ARequest, A2AAction
@@ -1266,6 +2631,7 @@ class TestA2AProtocol:
         assert request.source_agent == "ambassador"
         assert request.target_agent == "scholarship_scout"
         assert request.params['query'] == 'STEM'
+        assert len(request.id) == 32 and "-" not in request.id
 
     def test_a2a_response_success(self):
         """Test A2AResponse success creation."""
@@ -1292,6 +2658,41 @@ class TestA2AProtocol:
         assert response.status == A2AStatus.FAILED
         assert response.error == "Agent not found"
 
+    def test_a2a_messages_round_trip_through_json(self):
+        """Test requests/responses survive encoding for transport."""
+        from agents.specialists.a2a_protocol import (
+            A2AResponse, create_scholarship_search_request,
+            encode_message, decode_request, decode_response,
+        )
+
+        request = create_scholarship_search_request("ambassador", "STEM", limit=5)
+        decoded = decode_request(encode_message(request))
+
+        assert decoded.id == request.id
+        assert decoded.action is request.action
+        assert decoded.params == {'query': 'STEM', 'profile_id': None, 'limit': 5}
+        assert decoded.created_at == request.created_at
+
+        response = A2AResponse.success(request.id, {'scholarships': []}, 12.5)
+        assert decode_response(encode_message(response)) == response
+
+        failure = A2AResponse.failure(request.id, "Agent not found")
+        assert decode_response(encode_message(failure)) == failure
+
+    def test_a2a_messages_are_slotted_and_immutable(self):
+        """Test requests/responses carry no instance dict and cannot be mutated."""
+        import dataclasses
+        from agents.specialists.a2a_protocol import A2ARequest, A2AResponse, A2AAction
+
+        request = A2ARequest.create("ambassador", "scholarship_scout", A2AAction.HEALTH_CHECK)
+        response = A2AResponse.failure(request.id, "Agent not found")
+
+        for message in (request, response):
+            assert not hasattr(message, "__dict__")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            request.target_agent = "appeal_strategist"
+
     def test_protocol_initialization(self):
         """Test protocol initialization."""
         from agents.specialists.a2a_protocol import A2AProtocol
@@ -1422,6 +2823,434 @@ class TestA2AProtocol:
         assert response.status == A2AStatus.FAILED
         assert "not registered" in response.error
 
+    @pytest.mark.asyncio
+    async def test_send_requests_fans_out_in_order(self):
+        """Test several requests run concurrently and return in input order."""
+        import asyncio
+        from agents.specialists.a2a_protocol import A2AProtocol, A2ARequest, A2AAction, A2AStatus
+
+        protocol = A2AProtocol()
+        in_flight = 0
+        peak = 0
+
+        class SlowAgent:
+            def __init__(self, delay):
+                self.delay = delay
+
+            def get_stats(self):
+                return {'delay': self.delay}
+
+        original_route = protocol._route_request
+
+        async def slow_route(agent, request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(agent.delay)
+            in_flight -= 1
+            return await original_route(agent, request)
+
+        protocol._route_request = slow_route
+        protocol.register_agent("slow", SlowAgent(0.02))
+        protocol.register_agent("fast", SlowAgent(0.0))
+
+        requests = [
+            A2ARequest.create("ambassador", "slow", A2AAction.GET_SCOUT_STATS),
+            A2ARequest.create("ambassador", "fast", A2AAction.GET_SCOUT_STATS),
+            A2ARequest.create("ambassador", "missing", A2AAction.HEALTH_CHECK),
+        ]
+
+        responses = await protocol.send_requests(requests)
+
+        assert [r.request_id for r in responses] == [r.id for r in requests]
+        assert responses[0].data == {'delay': 0.02}
+        assert responses[2].status == A2AStatus.FAILED
+        assert peak == 2
+
+        streamed = [r async for r in protocol.stream_requests(requests[:2])]
+        assert [r.data['delay'] for r in streamed] == [0.0, 0.02]
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_requests_are_cached(self):
+        """Test identical idempotent requests are served from the cache."""
+        from agents.specialists.a2a_protocol import A2AProtocol, A2ARequest, A2AAction, A2AStatus
+
+        protocol = A2AProtocol()
+        scout = AsyncMock()
+        scout.get_matches_for_profile.return_value = [
+            MagicMock(scholarship_id="s1", match_score=0.9, match_reasons=["STEM"]),
+        ]
+        strategist = AsyncMock()
+        strategist.get_strategies.return_value = [{'id': 'competing_offer'}]
+        strategist.draft_appeal.return_value = "Dear Financial Aid Office"
+        protocol.register_agent("scholarship_scout", scout)
+        protocol.register_agent("appeal_strategist", strategist)
+
+        def matches_request(profile_id):
+            return A2ARequest.create(
+                source="ambassador",
+                target="scholarship_scout",
+                action=A2AAction.GET_MATCHES,
+                params={'profile_id': profile_id},
+            )
+
+        first = await protocol.send_request(matches_request('p1'))
+        second = await protocol.send_request(matches_request('p1'))
+        await protocol.send_request(matches_request('p2'))
+
+        assert second.status == A2AStatus.COMPLETED
+        assert second.request_id != first.request_id
+        assert second.data == first.data
+        assert scout.get_matches_for_profile.await_count == 2
+        assert protocol.get_stats()['cache_hits'] == 1
+
+        # Strategist reads rely on the strategist's own commons-aware caches
+        for _ in range(2):
+            await protocol.send_request(A2ARequest.create(
+                source="ambassador",
+                target="appeal_strategist",
+                action=A2AAction.GET_STRATEGIES,
+                params={'school_id': 'stanford', 'context': {}},
+            ))
+        assert strategist.get_strategies.await_count == 2
+
+        # Non-idempotent actions always reach the specialist
+        for _ in range(2):
+            await protocol.send_request(A2ARequest.create(
+                source="ambassador",
+                target="appeal_strategist",
+                action=A2AAction.DRAFT_APPEAL,
+                params={'school_id': 'stanford'},
+            ))
+        assert strategist.draft_appeal.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_responses_are_isolated_copies(self):
+        """Mutating a returned response never corrupts later cache hits."""
+        from agents.specialists.a2a_protocol import A2AProtocol, A2ARequest, A2AAction
+
+        protocol = A2AProtocol()
+        scout = AsyncMock()
+        scout.get_matches_for_profile.return_value = [
+            MagicMock(scholarship_id="s1", match_score=0.9, match_reasons=["STEM"]),
+        ]
+        protocol.register_agent("scholarship_scout", scout)
+
+        def request():
+            return A2ARequest.create(
+                source="ambassador",
+                target="scholarship_scout",
+                action=A2AAction.GET_MATCHES,
+                params={'profile_id': 'p1'},
+            )
+
+        first = await protocol.send_request(request())
+        first.data['matches'].append({'scholarship_id': 'injected'})
+        first.data['matches'][0]['reasons'].append('changed')
+
+        second = await protocol.send_request(request())
+        second.data['matches'].clear()
+
+        third = await protocol.send_request(request())
+        assert third.data['matches'] == [
+            {'scholarship_id': 's1', 'match_score': 0.9, 'reasons': ['STEM']},
+        ]
+        assert scout.get_matches_for_profile.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_state_changing_actions_invalidate_agent_cache(self):
+        """Writes drop the target agent's cached reads, and only theirs."""
+        from agents.specialists.a2a_protocol import A2AProtocol, A2ARequest, A2AAction
+
+        protocol = A2AProtocol()
+        sentinel = AsyncMock()
+        sentinel.get_deadlines.return_value = []
+        sentinel.scrape_deadline.return_value = MagicMock(
+            source_url="u", deadlines_found=1, new_deadlines=1, success=True,
+        )
+        scout = AsyncMock()
+        scout.get_matches_for_profile.return_value = []
+        protocol.register_agent("deadline_sentinel", sentinel)
+        protocol.register_agent("scholarship_scout", scout)
+
+        async def send(target, action, **params):
+            return await protocol.send_request(A2ARequest.create(
+                source="ambassador", target=target, action=action, params=params,
+            ))
+
+        for _ in range(2):
+            await send("deadline_sentinel", A2AAction.GET_DEADLINES, school_id="mit")
+            await send("scholarship_scout", A2AAction.GET_MATCHES, profile_id="p1")
+        assert sentinel.get_deadlines.await_count == 1
+
+        await send("deadline_sentinel", A2AAction.SCRAPE_DEADLINE, url="u", school_id="mit")
+        await send("deadline_sentinel", A2AAction.GET_DEADLINES, school_id="mit")
+        await send("scholarship_scout", A2AAction.GET_MATCHES, profile_id="p1")
+
+        assert sentinel.get_deadlines.await_count == 2
+        assert scout.get_matches_for_profile.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_read_overlapping_a_write_is_not_cached(self):
+        """A read that started before a write finished is not cached."""
+        import asyncio
+        from agents.specialists.a2a_protocol import A2AProtocol, A2ARequest, A2AAction
+
+        protocol = A2AProtocol()
+        sentinel = AsyncMock()
+        release = asyncio.Event()
+
+        async def slow_read(**kwargs):
+            await release.wait()
+            return []
+
+        sentinel.get_deadlines.side_effect = slow_read
+        sentinel.verify_deadline.return_value = {'verified': True}
+        protocol.register_agent("deadline_sentinel", sentinel)
+
+        def request(action, **params):
+            return A2ARequest.create(
+                source="ambassador", target="deadline_sentinel", action=action, params=params,
+            )
+
+        read = asyncio.ensure_future(protocol.send_request(request(A2AAction.GET_DEADLINES)))
+        await asyncio.sleep(0)
+        await protocol.send_request(request(A2AAction.VERIFY_DEADLINE, deadline_id="d1"))
+        release.set()
+        await read
+
+        assert len(protocol._cache) == 0
+
+    def test_every_action_has_a_handler(self):
+        """Test the dispatch table covers every A2A action."""
+        from agents.specialists.a2a_protocol import A2AProtocol, A2AAction
+
+        assert set(A2AProtocol._HANDLERS) == set(A2AAction)
+
+    @pytest.mark.asyncio
+    async def test_health_check_fast_path(self):
+        """Test health checks of registered agents are answered directly."""
+        from agents.specialists.a2a_protocol import A2AProtocol, A2ARequest, A2AAction, A2AStatus
+
+        protocol = A2AProtocol()
+        protocol.register_agent("deadline_sentinel", object())
+
+        response = await protocol.send_request(A2ARequest.create(
+            source="ambassador",
+            target="deadline_sentinel",
+            action=A2AAction.HEALTH_CHECK,
+        ))
+
+        assert response.status == A2AStatus.COMPLETED
+        assert response.data['agent'] == "deadline_sentinel"
+        assert response.data['timestamp'].endswith("+00:00")
+
+        # Liveness probes bypass history and stats
+        assert protocol.get_request_history() == ()
+        assert protocol.get_stats()['total_requests'] == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_request_yields_scholarships(self):
+        """Test search results can be consumed one scholarship at a time."""
+        import dataclasses
+        from agents.specialists.a2a_protocol import A2AProtocol, A2AAction
+        from agents.specialists.a2a_protocol import create_scholarship_search_request
+        from agents.specialists.scholarship_scout import (
+            LegitimacyStatus, ScholarshipDiscovery
+        )
+
+        scout = AsyncMock()
+        scout.query_scholarships.return_value = [
+            ScholarshipDiscovery(
+                id=f"s{i}", name=f"Scholarship {i}", source_url="",
+                amount_min=0, amount_max=1000 * i, deadline=date(2026, 3, i),
+                criteria="", eligibility=[], how_to_apply="",
+                legitimacy=LegitimacyStatus.VERIFIED,
+            )
+            for i in (1, 2)
+        ]
+        protocol = A2AProtocol()
+        protocol.register_agent("scholarship_scout", scout)
+
+        request = create_scholarship_search_request("ambassador", "STEM")
+        rows = [row async for row in protocol.stream_request(request)]
+
+        assert [row['id'] for row in rows] == ["s1", "s2"]
+        assert rows[0]['deadline'] == "2026-03-01"
+        assert protocol.get_stats()['successful_requests'] == 1
+
+        matches_request = dataclasses.replace(request, action=A2AAction.GET_MATCHES)
+        with pytest.raises(ValueError):
+            await protocol.stream_request(matches_request).__anext__()
+
+        protocol.unregister_agent("scholarship_scout")
+        with pytest.raises(LookupError):
+            await protocol.stream_request(request).__anext__()
+
+    @pytest.mark.asyncio
+    async def test_stream_request_timeout_covers_slot_wait(self):
+        """Waiting for a busy agent's slot counts against the stream timeout."""
+        import asyncio
+        import dataclasses
+        from agents.specialists.a2a_protocol import A2AProtocol
+        from agents.specialists.a2a_protocol import create_scholarship_search_request
+
+        scout = AsyncMock()
+        scout.query_scholarships.return_value = []
+        protocol = A2AProtocol()
+        protocol.register_agent("scholarship_scout", scout)
+
+        request = dataclasses.replace(
+            create_scholarship_search_request("ambassador", "STEM"),
+            timeout_seconds=0.01,
+        )
+        slot = protocol._agent_slots["scholarship_scout"]
+        for _ in range(slot._value):
+            await slot.acquire()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await protocol.stream_request(request).__anext__()
+
+        stats = protocol.get_stats()
+        assert stats['failed_requests'] == 1
+        assert protocol._response_history[-1].error == "Timed out after 0.01s"
+        scout.query_scholarships.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_request_records_response_when_stopped_early(self):
+        """A consumer that stops iterating still leaves stats balanced."""
+        from agents.specialists.a2a_protocol import A2AProtocol
+        from agents.specialists.a2a_protocol import create_scholarship_search_request
+        from agents.specialists.scholarship_scout import (
+            LegitimacyStatus, ScholarshipDiscovery
+        )
+
+        scout = AsyncMock()
+        scout.query_scholarships.return_value = [
+            ScholarshipDiscovery(
+                id=f"s{i}", name=f"Scholarship {i}", source_url="",
+                amount_min=0, amount_max=1000, deadline=date(2026, 3, i),
+                criteria="", eligibility=[], how_to_apply="",
+                legitimacy=LegitimacyStatus.VERIFIED,
+            )
+            for i in (1, 2, 3)
+        ]
+        protocol = A2AProtocol()
+        protocol.register_agent("scholarship_scout", scout)
+
+        stream = protocol.stream_request(create_scholarship_search_request("ambassador", "STEM"))
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first['id'] == "s1"
+        stats = protocol.get_stats()
+        assert stats['total_requests'] == 1
+        assert stats['successful_requests'] == 1
+        assert protocol._response_history[-1].data == {'count': 1}
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_and_stats_keep_counting(self, monkeypatch):
+        """Test history keeps a fixed window while stats cover every request."""
+        from agents.specialists import a2a_protocol
+        from agents.specialists.a2a_protocol import A2AProtocol, A2ARequest, A2AAction
+
+        monkeypatch.setattr(a2a_protocol, 'HISTORY_SIZE', 3)
+        protocol = A2AProtocol()
+
+        requests = [
+            A2ARequest.create("ambassador", "missing", A2AAction.HEALTH_CHECK)
+            for _ in range(5)
+        ]
+        for request in requests:
+            await protocol.send_request(request)
+
+        assert protocol.get_request_history() == tuple(requests[2:])
+        assert protocol.get_request_history(limit=2) == tuple(requests[3:])
+        assert protocol.get_request_history(limit=0) == ()
+        assert list(protocol.get_request_history_iter(limit=2)) == requests[3:]
+
+        stats = protocol.get_stats()
+        assert stats['total_requests'] == 5
+        assert stats['failed_requests'] == 5
+        assert stats['success_rate'] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_request_times_out(self):
+        """Test a stuck specialist fails the request after timeout_seconds."""
+        import asyncio
+        import dataclasses
+        from agents.specialists.a2a_protocol import A2AProtocol, A2ARequest, A2AAction, A2AStatus
+
+        class StuckAgent:
+            async def analyze_school(self, school_id):
+                await asyncio.sleep(10)
+
+        protocol = A2AProtocol()
+        protocol.register_agent("appeal_strategist", StuckAgent())
+
+        request = dataclasses.replace(
+            A2ARequest.create("ambassador", "appeal_strategist", A2AAction.ANALYZE_SCHOOL),
+            timeout_seconds=0.01,
+        )
+        response = await protocol.send_request(request)
+
+        assert response.status == A2AStatus.FAILED
+        assert "Timed out" in response.error
+        assert protocol.get_stats()['failed_requests'] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped_per_agent(self, monkeypatch):
+        """Test requests to one agent wait for a free slot."""
+        import asyncio
+        from agents.specialists import a2a_protocol
+        from agents.specialists.a2a_protocol import A2AProtocol, A2ARequest, A2AAction
+
+        monkeypatch.setattr(a2a_protocol, 'MAX_CONCURRENT_PER_AGENT', 2)
+        in_flight = 0
+        peak = 0
+
+        class BusyAgent:
+            async def analyze_school(self, school_id):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return {'school_id': school_id}
+
+        protocol = A2AProtocol()
+        protocol.register_agent("appeal_strategist", BusyAgent())
+
+        await protocol.send_requests([
+            A2ARequest.create(
+                "ambassador", "appeal_strategist", A2AAction.ANALYZE_SCHOOL,
+                params={'school_id': f"school_{i}"},
+            )
+            for i in range(6)
+        ])
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_remote_agents_share_http_client(self):
+        """Test agents that opt in receive the protocol's HTTP client."""
+        from agents.specialists.a2a_protocol import A2AProtocol
+
+        http_client = AsyncMock()
+        protocol = A2AProtocol(http_client=http_client)
+
+        remote_a, remote_b = Mock(), Mock()
+        protocol.register_agent("remote_a", remote_a)
+        protocol.register_agent("remote_b", remote_b)
+        protocol.register_agent("local", object())
+
+        remote_a.bind_http_client.assert_called_once_with(http_client)
+        remote_b.bind_http_client.assert_called_once_with(http_client)
+
+        # An injected client belongs to the caller and is left open
+        await protocol.close()
+        http_client.aclose.assert_not_called()
+
     def test_get_stats(self):
         """Test getting protocol stats."""
         from agents.specialists.a2a_protocol import A2AProtocol
@@ -1485,6 +3314,50 @@ class TestConvenienceFunctions:
         assert request.target_agent == "appeal_strategist"
         assert request.action == A2AAction.DRAFT_APPEAL
 
+    def test_typed_params(self):
+        """Test typed params support attribute and dict-style access."""
+        from agents.specialists.a2a_protocol import (
+            create_scholarship_search_request, SearchParams
+        )
+
+        request = create_scholarship_search_request(source="ambassador", query="nursing")
+
+        assert isinstance(request.params, SearchParams)
+        assert request.params.query == "nursing"
+        assert request.params['limit'] == 10
+        assert request.params.get('missing', 'default') == 'default'
+        with pytest.raises(KeyError):
+            request.params['missing']
+
+        converted = SearchParams.from_params({'query': 'STEM', 'limit': 3})
+        assert converted == SearchParams(query='STEM', limit=3)
+        assert SearchParams.from_params(converted) is converted
+
+    @pytest.mark.asyncio
+    async def test_typed_and_dict_params_route_the_same(self):
+        """Test handlers accept typed params and legacy dict params alike."""
+        from agents.specialists.a2a_protocol import (
+            A2AProtocol, A2ARequest, A2AAction, create_draft_appeal_request
+        )
+
+        strategist = AsyncMock()
+        strategist.draft_appeal.return_value = "Dear Financial Aid Office"
+        protocol = A2AProtocol()
+        protocol.register_agent("appeal_strategist", strategist)
+
+        await protocol.send_request(create_draft_appeal_request(
+            source="ambassador", school_id="stanford", student_context={'gpa': 3.9},
+        ))
+        await protocol.send_request(A2ARequest.create(
+            source="ambassador",
+            target="appeal_strategist",
+            action=A2AAction.DRAFT_APPEAL,
+            params={'school_id': 'stanford', 'student_context': {'gpa': 3.9}},
+        ))
+
+        typed_call, dict_call = strategist.draft_appeal.await_args_list
+        assert typed_call == dict_call
+
 
 # ============================================================================
 # Module Tests